@@ -0,0 +1,78 @@
+import argparse
+import random
+
+from list_session import ListSession
+from list_batch import run_batch
+from list_backends import BACKENDS
+
+# Operation mixes: operation -> weight
+MIXES = {
+    "ends": {"append": 1, "pop": 1, "insert_start": 1, "pop_start": 1},
+    "middle": {"insert": 1, "pop_index": 1},
+    "queries": {"append": 1, "index": 2, "count": 2},
+    "mixed": {"append": 2, "pop": 2, "insert": 1, "pop_index": 1, "remove": 1, "index": 1, "count": 1},
+}
+
+
+def generate_operations(mix: dict, operations_count: int, size: int, seed: int) -> list:
+    """
+    Generates random operations in the format of list_batch.read_operations.
+    :param mix: dict {operation: weight}
+    :param operations_count: int
+    :param size: Initial list size (values are "0" to size - 1)
+    :param seed: Random seed, so that every backend gets the same operations
+    :return: list of (line number, operation, arguments, error message)
+    """
+    generator = random.Random(seed)
+    names = generator.choices(list(mix), weights=list(mix.values()), k=operations_count)
+    operations = []
+
+    for line_number, name in enumerate(names, start=1):
+        value = str(generator.randrange(size))
+        index = generator.randrange(size)
+
+        if name == "insert_start":
+            operation = ("insert", (0, value))
+        elif name == "pop_start":
+            operation = ("pop", (0,))
+        elif name == "insert":
+            operation = ("insert", (index, value))
+        elif name == "pop_index":
+            # Indexes past the end are reported as errors by run_batch, so they stay in range for a shrinking list
+            operation = ("pop", (index // 2,))
+        elif name == "pop":
+            operation = ("pop", ())
+        else:
+            operation = (name, (value,))
+
+        operations.append((line_number, *operation, ""))
+
+    return operations
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compares the list backends on different operation mixes.")
+    parser.add_argument("--size", type=int, default=100_000, help="initial list size")
+    parser.add_argument("--operations", type=int, default=5_000, help="operations per mix")
+    parser.add_argument("--seed", type=int, default=1)
+    arguments = parser.parse_args()
+
+    values = [str(number) for number in range(arguments.size)]
+
+    print(f"{arguments.operations} operations per mix on a list of {arguments.size} values, us per operation")
+    print(f"{'mix':>10}" + "".join(f" {backend:>10}" for backend in BACKENDS))
+
+    for mix_name, mix in MIXES.items():
+        operations = generate_operations(mix, arguments.operations, arguments.size, arguments.seed)
+        row = f"{mix_name:>10}"
+
+        for backend in BACKENDS.values():
+            timings = run_batch(ListSession(values, backend=backend), operations, print_errors=False)
+            total_time = sum(total for count, total in timings.values())
+            row += f" {total_time / len(operations) * 1_000_000:>10.2f}"
+
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
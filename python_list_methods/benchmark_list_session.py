@@ -0,0 +1,92 @@
+import argparse
+import time
+
+from list_session import ListSession
+
+SIZES = (1_000, 100_000, 1_000_000)
+
+
+def copy_and_print_append(lst: list) -> list:
+    """
+    One append as main() did it before ListSession: the list is changed, copied and formatted completely.
+    :param lst: list
+    :return: list (the copy)
+    """
+    lst.append("value")
+    lst = lst.copy()
+    f"Updated list: {lst}"
+    return lst
+
+
+def copy_and_print_pop(lst: list) -> list:
+    """
+    One pop as main() did it before ListSession.
+    :param lst: list
+    :return: list (the copy)
+    """
+    lst.pop()
+    lst = lst.copy()
+    f"Updated list after pop: {lst}"
+    return lst
+
+
+def session_append(session: ListSession) -> ListSession:
+    """
+    One append with ListSession: the list is changed in place and shown as a preview.
+    :param session: ListSession
+    :return: ListSession
+    """
+    session.append("value")
+    f"Updated list: {session.format_preview()}"
+    return session
+
+
+def session_pop(session: ListSession) -> ListSession:
+    """
+    One pop with ListSession.
+    :param session: ListSession
+    :return: ListSession
+    """
+    session.pop()
+    f"Updated list after pop: {session.format_preview()}"
+    return session
+
+
+def time_operation(operation, target, repetitions: int) -> float:
+    """
+    Runs an operation repeatedly on its own result.
+    :param operation: function
+    :param target: list or ListSession
+    :param repetitions: int
+    :return: float (microseconds per operation)
+    """
+    start_time = time.perf_counter()
+
+    for _ in range(repetitions):
+        target = operation(target)
+
+    return (time.perf_counter() - start_time) / repetitions * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compares copy-and-print list operations with ListSession.")
+    parser.add_argument("--sizes", default=",".join(map(str, SIZES)), help="comma-separated list sizes")
+    parser.add_argument("--repetitions", type=int, default=1000, help="operations per measurement")
+    arguments = parser.parse_args()
+
+    print(f"{'size':>10} {'operation':>10} {'copy and print':>16} {'ListSession':>13}")
+
+    for size in map(int, arguments.sizes.split(",")):
+        values = [str(number) for number in range(size)]
+        # The old way takes O(n) per operation, so it is measured with fewer repetitions on large lists
+        old_repetitions = max(3, min(arguments.repetitions, 10_000_000 // size))
+
+        for name, old_operation, new_operation in (("append", copy_and_print_append, session_append),
+                                                   ("pop", copy_and_print_pop, session_pop)):
+            old_time = time_operation(old_operation, list(values), old_repetitions)
+            new_time = time_operation(new_operation, ListSession(values), arguments.repetitions)
+            print(f"{size:>10} {name:>10} {old_time:>13.1f} us {new_time:>10.1f} us")
+
+
+if __name__ == "__main__":
+    main()
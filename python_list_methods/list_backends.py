@@ -0,0 +1,494 @@
+from collections import Counter, deque
+from itertools import chain
+
+# Maximum number of values in one chunk of a ChunkedList. A full chunk is split into two halves.
+CHUNK_SIZE = 1000
+# Number of index lookups after a change in the middle of an IndexedList before its positions are rebuilt
+REBUILD_AFTER_LOOKUPS = 8
+
+
+class DequeList(deque):
+    """
+    collections.deque with the list methods it does not have (pop with an index and sort).
+    append, pop and insert or pop at index 0 take O(1), other indexes O(distance to the nearest end).
+    """
+
+    def pop(self, index: int = -1):
+        """
+        Removes and returns the value at an index.
+        :param index: int (the last value by default)
+        :return: any
+        """
+        if index == -1:
+            return super().pop()
+        elif index == 0:
+            return super().popleft()
+
+        value = self[index]
+        del self[index]
+        return value
+
+    def sort(self) -> None:
+        """
+        Sorts the values in ascending order.
+        :return: None
+        """
+        values = sorted(self)
+        self.clear()
+        self.extend(values)
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+
+class ChunkedList:
+    """
+    List stored as a sequence of chunks of at most CHUNK_SIZE values, like blist.
+
+    A Fenwick tree over the chunk lengths finds the chunk of an index in O(log n), so insert and pop at any index
+    take O(log n + CHUNK_SIZE) instead of O(n). The tree is rebuilt only when a chunk is split or removed, which
+    happens at most once per CHUNK_SIZE / 2 inserts or deletes. remove, index and count are still linear scans.
+    """
+
+    def __init__(self, values=()):
+        """
+        :param values: Initial values
+        """
+        self.chunks = []
+        self.size = 0
+        self.tree = [0]
+        self.extend(values)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self):
+        return chain.from_iterable(self.chunks)
+
+    def __reversed__(self):
+        for chunk in reversed(self.chunks):
+            yield from reversed(chunk)
+
+    def __getitem__(self, index: int):
+        chunk_index, offset = self.locate(self.normalize_index(index))
+        return self.chunks[chunk_index][offset]
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    def build_tree(self) -> None:
+        """
+        Rebuilds the Fenwick tree of the chunk lengths in O(number of chunks).
+        :return: None
+        """
+        tree = [0] * (len(self.chunks) + 1)
+
+        for position, chunk in enumerate(self.chunks, start=1):
+            tree[position] += len(chunk)
+            parent = position + (position & -position)
+
+            if parent < len(tree):
+                tree[parent] += tree[position]
+
+        self.tree = tree
+
+    def update_tree(self, chunk_index: int, delta: int) -> None:
+        """
+        Changes the length of a chunk in the Fenwick tree.
+        :param chunk_index: int
+        :param delta: int
+        :return: None
+        """
+        position = chunk_index + 1
+
+        while position < len(self.tree):
+            self.tree[position] += delta
+            position += position & -position
+
+    def locate(self, index: int):
+        """
+        Finds the chunk which contains an index.
+        :param index: int (0 <= index < len)
+        :return: int (chunk index), int (offset in the chunk)
+        """
+        position = 0
+        bit = 1 << len(self.chunks).bit_length()
+
+        while bit:
+            next_position = position + bit
+
+            if next_position < len(self.tree) and self.tree[next_position] <= index:
+                position = next_position
+                index -= self.tree[next_position]
+
+            bit >>= 1
+
+        return position, index
+
+    def normalize_index(self, index: int) -> int:
+        """
+        Converts a negative index to a positive one.
+        :param index: int
+        :return: int
+        """
+        if index < 0:
+            index += self.size
+
+        if not 0 <= index < self.size:
+            raise IndexError("list index out of range")
+
+        return index
+
+    def delete_at(self, chunk_index: int, offset: int):
+        """
+        Removes and returns a value from a chunk. An empty chunk is removed.
+        :param chunk_index: int
+        :param offset: int
+        :return: any
+        """
+        chunk = self.chunks[chunk_index]
+        value = chunk.pop(offset)
+        self.size -= 1
+
+        if chunk:
+            self.update_tree(chunk_index, -1)
+        else:
+            del self.chunks[chunk_index]
+            self.build_tree()
+
+        return value
+
+    def append(self, value) -> None:
+        """
+        Appends a value to the end of the list.
+        :param value: any
+        :return: None
+        """
+        if self.chunks and len(self.chunks[-1]) < CHUNK_SIZE:
+            self.chunks[-1].append(value)
+            self.update_tree(len(self.chunks) - 1, 1)
+        else:
+            self.chunks.append([value])
+            self.build_tree()
+
+        self.size += 1
+
+    def extend(self, values) -> None:
+        """
+        Appends all values to the end of the list, in half-full chunks so that inserts do not split them at once.
+        :param values: iterable
+        :return: None
+        """
+        values = list(values)
+
+        if not values:
+            return
+
+        half = CHUNK_SIZE // 2
+        self.chunks.extend(values[start:start + half] for start in range(0, len(values), half))
+        self.size += len(values)
+        self.build_tree()
+
+    def insert(self, index: int, value) -> None:
+        """
+        Inserts a value before an index. Indexes out of range insert at the start or at the end, like list.insert.
+        :param index: int
+        :param value: any
+        :return: None
+        """
+        if index < 0:
+            index = max(0, index + self.size)
+
+        if index >= self.size:
+            self.append(value)
+            return
+
+        chunk_index, offset = self.locate(index)
+        chunk = self.chunks[chunk_index]
+        chunk.insert(offset, value)
+        self.size += 1
+
+        if len(chunk) > CHUNK_SIZE:
+            half = len(chunk) // 2
+            self.chunks[chunk_index:chunk_index + 1] = [chunk[:half], chunk[half:]]
+            self.build_tree()
+        else:
+            self.update_tree(chunk_index, 1)
+
+    def pop(self, index: int = -1):
+        """
+        Removes and returns the value at an index.
+        :param index: int (the last value by default)
+        :return: any
+        """
+        try:
+            index = self.normalize_index(index)
+        except IndexError:
+            raise IndexError("pop index out of range")
+
+        return self.delete_at(*self.locate(index))
+
+    def remove(self, value) -> None:
+        """
+        Removes the first occurrence of a value.
+        :param value: any
+        :return: None
+        """
+        for chunk_index, chunk in enumerate(self.chunks):
+            try:
+                offset = chunk.index(value)
+            except ValueError:
+                continue
+
+            self.delete_at(chunk_index, offset)
+            return
+
+        raise ValueError(f"{value!r} is not in list")
+
+    def clear(self) -> None:
+        """
+        Removes all values.
+        :return: None
+        """
+        self.chunks = []
+        self.size = 0
+        self.tree = [0]
+
+    def index(self, value) -> int:
+        """
+        Finds the index of the first occurrence of a value.
+        :param value: any
+        :return: int
+        """
+        start = 0
+
+        for chunk in self.chunks:
+            try:
+                return start + chunk.index(value)
+            except ValueError:
+                start += len(chunk)
+
+        raise ValueError(f"{value!r} is not in list")
+
+    def count(self, value) -> int:
+        """
+        Counts the occurrences of a value.
+        :param value: any
+        :return: int
+        """
+        return sum(chunk.count(value) for chunk in self.chunks)
+
+    def sort(self) -> None:
+        """
+        Sorts the values in ascending order.
+        :return: None
+        """
+        values = sorted(self)
+        self.clear()
+        self.extend(values)
+
+    def reverse(self) -> None:
+        """
+        Reverses the order of the values.
+        :return: None
+        """
+        self.chunks.reverse()
+
+        for chunk in self.chunks:
+            chunk.reverse()
+
+        self.build_tree()
+
+
+class IndexedList:
+    """
+    Python list with a value -> count index and a value -> positions index, for O(1) count and index.
+
+    The counts are always up to date. The positions are updated by append, extend and pop at the end; any other
+    change moves the values after it, so it only marks the positions as outdated. While they are outdated, index
+    scans the list like list.index, and after REBUILD_AFTER_LOOKUPS lookups the positions are rebuilt in O(n), so
+    workloads which change the middle of the list between lookups cost no more than with a list.
+    Values must be hashable.
+    """
+
+    def __init__(self, values=()):
+        """
+        :param values: Initial values
+        """
+        self.values = list(values)
+        self.counts = Counter(self.values)
+        # value -> ascending positions, or None if they must be rebuilt
+        self.positions = None
+        self.stale_lookups = 0
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __iter__(self):
+        return iter(self.values)
+
+    def __reversed__(self):
+        return reversed(self.values)
+
+    def __getitem__(self, index: int):
+        return self.values[index]
+
+    def __repr__(self) -> str:
+        return repr(self.values)
+
+    def discard_count(self, value) -> None:
+        """
+        Decreases the count of a value and removes it from the counts at zero.
+        :param value: any
+        :return: None
+        """
+        self.counts[value] -= 1
+
+        if not self.counts[value]:
+            del self.counts[value]
+
+    def invalidate_positions(self) -> None:
+        """
+        Marks the positions as outdated after a change which moves values.
+        :return: None
+        """
+        self.positions = None
+        self.stale_lookups = 0
+
+    def build_positions(self) -> None:
+        """
+        Rebuilds the positions of all values in O(n).
+        :return: None
+        """
+        positions = {}
+
+        for position, value in enumerate(self.values):
+            positions.setdefault(value, []).append(position)
+
+        self.positions = positions
+
+    def append(self, value) -> None:
+        """
+        Appends a value to the end of the list.
+        :param value: any
+        :return: None
+        """
+        self.values.append(value)
+        self.counts[value] += 1
+
+        if self.positions is not None:
+            self.positions.setdefault(value, []).append(len(self.values) - 1)
+
+    def extend(self, values) -> None:
+        """
+        Appends all values to the end of the list.
+        :param values: iterable
+        :return: None
+        """
+        start = len(self.values)
+        self.values.extend(values)
+        self.counts.update(self.values[start:])
+
+        if self.positions is not None:
+            for position in range(start, len(self.values)):
+                self.positions.setdefault(self.values[position], []).append(position)
+
+    def insert(self, index: int, value) -> None:
+        """
+        Inserts a value before an index.
+        :param index: int
+        :param value: any
+        :return: None
+        """
+        if index >= len(self.values):
+            self.append(value)
+            return
+
+        self.values.insert(index, value)
+        self.counts[value] += 1
+        self.invalidate_positions()
+
+    def pop(self, index: int = -1):
+        """
+        Removes and returns the value at an index.
+        :param index: int (the last value by default)
+        :return: any
+        """
+        size = len(self.values)
+        value = self.values.pop(index)
+        self.discard_count(value)
+
+        if self.positions is not None:
+            if index in (-1, size - 1):
+                value_positions = self.positions[value]
+                value_positions.pop()
+
+                if not value_positions:
+                    del self.positions[value]
+            else:
+                self.invalidate_positions()
+
+        return value
+
+    def remove(self, value) -> None:
+        """
+        Removes the first occurrence of a value, found with the positions index.
+        :param value: any
+        :return: None
+        """
+        self.pop(self.index(value))
+
+    def clear(self) -> None:
+        """
+        Removes all values.
+        :return: None
+        """
+        self.values.clear()
+        self.counts.clear()
+        self.invalidate_positions()
+
+    def index(self, value) -> int:
+        """
+        Finds the index of the first occurrence of a value.
+        :param value: any
+        :return: int
+        """
+        if value not in self.counts:
+            raise ValueError(f"{value!r} is not in list")
+
+        if self.positions is None:
+            self.stale_lookups += 1
+
+            if self.stale_lookups < REBUILD_AFTER_LOOKUPS:
+                return self.values.index(value)
+
+            self.build_positions()
+
+        return self.positions[value][0]
+
+    def count(self, value) -> int:
+        """
+        Counts the occurrences of a value.
+        :param value: any
+        :return: int
+        """
+        return self.counts[value]
+
+    def sort(self) -> None:
+        """
+        Sorts the values in ascending order.
+        :return: None
+        """
+        self.values.sort()
+        self.invalidate_positions()
+
+    def reverse(self) -> None:
+        """
+        Reverses the order of the values.
+        :return: None
+        """
+        self.values.reverse()
+        self.invalidate_positions()
+
+
+BACKENDS = {"list": list, "deque": DequeList, "chunked": ChunkedList, "indexed": IndexedList}
@@ -0,0 +1,125 @@
+import time
+
+from list_session import ListSession
+
+OPERATIONS = ("append", "extend", "insert", "remove", "pop", "clear", "index", "count", "sort", "reverse", "copy")
+
+
+def parse_operation(line: str):
+    """
+    Parses one line of an operations file, e.g. "append 5", "extend 1,2,3", "insert 0 value", "pop" or "pop 2".
+    Values are kept as strings, as they are in the interactive mode.
+    :param line: str
+    :return: str (operation), tuple (arguments), str (error message or empty string)
+    """
+    operation, _, argument = line.strip().partition(" ")
+    operation = operation.lower()
+
+    if operation not in OPERATIONS:
+        return operation, (), f"Unknown operation {operation}."
+
+    if operation in ("append", "remove", "index", "count"):
+        return operation, (argument,), ""
+    elif operation == "extend":
+        return operation, (argument.split(","),), ""
+    elif operation == "insert":
+        index_as_string, _, value = argument.partition(" ")
+        try:
+            return operation, (int(index_as_string), value), ""
+        except ValueError:
+            return operation, (), "Invalid index."
+    elif operation == "pop":
+        if argument == "":
+            return operation, (), ""
+        try:
+            return operation, (int(argument),), ""
+        except ValueError:
+            return operation, (), "Invalid index value."
+
+    return operation, (), ""
+
+
+def read_operations(file_path: str) -> list:
+    """
+    Reads an operations file with one operation per line. Empty lines and lines starting with # are skipped.
+    :param file_path: str
+    :return: list of (line number, operation, arguments, error message)
+    """
+    operations = []
+
+    with open(file_path, mode='r', encoding='utf-8') as operations_file:
+        for line_number, line in enumerate(operations_file, start=1):
+            if not line.strip() or line.lstrip().startswith("#"):
+                continue
+
+            operations.append((line_number, *parse_operation(line)))
+
+    return operations
+
+
+def apply_operation(session: ListSession, operation: str, arguments: tuple):
+    """
+    Applies one operation to the session.
+    :param session: ListSession
+    :param operation: str
+    :param arguments: tuple
+    :return: any (index, count or popped value, otherwise None), str (error message or empty string)
+    """
+    if operation == "remove":
+        return None, session.remove(*arguments)
+    elif operation == "pop":
+        return session.pop(*arguments)
+    elif operation == "index":
+        index = session.index(*arguments)
+        return index, "" if index is not None else "Value does not exist in the list."
+    elif operation == "copy":
+        # Like in the interactive mode, the following operations are done on the user list, not on the copy
+        return len(session.copy()), ""
+
+    return getattr(session, operation)(*arguments), ""
+
+
+def run_batch(session: ListSession, operations: list, sample_every: int = 0,
+              print_errors: bool = True) -> dict:
+    """
+    Applies all operations to the session in one pass, without prompts. Errors are printed with their line number,
+    and the list is printed only every sample_every operations, so printing does not dominate the timings.
+    :param session: ListSession
+    :param operations: list of (line number, operation, arguments, error message) from read_operations
+    :param sample_every: Print the operation result and the list every N operations (0 for never)
+    :param print_errors: Print the errors (failed operations are counted in the timings either way)
+    :return: dict {operation: [number of operations, total seconds]}
+    """
+    timings = {}
+
+    for operation_number, (line_number, operation, arguments, message) in enumerate(operations, start=1):
+        if not message:
+            start_time = time.perf_counter()
+            result, message = apply_operation(session, operation, arguments)
+            elapsed_time = time.perf_counter() - start_time
+
+            timing = timings.setdefault(operation, [0, 0.0])
+            timing[0] += 1
+            timing[1] += elapsed_time
+
+        if message:
+            if print_errors:
+                print(f"Line {line_number}: {message}")
+        elif sample_every and operation_number % sample_every == 0:
+            print(f"Line {line_number}: {operation} -> {result}, list: {session.format_preview()}")
+
+    return timings
+
+
+def print_timings(timings: dict) -> None:
+    """
+    Prints the number of operations and the total and average time for each operation type.
+    :param timings: dict {operation: [number of operations, total seconds]}
+    :return: None
+    """
+    print(f"{'operation':>10} {'count':>10} {'total ms':>10} {'average us':>11}")
+
+    for operation in OPERATIONS:
+        if operation in timings:
+            count, total_time = timings[operation]
+            print(f"{operation:>10} {count:>10} {total_time * 1000:>10.2f} {total_time / count * 1_000_000:>11.2f}")
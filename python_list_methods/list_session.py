@@ -0,0 +1,137 @@
+from itertools import islice
+
+PREVIEW_SIZE = 10
+
+
+class ListSession:
+    """
+    Holds the user list and applies the list operations to it in place.
+
+    The list is never copied by the session (only the copy operation creates a new list), and the list is shown
+    as a bounded preview with the first and last PREVIEW_SIZE elements and the length, so showing the list after
+    an operation costs the same for 10 and for 10 million elements. Operations return None (or the result) on
+    success and an error message on failure, so the session can be used without the console.
+    The list is a Python list by default, or another list-like backend (see list_backends.py).
+    """
+
+    def __init__(self, values=(), preview_size: int = PREVIEW_SIZE, backend=list):
+        """
+        :param values: Initial list values
+        :param preview_size: Number of elements shown from the start and from the end of a long list
+        :param backend: List class, e.g. list or a class from list_backends.BACKENDS
+        """
+        self.lst = backend(values)
+        self.preview_size = preview_size
+        self.backend = backend
+
+    def __len__(self) -> int:
+        return len(self.lst)
+
+    def append(self, value) -> None:
+        """
+        Appends a value to the end of the list.
+        :param value: any
+        :return: None
+        """
+        self.lst.append(value)
+
+    def extend(self, values) -> None:
+        """
+        Appends all values to the end of the list.
+        :param values: list
+        :return: None
+        """
+        self.lst.extend(values)
+
+    def insert(self, index: int, value) -> None:
+        """
+        Inserts a value before an index.
+        :param index: int
+        :param value: any
+        :return: None
+        """
+        self.lst.insert(index, value)
+
+    def remove(self, value) -> str:
+        """
+        Removes the first occurrence of a value.
+        :param value: any
+        :return: str (error message or empty string)
+        """
+        try:
+            self.lst.remove(value)
+        except ValueError:
+            return f"Value {value} cannot be removed. It does not exist in the list {self.format_preview()}."
+        return ""
+
+    def pop(self, index: int = -1):
+        """
+        Removes and returns the element at an index.
+        :param index: int (the last element by default)
+        :return: any (removed value), str (error message or empty string)
+        """
+        try:
+            return self.lst.pop(index), ""
+        except IndexError:
+            return None, "Index is out of range. Try again ... "
+
+    def clear(self) -> None:
+        """
+        Removes all elements from the list.
+        :return: None
+        """
+        self.lst.clear()
+
+    def index(self, value):
+        """
+        Finds the index of the first occurrence of a value.
+        :param value: any
+        :return: int (index) or None if the value does not exist
+        """
+        try:
+            return self.lst.index(value)
+        except ValueError:
+            return None
+
+    def count(self, value) -> int:
+        """
+        Counts the occurrences of a value.
+        :param value: any
+        :return: int
+        """
+        return self.lst.count(value)
+
+    def sort(self) -> None:
+        """
+        Sorts the list in ascending order.
+        :return: None
+        """
+        self.lst.sort()
+
+    def reverse(self) -> None:
+        """
+        Reverses the order of the list.
+        :return: None
+        """
+        self.lst.reverse()
+
+    def copy(self) -> "ListSession":
+        """
+        Creates a shallow copy of the list. Later operations are done on this session, not on the copy.
+        :return: ListSession (with the copied list)
+        """
+        return ListSession(self.lst, self.preview_size, self.backend)
+
+    def format_preview(self) -> str:
+        """
+        Formats the list like print does, but only the first and last preview_size elements of a long list.
+        :return: str
+        """
+        if len(self.lst) <= 2 * self.preview_size:
+            return repr(self.lst)
+
+        # islice instead of slicing, so backends which cannot be sliced work as well
+        head = ", ".join(map(repr, islice(self.lst, self.preview_size)))
+        tail = ", ".join(map(repr, reversed(list(islice(reversed(self.lst), self.preview_size)))))
+
+        return f"[{head}, ..., {tail}] ({len(self.lst)} elements)"
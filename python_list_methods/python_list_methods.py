@@ -1,3 +1,10 @@
+import argparse
+
+from list_session import ListSession
+from list_batch import read_operations, run_batch, print_timings
+from list_backends import BACKENDS
+
+
 def display_menu():
     """
     Displays the menu
@@ -18,33 +25,33 @@ def display_menu():
     print("12. Exit")
 
 
-def handle_append(lst: list) -> list:
+def handle_append(session: ListSession) -> ListSession:
     """
     Prompts user for a value to append to the list and then appends it to the list.
-    :param lst: list
-    :return: list
+    :param session: ListSession
+    :return: ListSession
     """
     value = input("Enter value to append to the list: ")
-    lst.append(value)
-    return lst
+    session.append(value)
+    return session
 
 
-def handle_extend(lst: list) -> list:
+def handle_extend(session: ListSession) -> ListSession:
     """
     Prompts the user for values to extend the list and then extends the list.
-    :param lst: list
-    :return: list
+    :param session: ListSession
+    :return: ListSession
     """
     values = input("Enter values to extend the list (comma-separated): ").split(",")
-    lst.extend(values)
-    return lst
+    session.extend(values)
+    return session
 
 
-def handle_insert(lst: list) -> list:
+def handle_insert(session: ListSession) -> ListSession:
     """
     Prompts the user for an index and a value to insert at that index.
-    :param lst: list
-    :return: int, any
+    :param session: ListSession
+    :return: ListSession or None if the index is invalid
     """
     try:
         index = int(input("Enter an index: "))
@@ -53,31 +60,30 @@ def handle_insert(lst: list) -> list:
         return
     else:
         value = input("Enter a value to be added at that index: ")
-        lst.insert(index, value)
-    return lst
+        session.insert(index, value)
+    return session
 
 
-def handle_remove(lst: list) -> list:
+def handle_remove(session: ListSession) -> ListSession:
     """
     Prompts the user for a value to remove from the list. The method removes the first occurrence of the value.
     If value does not exist in the list, an informative message is printed.
-    :param lst: list
-    :return: list
+    :param session: ListSession
+    :return: ListSession or None if the value does not exist
     """
     value = input("Enter a value to be removed from the list: ")
-    try:
-        lst.remove(value)
-    except ValueError:
-        print(f"Value {value} cannot be removed. It does not exist in the list {lst}.")
+    message = session.remove(value)
+    if message:
+        print(message)
         return
-    return lst
+    return session
 
 
-def handle_pop(lst: list) -> list:
+def handle_pop(session: ListSession) -> ListSession:
     """
     Prompts the user for an index to pop. Optional, pops the last item if left empty.
-    :param lst: list
-    :return: list
+    :param session: ListSession
+    :return: ListSession or None if the index is invalid
     """
     index_as_string = input("Enter an index to pop (leave empty to pop last item): ")
 
@@ -90,81 +96,82 @@ def handle_pop(lst: list) -> list:
         print("Invalid index value. Try again ...")
         return
 
-    try:
-        lst.pop(index)
-    except IndexError:
-        print("Index is out of range. Try again ... ")
+    value, message = session.pop(index)
+    if message:
+        print(message)
         return
-    return lst
+    return session
 
 
-def handle_clear(lst: list) -> list:
+def handle_clear(session: ListSession) -> ListSession:
     """
     Removes all elements from the list.
-    :param lst: list
-    :return: list (empty)
+    :param session: ListSession
+    :return: ListSession (empty)
     """
-    lst.clear()
-    return lst
+    session.clear()
+    return session
 
 
-def handle_index(lst: list):
+def handle_index(session: ListSession):
     """
     Prompts the user for a value to find its index
-    :param lst:  list
+    :param session: ListSession
     :return: any, int
     """
     value = input("Enter a value to find its index: ")
-    try:
-        index = lst.index(value)
-    except ValueError:
+    index = session.index(value)
+    if index is None:
         print("Value does not exist in the list.")
         return None, None
     return value, index
 
 
-def handle_count(lst: list):
+def handle_count(session: ListSession):
     """
     Prompts the user for a value to count its occurrences in the list
-    :param lst: list
+    :param session: ListSession
     :return: any, int
     """
     value = input("Enter a value to count its occurrences in the list: ")
-    count = lst.count(value)
+    count = session.count(value)
     return value, count
 
 
-def handle_sort(lst: list) -> list:
+def handle_sort(session: ListSession) -> ListSession:
     """
     Sorts the list in ascending order.
-    :param lst: list
-    :return: list
+    :param session: ListSession
+    :return: ListSession
     """
-    lst.sort()
-    return lst
+    session.sort()
+    return session
 
 
-def handle_reverse(lst: list) -> list:
+def handle_reverse(session: ListSession) -> ListSession:
     """
     Reverses the order of the list.
-    :param lst: list
-    :return: list
+    :param session: ListSession
+    :return: ListSession
     """
-    lst.reverse()
-    return lst
+    session.reverse()
+    return session
 
 
-def handle_copy(lst: list) -> list:
+def handle_copy(session: ListSession) -> ListSession:
     """
     Creates a shallow copy of the list. Consequence list operations will be done on the user list, not on the copy.
-    :param lst: list
-    :return: list
+    :param session: ListSession
+    :return: ListSession (with the copied list)
     """
-    copy_list = lst.copy()
-    return copy_list
+    copy_session = session.copy()
+    return copy_session
+
 
+def print_list(operation: str, session: ListSession, value='', count=0, index=0) -> None:
+    # Long lists are shown as a bounded preview, so printing does not depend on the list size
+    lst = session.format_preview()
 
-def print_list(operation: str, lst: list, value='', count=0, index=0) -> None:
     if operation == '1':
         print(f"Updated list: {lst}")
     elif operation == '2':
@@ -189,13 +196,52 @@ def print_list(operation: str, lst: list, value='', count=0, index=0) -> None:
         print(f"Copied list: {lst}")
 
 
+def run_script(file_path: str, values: str, sample_every: int, backend=list) -> None:
+    """
+    Applies the operations of a file to the list without prompts and prints the final list and the timings.
+    :param file_path: Path to the operations file (one operation per line, e.g. "insert 0 value")
+    :param values: Initial comma-separated list values
+    :param sample_every: Print the list every N operations (0 for never)
+    :param backend: List class from list_backends.BACKENDS
+    :return: None
+    """
+    user_list = ListSession(values.split(",") if values else [], backend=backend)
+
+    try:
+        operations = read_operations(file_path)
+    except OSError as error:
+        print(f"The operations file cannot be read: {error}")
+        return
+
+    timings = run_batch(user_list, operations, sample_every)
+
+    print(f"Final list: {user_list.format_preview()}")
+    print_timings(timings)
+
+
 def main():
     """
     Main function to provide user interaction.
     """
-    user_list = input("Enter initial list values (comma-separated): ").split(",")
+    argument_parser = argparse.ArgumentParser(description="Python list methods")
+    argument_parser.add_argument("--script", metavar="PATH",
+                                 help="apply the operations in PATH (one per line) without prompts")
+    argument_parser.add_argument("--values", default="", help="initial comma-separated list values for --script")
+    argument_parser.add_argument("--sample", type=int, default=0, metavar="N",
+                                 help="with --script, print the list every N operations")
+    argument_parser.add_argument("--backend", choices=BACKENDS, default="list",
+                                 help="list structure: list, deque (fast at both ends), chunked (fast insert and pop "
+                                      "at any index) or indexed (fast index and count)")
+    arguments = argument_parser.parse_args()
+
+    if arguments.script:
+        run_script(arguments.script, arguments.values, arguments.sample, BACKENDS[arguments.backend])
+        return
+
+    user_list = ListSession(input("Enter initial list values (comma-separated): ").split(","),
+                            backend=BACKENDS[arguments.backend])
 
-    print(f"You entered: {user_list} list with {len(user_list)} elements.")
+    print(f"You entered: {user_list.format_preview()} list with {len(user_list)} elements.")
     while input("Press any key to continue with lists operations ... "):
         continue
 
@@ -212,21 +258,18 @@ def main():
             print_list(choice, user_list)
 
         elif choice == '3':
-            list_after_insert = handle_insert(user_list)
-            if list_after_insert is not None:
-                user_list = list_after_insert.copy()
+            # The operation changes the list in place, so the list is not copied
+            if handle_insert(user_list) is not None:
                 print_list(choice, user_list)
 
         elif choice == '4':
-            list_after_remove = handle_remove(user_list)
-            if list_after_remove is not None:
-                user_list = list_after_remove.copy()
+            # The operation changes the list in place, so the list is not copied
+            if handle_remove(user_list) is not None:
                 print_list(choice, user_list)
 
         elif choice == '5':
-            list_after_pop = handle_pop(user_list)
-            if list_after_pop is not None:
-                user_list = list_after_pop.copy()
+            # The operation changes the list in place, so the list is not copied
+            if handle_pop(user_list) is not None:
                 print_list(choice, user_list)
 
         elif choice == '6':
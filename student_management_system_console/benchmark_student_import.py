@@ -0,0 +1,54 @@
+import argparse
+import csv
+import os
+import random
+import tempfile
+
+from student_registry import StudentRegistry
+from student_import import import_students
+
+SUBJECTS = ("Mathematics", "Physics", "Chemistry", "Biology", "History", "Art", "Music", "Informatics")
+
+
+def write_roster(file_path, rows_count, seed):
+    """
+    Writes a synthetic CSV roster with about 2% invalid and 1% duplicate rows.
+    :param file_path: Path to the .csv file
+    :param rows_count: Number of rows
+    :param seed: Seed for the random generator
+    :return: None
+    """
+    generator = random.Random(seed)
+
+    with open(file_path, mode='w', encoding='utf-8', newline='') as roster_file:
+        writer = csv.writer(roster_file)
+        writer.writerow(("name", "age", "grade", "subjects"))
+
+        for number in range(rows_count):
+            chance = generator.random()
+            name = f"Student {generator.randrange(number)}" if chance < 0.01 and number else f"Student {number}"
+            grade = "7.50" if 0.01 <= chance < 0.02 else f"{generator.uniform(2, 6):.2f}"
+            age = "abc" if 0.02 <= chance < 0.03 else generator.randint(7, 19)
+            writer.writerow((name, age, grade, ", ".join(generator.sample(SUBJECTS, 3))))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measures the import pipeline at different worker counts.")
+    parser.add_argument("--rows", type=int, default=500_000, help="number of roster rows")
+    parser.add_argument("--workers", default="1,2,4,8", help="comma-separated worker counts")
+    parser.add_argument("--seed", type=int, default=42, help="seed for the roster generator")
+    arguments = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        roster_path = os.path.join(directory, "roster.csv")
+        write_roster(roster_path, arguments.rows, arguments.seed)
+        print(f"{arguments.rows} rows, {os.cpu_count()} CPUs")
+
+        for workers in map(int, arguments.workers.split(",")):
+            students, message = import_students(StudentRegistry(), roster_path,
+                                                reject_path=os.path.join(directory, "rejects.jsonl"), workers=workers)
+            print(f"  {workers} workers: {message}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+import argparse
+import gc
+import random
+import time
+import tracemalloc
+
+from student_registry import StudentRegistry
+from student_compact_registry import CompactStudentRegistry
+
+SUBJECTS = ("Mathematics", "Physics", "Chemistry", "Biology", "History", "Geography", "Literature", "English",
+            "German", "Art", "Music", "Informatics", "Philosophy", "Economics", "Physical Education")
+
+
+def generate_students(count, seed):
+    """
+    Generates synthetic student records. Subjects are parsed from a comma-separated string for every student,
+    like the console input, so every record has its own subject strings.
+    :param count: Number of students
+    :param seed: Seed for the random generator, so that the same students are generated on every run
+    :return: generator of student records
+    """
+    generator = random.Random(seed)
+
+    for number in range(count):
+        subjects = ", ".join(generator.sample(SUBJECTS, generator.randint(2, 6)))
+        yield {
+            "name": f"Student {number:07d}",
+            "age": generator.randint(7, 19),
+            "grade": generator.randint(200, 600) / 100,
+            "subjects": [subject.strip() for subject in subjects.split(",")]
+        }
+
+
+def measure(build, count):
+    """
+    Measures the memory allocated by a data structure that stays alive.
+    :param build: Function returning the data structure
+    :param count: Number of students in it
+    :return: dict (total bytes, bytes per student, build time in seconds)
+    """
+    gc.collect()
+    tracemalloc.start()
+    start_time = time.perf_counter()
+    structure = build()
+    build_time = time.perf_counter() - start_time
+    allocated_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del structure
+
+    return {"bytes": allocated_bytes, "bytes_per_student": allocated_bytes / count, "seconds": build_time}
+
+
+def print_comparison(title, baseline, compact):
+    """
+    Prints the footprint before and after.
+    :param title: Name of the compared structures
+    :param baseline: Measurement of the dictionary records
+    :param compact: Measurement of the compact records
+    :return: None
+    """
+    print(f"\n{title}")
+
+    for label, measurement in (("dict records", baseline), ("compact records", compact)):
+        print(f"  {label:16} {measurement['bytes'] / 1024 / 1024:9.1f} MiB "
+              f"{measurement['bytes_per_student']:7.1f} B/student {measurement['seconds']:7.2f} s")
+
+    print(f"  saved {1 - compact['bytes'] / baseline['bytes']:.0%} of the memory")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compares the memory footprint of dictionary and compact records.")
+    parser.add_argument("--count", type=int, default=1_000_000, help="number of students")
+    parser.add_argument("--seed", type=int, default=42, help="seed for the student generator")
+    parser.add_argument("--registries", action="store_true",
+                        help="also measure whole registries, including the subject, grade and name indexes")
+    arguments = parser.parse_args()
+
+    packer = CompactStudentRegistry()
+    baseline = measure(lambda: list(generate_students(arguments.count, arguments.seed)), arguments.count)
+    compact = measure(lambda: [packer.pack_record(student)
+                               for student in generate_students(arguments.count, arguments.seed)], arguments.count)
+    print_comparison(f"Records of {arguments.count} students", baseline, compact)
+
+    if arguments.registries:
+        baseline = measure(lambda: StudentRegistry(generate_students(arguments.count, arguments.seed)),
+                           arguments.count)
+        compact = measure(lambda: CompactStudentRegistry(generate_students(arguments.count, arguments.seed)),
+                          arguments.count)
+        print_comparison(f"Registries of {arguments.count} students", baseline, compact)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+
+from student_registry import StudentRegistry
+from student_server import StudentServer, DEFAULT_HOST
+
+SUBJECTS = ("Mathematics", "Physics", "Chemistry", "Biology", "History", "Art", "Music", "Informatics")
+# Operation -> share of the requests in the mixed phase
+OPERATION_MIX = {"search": 0.50, "add": 0.20, "list": 0.15, "update": 0.10, "delete": 0.05}
+
+
+class StudentClient:
+    """
+    Client sending JSON line requests to the student server and timing them.
+    """
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        # Operation -> list of latencies in seconds
+        self.latencies = dict()
+
+    async def request(self, **request):
+        """
+        Sends one request and waits for its response.
+        :param request: Request fields, including operation
+        :return: dict (response)
+        """
+        start_time = time.perf_counter()
+        self.writer.write(json.dumps(request).encode("utf-8") + b"\n")
+        await self.writer.drain()
+        response = json.loads(await self.reader.readline())
+        self.latencies.setdefault(request["operation"], []).append(time.perf_counter() - start_time)
+
+        return response
+
+    async def close(self):
+        self.writer.close()
+        await self.writer.wait_closed()
+
+
+def percentile(sorted_values, percent):
+    """
+    Returns the nearest-rank percentile of already sorted values.
+    :param sorted_values: Sorted sample values
+    :param percent: Percentile between 0 and 100
+    :return: float (percentile value)
+    """
+    rank = max(1, round(percent / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+async def race_for_names(clients, contested_names):
+    """
+    Lets all clients add the same names at the same time. Exactly one add per name must succeed.
+    :param clients: list of StudentClient
+    :param contested_names: Names every client tries to add
+    :return: dict (name -> number of successful adds)
+    """
+    async def add_all(client):
+        return [(name, (await client.request(operation="add", name=name, grade="4.00"))["ok"])
+                for name in contested_names]
+
+    successful_adds = dict.fromkeys(contested_names, 0)
+
+    for client_results in await asyncio.gather(*(add_all(client) for client in clients)):
+        for name, added in client_results:
+            successful_adds[name] += added
+
+    return successful_adds
+
+
+async def run_mixed_requests(client, client_number, requests_count, seed):
+    """
+    Sends a random mix of reads and writes.
+    :param client: StudentClient
+    :param client_number: Number of the client, used for its student names
+    :param requests_count: Number of requests
+    :param seed: Seed for the random generator
+    :return: int (number of failed requests other than expected misses)
+    """
+    generator = random.Random(seed + client_number)
+    own_names = []
+    unexpected_failures = 0
+
+    for request_number in range(requests_count):
+        operation = generator.choices(list(OPERATION_MIX), weights=list(OPERATION_MIX.values()))[0]
+
+        if operation == "add" or not own_names and operation in ("update", "delete"):
+            name = f"Client {client_number} student {request_number}"
+            response = await client.request(operation="add", name=name, age=generator.randint(7, 19),
+                                            grade=f"{generator.uniform(2, 6):.2f}",
+                                            subjects=generator.sample(SUBJECTS, 3))
+            own_names.append(name)
+        elif operation == "update":
+            response = await client.request(operation="update", name=generator.choice(own_names),
+                                            grade=f"{generator.uniform(2, 6):.2f}")
+        elif operation == "delete":
+            response = await client.request(operation="delete", name=own_names.pop())
+        elif operation == "search":
+            # Names of other clients may be deleted at any time, so a miss is not a failure
+            await client.request(operation="search", name=f"Client {generator.randrange(client_number + 1)} "
+                                                          f"student {generator.randrange(request_number + 1)}")
+            continue
+        else:
+            response = await client.request(operation="list", grades="3.00-6.00", limit=20)
+
+        unexpected_failures += not response["ok"]
+
+    return unexpected_failures
+
+
+async def run_load_test(arguments):
+    server = None
+    host, port = arguments.host, arguments.port
+
+    if port is None:
+        server = await StudentServer(StudentRegistry()).start(host, 0)
+        port = server.sockets[0].getsockname()[1]
+
+    clients = [StudentClient(*await asyncio.open_connection(host, port)) for _ in range(arguments.clients)]
+    contested_names = [f"Contested student {number}" for number in range(arguments.contested_names)]
+
+    successful_adds = await race_for_names(clients, contested_names)
+    duplicated_names = [name for name, count in successful_adds.items() if count != 1]
+
+    start_time = time.perf_counter()
+    failures = await asyncio.gather(*(run_mixed_requests(client, client_number, arguments.requests, arguments.seed)
+                                      for client_number, client in enumerate(clients)))
+    elapsed_time = time.perf_counter() - start_time
+
+    print(f"{arguments.clients} clients, {arguments.clients * arguments.requests} mixed requests "
+          f"in {elapsed_time:.2f} s ({arguments.clients * arguments.requests / elapsed_time:.0f} requests/s)")
+
+    for operation in OPERATION_MIX:
+        latencies = sorted(latency for client in clients for latency in client.latencies.get(operation, ()))
+
+        if latencies:
+            print(f"  {operation:8} {len(latencies):7} requests  p50 {percentile(latencies, 50) * 1000:7.2f} ms  "
+                  f"p99 {percentile(latencies, 99) * 1000:7.2f} ms")
+
+    print(f"Name uniqueness: {len(contested_names) - len(duplicated_names)} of {len(contested_names)} contested "
+          f"names added exactly once by {arguments.clients} competing clients")
+    print(f"Unexpected failures: {sum(failures)}")
+
+    for client in clients:
+        await client.close()
+
+    if server is not None:
+        server.close()
+        await server.wait_closed()
+
+    return not duplicated_names and not sum(failures)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Concurrency load test for the student server.")
+    parser.add_argument("--host", default=DEFAULT_HOST, help="server host")
+    parser.add_argument("--port", type=int, help="port of a running server (default: start one in this process)")
+    parser.add_argument("--clients", type=int, default=50, help="number of concurrent clients")
+    parser.add_argument("--requests", type=int, default=200, help="mixed requests per client")
+    parser.add_argument("--contested-names", type=int, default=20, help="names all clients try to add at once")
+    parser.add_argument("--seed", type=int, default=42, help="seed for the request generators")
+    arguments = parser.parse_args()
+
+    if not asyncio.run(run_load_test(arguments)):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+from array import array
+
+from student_registry import StudentRegistry
+
+# Grades are stored in hundredths, e.g. 5.50 as 550
+GRADE_SCALE = 100
+
+
+class CompactStudent:
+    """
+    Compact stored form of a student record. Undefined age and grade are stored as 0.
+    """
+    __slots__ = ("name", "age", "grade", "subject_ids")
+
+    def __init__(self, name, age, grade, subject_ids):
+        """
+        :param name: Student name
+        :param age: int (age or 0)
+        :param grade: int (grade in hundredths or 0)
+        :param subject_ids: array('I') (interned subject IDs)
+        """
+        self.name = name
+        self.age = age
+        self.grade = grade
+        self.subject_ids = subject_ids
+
+
+class CompactStudentRegistry(StudentRegistry):
+    """
+    StudentRegistry which stores the records compactly, for large cohorts.
+
+    Records are CompactStudent objects with __slots__ instead of dictionaries. Every subject name is stored once
+    and students keep its ID in an array('I'), and grades are scaled integers. get(), iteration and remove()
+    return new dictionaries, so all functions working with StudentRegistry work unchanged; change records with
+    update(). Grades are kept with two decimals.
+    """
+
+    def __init__(self, students=(), case_insensitive=False):
+        """
+        :param students: Initial student records with unique names.
+        :param case_insensitive: Treat names which differ only in letter case as the same student.
+        """
+        # Subject ID -> subject name, and subject name -> subject ID
+        self.subject_names = []
+        self.subject_ids = dict()
+        super().__init__(students, case_insensitive)
+
+    def get_subject_id(self, subject):
+        """
+        Returns the ID of a subject, interning the subject if it is new.
+        :param subject: Subject name
+        :return: int (subject ID)
+        """
+        subject_id = self.subject_ids.get(subject)
+
+        if subject_id is None:
+            subject_id = len(self.subject_names)
+            self.subject_names.append(subject)
+            self.subject_ids[subject] = subject_id
+
+        return subject_id
+
+    def pack_record(self, student):
+        """
+        Converts a student record to a CompactStudent.
+        :param student: Student record (dict with keys: name, age, grade, and subjects)
+        :return: CompactStudent
+        """
+        return CompactStudent(student["name"],
+                              student["age"] or 0,
+                              round(student["grade"] * GRADE_SCALE) if student["grade"] != "" else 0,
+                              array('I', map(self.get_subject_id, student["subjects"])))
+
+    def unpack_record(self, stored_record):
+        """
+        Converts a CompactStudent back to a student record.
+        :param stored_record: CompactStudent
+        :return: dict (student record)
+        """
+        return {
+            "name": stored_record.name,
+            "age": stored_record.age or "",
+            "grade": stored_record.grade / GRADE_SCALE if stored_record.grade else "",
+            "subjects": [self.subject_names[subject_id] for subject_id in stored_record.subject_ids]
+        }
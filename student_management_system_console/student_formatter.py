@@ -0,0 +1,174 @@
+import io
+import sys
+from itertools import chain, islice
+
+from student_validations import *
+
+LIST_CHUNK_SIZE = 1000
+INVALID_PAGE_SIZE_VALUE = -1
+INVALID_GRADE_RANGE_MESSAGE = "Grade range must be two grades between [2.00, 6.00], e.g. 3.50-6.00. Try again. "
+INVALID_PAGE_SIZE_MESSAGE = "Page size must be a positive integer number. Try again. "
+
+
+def write_student(student, output):
+    """
+    Writes the information of one student to a text stream. All student listings use this function.
+    :param student: Student record (dict with keys: name, age, grade, and subjects)
+    :param output: Text stream, e.g. io.StringIO or sys.stdout
+    :return: None
+    """
+    output.write(f'\nStudent name: {student["name"]}')
+
+    if student["age"]:
+        output.write(f'\nStudent age: {student["age"]}')
+    else:
+        output.write('\nStudent age: (undefined)')
+
+    if student["grade"]:
+        output.write(f'\nStudent grade: {student["grade"]:.2f}')
+    else:
+        output.write('\nStudent grade: (undefined)')
+
+    output.write("\nSubjects: ")
+
+    for student_subject in student["subjects"]:
+        output.write(f'\n\tSubject: {student_subject}')
+
+
+def format_student(student):
+    """
+    Returns the information of one student.
+    :param student: Student record
+    :return: str (formatted student information)
+    """
+    output = io.StringIO()
+    write_student(student, output)
+
+    return output.getvalue()
+
+
+def filter_students(students, min_grade=None, max_grade=None):
+    """
+    Generates the students with a grade in the given range. Students without a grade are skipped
+    if a range is given.
+    :param students: StudentRegistry with all students
+    :param min_grade: Lowest grade or None
+    :param max_grade: Highest grade or None
+    :return: generator of student records
+    """
+    if min_grade is None and max_grade is None:
+        yield from students
+        return
+
+    for student in students:
+        grade = student["grade"]
+
+        if grade == "":
+            continue
+        if min_grade is not None and grade < min_grade:
+            continue
+        if max_grade is not None and grade > max_grade:
+            continue
+
+        yield student
+
+
+def iter_formatted_students(students, chunk_size=LIST_CHUNK_SIZE):
+    """
+    Generates the formatted information of the students, chunk_size students per string,
+    so that the output is written in a few large writes instead of one write per student.
+    :param students: Iterable of student records
+    :param chunk_size: Number of students per generated string
+    :return: generator of (str) formatted chunk, (int) number of students in the chunk
+    """
+    output = io.StringIO()
+    chunk_count = 0
+
+    for student in students:
+        write_student(student, output)
+        output.write("\n")
+        chunk_count += 1
+
+        if chunk_count == chunk_size:
+            yield output.getvalue(), chunk_count
+            output = io.StringIO()
+            chunk_count = 0
+
+    if chunk_count:
+        yield output.getvalue(), chunk_count
+
+
+def write_students(students, output=None, min_grade=None, max_grade=None, page_size=None, next_page=None):
+    """
+    Streams the formatted students to a text stream, optionally filtered by grade and split into pages.
+    A page is formatted only after next_page has allowed it, so stopping the listing formats nothing more.
+    :param students: StudentRegistry with all students
+    :param output: Text stream (sys.stdout if None)
+    :param min_grade: Lowest grade or None
+    :param max_grade: Highest grade or None
+    :param page_size: Number of students per page, or None to write all students at once
+    :param next_page: Function called between pages. Returns False to stop listing.
+    :return: int (number of written students)
+    """
+    output = output if output is not None else sys.stdout
+    filtered_students = filter_students(students, min_grade, max_grade)
+    chunk_size = page_size or LIST_CHUNK_SIZE
+    written_count = 0
+
+    # The first student of a page is taken before asking, so there is no prompt after the last page
+    for first_student in filtered_students:
+        if page_size and written_count and next_page is not None and not next_page():
+            break
+
+        page = chain((first_student,), islice(filtered_students, chunk_size - 1))
+
+        for formatted_chunk, chunk_count in iter_formatted_students(page, chunk_size):
+            output.write(formatted_chunk)
+            written_count += chunk_count
+
+    output.flush()
+
+    return written_count
+
+
+def validate_grade_range(grade_range):
+    """
+    Validates a grade range in the form lowest-highest, e.g. 3.50-6.00. Empty value means all grades.
+    :param grade_range: str
+    :return: (float) lowest grade or None, (float) highest grade or None, str (message)
+    """
+    if grade_range.strip() == "":
+        return None, None, ""
+
+    grades = grade_range.split("-")
+
+    if len(grades) != 2:
+        return INVALID_GRADE_VALUE, INVALID_GRADE_VALUE, INVALID_GRADE_RANGE_MESSAGE
+
+    min_grade, message = validate_student_grade(grades[0].strip())
+    max_grade, message = validate_student_grade(grades[1].strip())
+
+    if INVALID_GRADE_VALUE in (min_grade, max_grade) or "" in (min_grade, max_grade) or min_grade > max_grade:
+        return INVALID_GRADE_VALUE, INVALID_GRADE_VALUE, INVALID_GRADE_RANGE_MESSAGE
+
+    return min_grade, max_grade, ""
+
+
+def validate_page_size(page_size):
+    """
+    Validates a page size. Empty value means no paging.
+    :param page_size: str
+    :return: int (page size) or None, str (message)
+    """
+    if page_size.strip() == "":
+        return None, ""
+
+    try:
+        page_size = int(page_size)
+    except ValueError:
+        return INVALID_PAGE_SIZE_VALUE, INVALID_PAGE_SIZE_MESSAGE
+
+    if page_size <= 0:
+        return INVALID_PAGE_SIZE_VALUE, INVALID_PAGE_SIZE_MESSAGE
+
+    return page_size, ""
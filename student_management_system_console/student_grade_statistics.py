@@ -0,0 +1,138 @@
+import bisect
+import math
+
+MIN_GRADE = 2.00
+MAX_GRADE = 6.00
+HISTOGRAM_BUCKET_WIDTH = 0.50
+HISTOGRAM_BUCKETS_COUNT = int((MAX_GRADE - MIN_GRADE) / HISTOGRAM_BUCKET_WIDTH)
+
+
+class GradeStatistics:
+    """
+    Grade aggregates kept up to date while students are added, updated and deleted.
+
+    Count, sum and sum of squares give the average and the standard deviation in O(1). A histogram over
+    the 2.00 - 6.00 range is updated per grade, and a sorted index of (-grade, name) entries answers top-N
+    and percentile queries without sorting the students. Students without a grade are not counted.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.sum = 0.0
+        self.sum_of_squares = 0.0
+        self.histogram = [0] * HISTOGRAM_BUCKETS_COUNT
+        # (-grade, name) entries, so the best grades come first and equal grades are ordered by name
+        self.sorted_grades = []
+
+    def get_bucket(self, grade):
+        """
+        Returns the histogram bucket of a grade. The maximum grade belongs to the last bucket.
+        :param grade: Validated grade
+        :return: int (bucket index)
+        """
+        return min(int((grade - MIN_GRADE) / HISTOGRAM_BUCKET_WIDTH), HISTOGRAM_BUCKETS_COUNT - 1)
+
+    def add_grade(self, name, grade):
+        """
+        Adds the grade of a student to the aggregates. Empty grades are ignored.
+        :param name: Student name
+        :param grade: Validated grade or empty string
+        :return: None
+        """
+        if grade == "":
+            return
+
+        self.count += 1
+        self.sum += grade
+        self.sum_of_squares += grade * grade
+        self.histogram[self.get_bucket(grade)] += 1
+        bisect.insort(self.sorted_grades, (-grade, name))
+
+    def remove_grade(self, name, grade):
+        """
+        Removes the grade of a student from the aggregates. Empty grades are ignored.
+        :param name: Student name
+        :param grade: Validated grade or empty string, as it was added
+        :return: None
+        """
+        if grade == "":
+            return
+
+        position = bisect.bisect_left(self.sorted_grades, (-grade, name))
+
+        if position == len(self.sorted_grades) or self.sorted_grades[position] != (-grade, name):
+            return
+
+        del self.sorted_grades[position]
+        self.count -= 1
+        self.histogram[self.get_bucket(grade)] -= 1
+
+        if self.count:
+            self.sum -= grade
+            self.sum_of_squares -= grade * grade
+        else:
+            # Start again from exact zeros, so rounding errors do not add up
+            self.sum = 0.0
+            self.sum_of_squares = 0.0
+
+    def get_average(self):
+        """
+        Returns the average grade.
+        :return: float (average) or None if there are no grades
+        """
+        return self.sum / self.count if self.count else None
+
+    def get_standard_deviation(self):
+        """
+        Returns the population standard deviation of the grades.
+        :return: float (standard deviation) or None if there are no grades
+        """
+        if not self.count:
+            return None
+
+        average = self.sum / self.count
+        return math.sqrt(max(self.sum_of_squares / self.count - average * average, 0.0))
+
+    def get_minimum(self):
+        """
+        :return: float (lowest grade) or None if there are no grades
+        """
+        return -self.sorted_grades[-1][0] if self.sorted_grades else None
+
+    def get_maximum(self):
+        """
+        :return: float (highest grade) or None if there are no grades
+        """
+        return -self.sorted_grades[0][0] if self.sorted_grades else None
+
+    def get_percentile(self, percent):
+        """
+        Returns the grade at a percentile (nearest rank), e.g. 50 for the median.
+        :param percent: Percentile between 0 and 100
+        :return: float (grade) or None if there are no grades
+        """
+        if not self.count:
+            return None
+
+        rank = min(max(math.ceil(percent / 100 * self.count), 1), self.count)
+
+        # The index is sorted from the highest grade, so the rank is counted from its end
+        return -self.sorted_grades[self.count - rank][0]
+
+    def get_top_students(self, limit):
+        """
+        Returns the students with the highest grades.
+        :param limit: Maximum number of students
+        :return: list of (name, grade)
+        """
+        return [(name, -negative_grade) for negative_grade, name in self.sorted_grades[:limit]]
+
+    def get_histogram(self):
+        """
+        Returns the number of grades in every histogram bucket.
+        :return: list of (lowest grade, highest grade, number of grades)
+        """
+        return [(MIN_GRADE + bucket * HISTOGRAM_BUCKET_WIDTH,
+                 MAX_GRADE if bucket == HISTOGRAM_BUCKETS_COUNT - 1 else
+                 MIN_GRADE + (bucket + 1) * HISTOGRAM_BUCKET_WIDTH - 0.01,
+                 count) for bucket, count in enumerate(self.histogram)]
@@ -0,0 +1,184 @@
+import csv
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from student_validations import *
+from student_storage import get_file_format, validate_student_row, SNAPSHOT_METADATA_KEY
+from student_storage import INVALID_FILE_FORMAT_MESSAGE, FILE_NOT_FOUND_MESSAGE, INVALID_ROW_MESSAGE
+
+CHUNK_BYTES = 4 * 1024 * 1024
+
+
+def get_chunk_ranges(file_path, data_start, chunk_bytes):
+    """
+    Splits a file into byte ranges of about chunk_bytes which end at line ends.
+    :param file_path: Path to the students file
+    :param data_start: Offset of the first data line (after the CSV header)
+    :param chunk_bytes: Approximate size of a chunk
+    :return: list of (start offset, end offset)
+    """
+    file_size = os.path.getsize(file_path)
+    chunk_ranges = []
+
+    with open(file_path, mode='rb') as students_file:
+        chunk_start = data_start
+
+        while chunk_start < file_size:
+            students_file.seek(min(chunk_start + chunk_bytes, file_size))
+            # Move the end to the end of the line, so that no line is split between two chunks
+            students_file.readline()
+            chunk_end = min(students_file.tell(), file_size)
+            chunk_ranges.append((chunk_start, chunk_end))
+            chunk_start = chunk_end
+
+    return chunk_ranges
+
+
+def validate_file_chunk(file_path, file_format, csv_fields, chunk_start, chunk_end):
+    """
+    Parses and validates the rows of one chunk. Runs in a worker process.
+    :param file_path: Path to the students file
+    :param file_format: jsonl or csv
+    :param csv_fields: Field names from the CSV header (None for JSON lines)
+    :param chunk_start: Offset of the first line of the chunk
+    :param chunk_end: Offset after the last line of the chunk
+    :return: (int) number of lines, (list) (line index, line, student record) for valid rows,
+             (list) (line index, line, message) for invalid rows
+    """
+    with open(file_path, mode='rb') as students_file:
+        students_file.seek(chunk_start)
+        lines = students_file.read(chunk_end - chunk_start).decode('utf-8').split("\n")
+
+    # The chunk ends with a line end, which leaves an empty string after the last line
+    if lines and lines[-1] == "":
+        lines.pop()
+
+    valid_rows = []
+    invalid_rows = []
+
+    if file_format == "csv":
+        rows = (dict(zip(csv_fields, values)) if values else None for values in csv.reader(lines))
+    else:
+        rows = map(parse_json_line, lines)
+
+    for line_index, (line, row) in enumerate(zip(lines, rows)):
+        if row is None or isinstance(row, dict) and SNAPSHOT_METADATA_KEY in row:
+            continue
+
+        try:
+            student, message = validate_student_row(row)
+        except (TypeError, AttributeError, ValueError):
+            # An unexpected value in one row must not abort the whole import in the worker process
+            student, message = None, INVALID_ROW_MESSAGE
+
+        if student is None:
+            invalid_rows.append((line_index, line, message))
+        else:
+            valid_rows.append((line_index, line, student))
+
+    return len(lines), valid_rows, invalid_rows
+
+
+def parse_json_line(line):
+    """
+    Parses one JSON line. A line which is not valid JSON is returned as it is and rejected as an invalid row.
+    :param line: str
+    :return: Parsed value, None for an empty line, or the line
+    """
+    if not line.strip():
+        return None
+
+    try:
+        return json.loads(line)
+    except json.JSONDecodeError:
+        return line
+
+
+def import_students(students, file_path, reject_path=None, workers=None, chunk_bytes=CHUNK_BYTES):
+    """
+    Imports a large JSON lines or CSV roster. The file is split into chunks at line ends, the chunks are parsed and
+    validated in a process pool, and the valid rows are merged into the registry in file order, so every name is
+    checked for uniqueness once. Invalid and duplicate rows are written to the reject file as JSON lines with the
+    line number, the reason and the original line. Records must not span several lines.
+    :param students: StudentRegistry the students are added to
+    :param file_path: Path to the .jsonl, .json or .csv file
+    :param reject_path: Path of the reject file (file_path + '.rejects.jsonl' if None), created only for rejects
+    :param workers: Number of worker processes (os.cpu_count() if None). 1 validates without a pool.
+    :param chunk_bytes: Approximate size of a chunk
+    :return: (StudentRegistry) students, (str) message with the number of imported and rejected rows and rows/second
+    """
+    file_format = get_file_format(file_path)
+
+    if not file_format:
+        return students, INVALID_FILE_FORMAT_MESSAGE
+
+    if not os.path.isfile(file_path):
+        return students, FILE_NOT_FOUND_MESSAGE
+
+    start_time = time.perf_counter()
+    reject_path = reject_path if reject_path is not None else file_path + ".rejects.jsonl"
+    csv_fields = None
+    data_start = 0
+
+    if file_format == "csv":
+        with open(file_path, mode='rb') as students_file:
+            header_line = students_file.readline()
+            csv_fields = next(csv.reader([header_line.decode('utf-8-sig')]), [])
+            data_start = len(header_line)
+
+    chunk_ranges = get_chunk_ranges(file_path, data_start, chunk_bytes)
+    chunk_arguments = [(file_path, file_format, csv_fields, chunk_start, chunk_end)
+                       for chunk_start, chunk_end in chunk_ranges]
+    workers = workers or os.cpu_count() or 1
+    executor = None
+
+    if workers > 1 and len(chunk_ranges) > 1:
+        executor = ProcessPoolExecutor(max_workers=min(workers, len(chunk_ranges)))
+        chunk_results = executor.map(validate_file_chunk, *zip(*chunk_arguments))
+    else:
+        chunk_results = (validate_file_chunk(*arguments) for arguments in chunk_arguments)
+
+    # Line numbers start at 1 and count the CSV header
+    first_line_number = 2 if file_format == "csv" else 1
+    imported_count = 0
+    rejected_count = 0
+    reject_file = None
+
+    try:
+        for lines_count, valid_rows, invalid_rows in chunk_results:
+            rejected_rows = invalid_rows
+
+            for line_index, line, student in valid_rows:
+                if students.add(student):
+                    imported_count += 1
+                else:
+                    rejected_rows.append((line_index, line, STUDENT_ALREADY_EXISTS_MESSAGE))
+
+            if rejected_rows:
+                if reject_file is None:
+                    reject_file = open(reject_path, mode='w', encoding='utf-8')
+
+                for line_index, line, message in sorted(rejected_rows, key=lambda rejected_row: rejected_row[0]):
+                    reject_file.write(json.dumps({"line": first_line_number + line_index, "reason": message.strip(),
+                                                  "data": line.rstrip("\r")}))
+                    reject_file.write("\n")
+
+                rejected_count += len(rejected_rows)
+
+            first_line_number += lines_count
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        if reject_file is not None:
+            reject_file.close()
+
+    elapsed_time = time.perf_counter() - start_time
+    rows_count = imported_count + rejected_count
+    message = f"{imported_count} students imported, {rejected_count} rejected"
+
+    if rejected_count:
+        message += f" (see {reject_path})"
+
+    return students, f"{message} in {elapsed_time:.2f} s ({rows_count / elapsed_time:.0f} rows/s)."
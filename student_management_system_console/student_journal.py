@@ -0,0 +1,352 @@
+import datetime
+import json
+import os
+from collections import deque
+
+from student_registry import StudentRegistry
+from student_storage import save_students, load_students, read_snapshot_metadata
+
+UNDO_LIMIT = 1000
+# The journal is compacted into a new snapshot once it is larger than the snapshot and at least this size
+COMPACT_MIN_BYTES = 64 * 1024
+NOTHING_TO_UNDO_MESSAGE = "There are no changes to undo."
+NOTHING_TO_REDO_MESSAGE = "There are no changes to redo."
+UNDO_FAILED_MESSAGE = "The change cannot be reverted, the student was changed in the meantime."
+SNAPSHOT_TOO_NEW_MESSAGE = "The journal was compacted after this point in time, so it cannot be reconstructed."
+
+
+def get_journal_paths(base_path):
+    """
+    Returns the snapshot and journal paths for a base path, e.g. students -> students.snapshot.jsonl and
+    students.journal.jsonl.
+    :param base_path: Path without extension
+    :return: (str) snapshot path, (str) journal path
+    """
+    return base_path + ".snapshot.jsonl", base_path + ".journal.jsonl"
+
+
+def get_inverse_entry(entry):
+    """
+    Returns the journal entry which reverts a change.
+    :param entry: Journal entry
+    :return: dict (journal entry without sequence and time)
+    """
+    if entry["operation"] == "add":
+        return {"operation": "remove", "student": entry["student"]}
+    elif entry["operation"] == "remove":
+        return {"operation": "add", "student": entry["student"]}
+    else:
+        return {"operation": "update", "name": entry["after"].get("name", entry["name"]),
+                "before": entry["after"], "after": entry["before"]}
+
+
+def apply_entry(students, entry):
+    """
+    Applies a journal entry to a registry.
+    :param students: StudentRegistry
+    :param entry: Journal entry
+    :return: bool (True if the change is applied)
+    """
+    if entry["operation"] == "add":
+        return students.add(dict(entry["student"]))
+    elif entry["operation"] == "remove":
+        return students.remove(entry["student"]["name"]) is not None
+    else:
+        return students.update(entry["name"], dict(entry["after"]))
+
+
+def iter_journal(journal_path):
+    """
+    Reads the journal entries one at a time. A partially written last line (after a crash) is ignored, and
+    a damaged line in the middle is skipped, so the entries after it are not lost.
+    :param journal_path: Path to the journal file
+    :return: generator of journal entries
+    """
+    if not os.path.isfile(journal_path):
+        return
+
+    with open(journal_path, mode='r', encoding='utf-8', errors='replace') as journal_file:
+        for line in journal_file:
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                # Only the physical last line can be missing its line end
+                if not line.endswith("\n"):
+                    return
+
+
+def truncate_torn_line(journal_path):
+    """
+    Removes a partially written last line (after a crash), so that new entries start on a line of their own.
+    :param journal_path: Path to the journal file
+    :return: None
+    """
+    if not os.path.isfile(journal_path):
+        return
+
+    with open(journal_path, mode='rb+') as journal_file:
+        end = journal_file.seek(0, os.SEEK_END)
+        position = end
+
+        # Search backwards for the last line end, one block at a time
+        while position > 0:
+            block_start = max(0, position - 4096)
+            journal_file.seek(block_start)
+            block = journal_file.read(position - block_start)
+            line_end = block.rfind(b"\n")
+
+            if line_end != -1:
+                position = block_start + line_end + 1
+                break
+
+            position = block_start
+
+        if position < end:
+            journal_file.truncate(position)
+
+
+def reconstruct_students(base_path, until=None, students=None):
+    """
+    Rebuilds the students from the snapshot and the journal, as they were at a point in time.
+    Only points in time after the last compaction can be reconstructed.
+    :param base_path: Path without extension, as passed to StudentJournal
+    :param until: ISO date and time (e.g. 2024-05-01T12:00:00) or None for the latest state
+    :param students: Empty registry to fill (a new StudentRegistry if None)
+    :return: (StudentRegistry) students, (int) sequence number of the last applied change, (str) message
+    """
+    snapshot_path, journal_path = get_journal_paths(base_path)
+    students = StudentRegistry() if students is None else students
+    sequence = 0
+
+    if os.path.isfile(snapshot_path):
+        snapshot_metadata = read_snapshot_metadata(snapshot_path)
+
+        if until is not None and snapshot_metadata["time"] > until:
+            return students, sequence, SNAPSHOT_TOO_NEW_MESSAGE
+
+        students, message = load_students(students, snapshot_path)
+        sequence = snapshot_metadata["sequence"]
+
+    for entry in iter_journal(journal_path):
+        # Entries up to the snapshot remain if the journal was not truncated after the last compaction
+        if entry["sequence"] <= sequence:
+            continue
+        if until is not None and entry["time"] > until:
+            break
+
+        apply_entry(students, entry)
+        sequence = entry["sequence"]
+
+    return students, sequence, ""
+
+
+class StudentJournal:
+    """
+    Registry wrapper recording every change in an append-only journal, with undo and redo.
+
+    add(), remove() and update() are passed to the wrapped registry and, if they succeed, appended to the journal
+    file as one JSON line with only the changed fields. Undo and redo are bounded stacks of journal entries, and
+    undoing or redoing a change is journaled like any other change, so the journal is a complete audit log.
+    On start the students are rebuilt from the last snapshot plus the journal, and once the journal is larger
+    than the snapshot it is compacted into a new snapshot, so neither grows without bound and the full data
+    set is only rewritten after as many journal bytes as it has itself. All other attributes are taken from
+    the wrapped registry, so the wrapper can be used instead of it.
+    """
+
+    def __init__(self, students, base_path=None, undo_limit=UNDO_LIMIT):
+        """
+        :param students: Empty StudentRegistry (or another registry with the same interface)
+        :param base_path: Path without extension for the snapshot and journal files, or None to keep
+                          only the undo and redo stacks in memory
+        :param undo_limit: Maximum number of changes which can be undone
+        """
+        self.students = students
+        self.base_path = base_path
+        self.undo_stack = deque(maxlen=undo_limit)
+        self.redo_stack = deque(maxlen=undo_limit)
+        self.sequence = 0
+        self.journal_file = None
+        self.snapshot_size = 0
+
+        if base_path is not None:
+            self.snapshot_path, self.journal_path = get_journal_paths(base_path)
+            self.students, self.sequence, message = reconstruct_students(base_path, students=students)
+
+            if os.path.isfile(self.snapshot_path):
+                self.snapshot_size = os.path.getsize(self.snapshot_path)
+
+            truncate_torn_line(self.journal_path)
+            self.journal_file = open(self.journal_path, mode='a', encoding='utf-8')
+
+    def __getattr__(self, attribute):
+        return getattr(self.students, attribute)
+
+    def __iter__(self):
+        return iter(self.students)
+
+    def __len__(self):
+        return len(self.students)
+
+    def __contains__(self, name):
+        return name in self.students
+
+    def record(self, entry, reason):
+        """
+        Appends a change to the journal and compacts the journal when it is large.
+        :param entry: Journal entry without sequence and time
+        :param reason: change, undo or redo
+        :return: dict (journal entry)
+        """
+        self.sequence += 1
+        entry = dict(entry, sequence=self.sequence, time=datetime.datetime.now().isoformat(timespec="milliseconds"),
+                     reason=reason)
+
+        if self.journal_file is not None:
+            self.journal_file.write(json.dumps(entry))
+            self.journal_file.write("\n")
+            self.journal_file.flush()
+
+            journal_size = self.journal_file.tell()
+
+            if journal_size >= COMPACT_MIN_BYTES and journal_size > self.snapshot_size:
+                self.compact()
+
+        return entry
+
+    def record_change(self, entry):
+        """
+        Journals a new change. It can be undone, and changes undone before it can no longer be redone.
+        :param entry: Journal entry without sequence and time
+        :return: None
+        """
+        self.undo_stack.append(self.record(entry, "change"))
+        self.redo_stack.clear()
+
+    def add(self, student):
+        """
+        Adds a student record and journals it. See StudentRegistry.add.
+        :param student: Student record
+        :return: bool (True if the student is added)
+        """
+        if not self.students.add(student):
+            return False
+
+        # Journal a copy of the stored record, which the registry may change in place later
+        added_student = self.students.get(student["name"])
+        self.record_change({"operation": "add", "student": dict(added_student,
+                                                                subjects=list(added_student["subjects"]))})
+        return True
+
+    def remove(self, name):
+        """
+        Removes the record of a student and journals it. See StudentRegistry.remove.
+        :param name: Student name
+        :return: dict (removed record) or None if the student is not found
+        """
+        student = self.students.remove(name)
+
+        if student is not None:
+            self.record_change({"operation": "remove", "student": student})
+
+        return student
+
+    def update(self, name, changes):
+        """
+        Updates the fields of a student record and journals the old and new values of the changed fields.
+        See StudentRegistry.update.
+        :param name: Current student name
+        :param changes: dict with the changed fields (name, age, grade, subjects)
+        :return: bool (True if the student is updated)
+        """
+        student = self.students.get(name)
+
+        if student is None:
+            return False
+
+        before = {field: student[field] for field in changes}
+        stored_name = student["name"]
+
+        if not self.students.update(name, changes):
+            return False
+
+        self.record_change({"operation": "update", "name": stored_name, "before": before, "after": dict(changes)})
+        return True
+
+    def undo(self):
+        """
+        Reverts the last change.
+        :return: str (message)
+        """
+        if not self.undo_stack:
+            return NOTHING_TO_UNDO_MESSAGE
+
+        entry = self.undo_stack.pop()
+        inverse_entry = get_inverse_entry(entry)
+
+        if not apply_entry(self.students, inverse_entry):
+            return UNDO_FAILED_MESSAGE
+
+        self.record(inverse_entry, "undo")
+        self.redo_stack.append(entry)
+
+        return f"Undone: {describe_entry(entry)}"
+
+    def redo(self):
+        """
+        Applies the last undone change again.
+        :return: str (message)
+        """
+        if not self.redo_stack:
+            return NOTHING_TO_REDO_MESSAGE
+
+        entry = self.redo_stack.pop()
+
+        if not apply_entry(self.students, entry):
+            return UNDO_FAILED_MESSAGE
+
+        self.undo_stack.append(self.record({field: entry[field] for field in entry
+                                            if field not in ("sequence", "time", "reason")}, "redo"))
+
+        return f"Redone: {describe_entry(entry)}"
+
+    def compact(self):
+        """
+        Writes all students to a new snapshot and starts an empty journal.
+        The snapshot replaces the old one atomically, and journal entries it already contains are skipped
+        on start, so an interruption between the two steps loses nothing.
+        :return: None
+        """
+        if self.journal_file is None:
+            return
+
+        save_students(self.students, self.snapshot_path, metadata={
+            "sequence": self.sequence, "time": datetime.datetime.now().isoformat(timespec="milliseconds")})
+        self.snapshot_size = os.path.getsize(self.snapshot_path)
+        self.journal_file.close()
+        self.journal_file = open(self.journal_path, mode='w', encoding='utf-8')
+
+    def close(self):
+        """
+        Closes the journal and the wrapped registry, if it has to be closed.
+        :return: None
+        """
+        if self.journal_file is not None:
+            self.journal_file.close()
+            self.journal_file = None
+
+        if hasattr(self.students, "close"):
+            self.students.close()
+
+
+def describe_entry(entry):
+    """
+    Describes a journal entry for the user.
+    :param entry: Journal entry
+    :return: str (description)
+    """
+    if entry["operation"] == "add":
+        return f"add {entry['student']['name']}"
+    elif entry["operation"] == "remove":
+        return f"delete {entry['student']['name']}"
+    else:
+        return f"update {entry['name']}"
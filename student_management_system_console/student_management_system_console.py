@@ -1,291 +1,324 @@
-# Error codes and messages
-INVALID_NAME_VALUE = "Enter a valid student name. Name cannot be empty. Try again. "
-INVALID_AGE_VALUE = -1
-INVALID_AGE_VALUE_MESSAGE = "The age you entered is invalid. Try again. "
-INVALID_AGE_RANGE_MESSAGE = "Student age must be a positive value. Try again. "
-INVALID_GRADE_VALUE = -1
-INVALID_GRADE_VALUE_MESSAGE = "Invalid student grade. Grade must be a value between [2.00, 6.00]. Try again. "
-STUDENT_ALREADY_EXISTS_MESSAGE = "Student already exists. Try again. "
-STUDENT_NOT_FOUND = "Student is not found. Try again. "
-
-
-def validate_student_name(name, operation):
+import argparse
+
+from student_validations import *
+from student_registry import StudentRegistry
+from student_compact_registry import CompactStudentRegistry
+from student_journal import StudentJournal
+from student_formatter import format_student, write_students, validate_grade_range, validate_page_size
+from student_formatter import INVALID_PAGE_SIZE_VALUE
+from student_storage import save_students, get_row_value
+from student_import import import_students
+from student_sqlite_registry import SQLiteStudentRegistry
+
+
+def add_student(students, name, age, grade, subjects):
     """
-    Validates student name. If the function is called for update of an existing student, empty value is accepted.
-    If the function is called to add, delete or search for a student with empty name, the user is prompted to try again.
-    :param name:  Student name
-    :param operation: Operation from which validation is called. Possible values are: add, update, delete, search.
-    :return: str (name or error message)
+    Add a new student record. Each student is a dictionary with keys: name, age, grade, and subjects.
+    :param students: StudentRegistry with all students
+    :param name: The name of the student.
+    :param age: The age of the student.
+    :param grade: The grade of the student.
+    :param subjects: list (subjects the student is enrolled in)
+    :return:
     """
-    if (operation == "add" or operation == "delete" or operation == "search") and name.strip() == "":
-        return INVALID_NAME_VALUE
+    new_student = {
+        "name": name,
+        "age": age,
+        "grade": grade,
+        "subjects": subjects
+    }
 
-    elif operation == "update" and name.strip() == "":
-        return ""
+    if not students.add(new_student):
+        return students, STUDENT_ALREADY_EXISTS_MESSAGE
 
-    else:
-        return name
+    return students, "is added."
 
 
-def validate_student_age(age):
+def update_student_fields(students, name, /, **changes):
     """
-    Prompts for student age.
-    If age is not a positive integer number the user is prompted to try again.
-    :param age: Student age.
-    :return: int (age), str (message)
+    Update fields of an existing student record without prompting.
+    Values are validated like the console input; empty values (None or empty string) keep the current value.
+    Returns error if student is not found, updated name already exists or updated values are not valid.
+    :param students: StudentRegistry with all students
+    :param name: The name of the student whose record is to be updated.
+    :param changes: New values for name, age, grade and subjects (a list or a comma-separated string)
+    :return: (StudentRegistry)(str) The result of the update
     """
-    if age == "":
-        return "", ""
+    if name not in students:
+        return students, STUDENT_NOT_FOUND
 
-    else:
-        try:
-            age = int(age)
+    if not set(changes) <= {"name", "age", "grade", "subjects"}:
+        return students, INVALID_UPDATE_FIELD_MESSAGE
 
-        except ValueError:
-            return INVALID_AGE_VALUE, INVALID_AGE_VALUE_MESSAGE
+    validated_changes = dict()
+    updated_name = validate_student_name(get_row_value(changes, "name"), "update")
 
-        else:
-            if age <= 0:
-                return INVALID_AGE_VALUE, INVALID_AGE_RANGE_MESSAGE
-            else:
-                return age, ""
+    # If the name is to be updated, verify that the new value does not already exists for other student
+    # since our identification is done by name
+    if updated_name:
+        if updated_name in students and students.make_key(updated_name) != students.make_key(name):
+            return students, STUDENT_ALREADY_EXISTS_MESSAGE
 
+        validated_changes["name"] = updated_name
 
-def validate_student_grade(grade_input):
-    """
-    Validates student grade. A valid student grade is a float number between 2.00 and 6.00.
-    :param grade_input: str
-    :return: float (grade), str (message)
-    """
-    if grade_input == "":
-        return "", ""
+    updated_age, message = validate_student_age(get_row_value(changes, "age"))
 
-    else:
-        try:
-            grade = float(grade_input)
+    if updated_age == INVALID_AGE_VALUE:
+        return students, message
+    elif updated_age:
+        validated_changes["age"] = updated_age
 
-        except ValueError:
-            return INVALID_GRADE_VALUE, INVALID_GRADE_VALUE_MESSAGE
+    updated_grade, message = validate_student_grade(get_row_value(changes, "grade"))
 
-        else:
-            if grade < 2.00 or grade > 6.00:
-                return INVALID_GRADE_VALUE, INVALID_GRADE_VALUE_MESSAGE
+    if updated_grade == INVALID_GRADE_VALUE:
+        return students, INVALID_GRADE_VALUE_MESSAGE
+    elif updated_grade:
+        validated_changes["grade"] = updated_grade
 
-            else:
-                return grade, ""
+    subjects = changes.get("subjects") or ""
 
+    if isinstance(subjects, list) and all(isinstance(subject, str) for subject in subjects):
+        subjects = ",".join(subjects)
 
-def format_student_subjects(subjects):
-    """
-    Splits subjects into a list. Strips empty spaces, if any.
-    :param subjects: student subjects (comma-separated)
-    :return: list (subjects)
-    """
-    if subjects == "":
-        listed_subjects = list()
+    if not isinstance(subjects, str):
+        return students, INVALID_SUBJECTS_MESSAGE
 
-    else:
-        listed_subjects = subjects.split(',')
+    updated_subjects = format_student_subjects(subjects)
 
-        for subject_index in range(len(listed_subjects)):
-            listed_subjects[subject_index] = str(listed_subjects[subject_index]).strip()
+    if updated_subjects:
+        validated_changes["subjects"] = updated_subjects
 
-    return listed_subjects
+    # Changed values were validated. Do actual update on student
+    if not students.update(name, validated_changes):
+        return students, STUDENT_ALREADY_EXISTS_MESSAGE
 
+    return students, STUDENT_UPDATED_MESSAGE
 
-def add_student(students, name, age, grade, subjects):
+
+def apply_student_updates(students, updates):
     """
-    Add a new student record. Each student is a dictionary with keys: name, age, grade, and subjects.
-    :param students: List with all students
-    :param name: The name of the student.
-    :param age: The age of the student.
-    :param grade: The grade of the student.
-    :param subjects: list (subjects the student is enrolled in)
-    :return:
+    Validate and apply many updates in one pass, e.g. rows read from a file.
+    Invalid updates are skipped and reported; the other updates are applied.
+    :param students: StudentRegistry with all students
+    :param updates: Iterable of dicts with the name of the student to update and the changed fields.
+                    A new name is given as new_name.
+    :return: (int) Number of updated students, (list) (name, message) for every rejected update
     """
-    for current_student in students:
+    updated_count = 0
+    rejected_updates = []
 
-        if current_student["name"] == name:
-            return students, STUDENT_ALREADY_EXISTS_MESSAGE
+    for update in updates:
+        changes = dict(update)
+        name = changes.pop("name", "")
 
-    else:
-        new_student = {
-            "name": name,
-            "age": age,
-            "grade": grade,
-            "subjects": subjects
-        }
+        if "new_name" in changes:
+            changes["name"] = changes.pop("new_name")
+
+        students, message = update_student_fields(students, name, **changes)
+
+        if message == STUDENT_UPDATED_MESSAGE:
+            updated_count += 1
+        else:
+            rejected_updates.append((name, message))
 
-        students.append(new_student)
-        return students, "is added."
+    return updated_count, rejected_updates
 
 
 def update_student(students, name):
     """
-    Update an existing student record.
-    Returns error if student is not found, updated name already exists or updated values are no valid.
-    :param students: List with all students
+    Prompt for the updated fields of an existing student record and update it with update_student_fields.
+    :param students: StudentRegistry with all students
     :param name: The name of the student whose record is to be updated.
     :return: (str) The result of the update
     """
-    for current_student in students:
+    if name not in students:
+        return students, STUDENT_NOT_FOUND
 
-        if current_student["name"] == name:
-            # Student is found. Prompt the user to enter the updated fields and validate each input.
-            # Keep current values if fields are empty
-            print("Enter updated name (leave empty to skip):", end=" ")
-            updated_name_candidate = input()
-            updated_name_candidate = validate_student_name(updated_name_candidate, "update")
-            updated_candidate_index = students.index(current_student)
+    # Student is found. Prompt the user to enter the updated fields. Keep current values if fields are empty
+    print("Enter updated name (leave empty to skip):", end=" ")
+    updated_name = input()
 
-            if updated_name_candidate:
-                # If the name is to be updated, verify that the new value does not already exists for other student
-                # since our identification is done by name
-                for existing_student in students:
+    print("Enter updated age (leave empty to skip):", end=" ")
+    updated_age = input()
 
-                    if existing_student["name"] == updated_name_candidate \
-                            and students.index(existing_student) != updated_candidate_index:
+    print("Enter updated grade (leave empty to skip):", end=" ")
+    updated_grade = input()
 
-                        return students, STUDENT_ALREADY_EXISTS_MESSAGE
+    print("Enter student's subjects (comma-separated or leave empty to skip):", end=" ")
+    updated_subjects = input()
 
-                else:
-                    updated_name = updated_name_candidate
+    return update_student_fields(students, name, name=updated_name, age=updated_age, grade=updated_grade,
+                                 subjects=updated_subjects)
 
-            else:   # updated name is empty (i.e. unchanged)
-                updated_name = updated_name_candidate
 
-            print("Enter updated age (leave empty to skip):", end=" ")
-            input_age = input()
-            updated_age, message = validate_student_age(input_age)
+def delete_student(students, name):
+    """
+    Delete a student record based on the student's name. If student is not found, returns error message.
+    :param students: StudentRegistry with all students
+    :param name: The name of the student to delete.
+    :return: (StudentRegistry)(str) Result of the deletion.
+    """
+    if students.remove(name) is None:
+        return students, STUDENT_NOT_FOUND
 
-            if updated_age == INVALID_AGE_VALUE:
-                return students, message
+    return students, f"Student {name} is deleted."
 
-            print("Enter updated grade (leave empty to skip):", end=" ")
-            input_grade = input()
-            updated_grade, message = validate_student_grade(input_grade)
 
-            if updated_grade == INVALID_GRADE_VALUE:
-                return students, INVALID_GRADE_VALUE_MESSAGE
+def search_student(students, name):
+    """
+    Search for a student by name and return their record.
+    If the name is not found, names starting with it and similar names are suggested.
+    :param students: StudentRegistry with all students
+    :param name: The name of the student to search for.
+    :return: (str) Formatted student information.
+    """
+    current_student = students.get(name)
 
-            print("Enter student's subjects (comma-separated or leave empty to skip):", end=" ")
-            subjects_input = input()
-            updated_subjects = format_student_subjects(subjects_input)
+    if current_student is None:
+        suggested_names = suggest_student_names(students, name)
 
-            # Prompted values were validated.
-            # Do actual update on student:
-            if updated_name:
-                current_student["name"] = updated_name
-            if updated_age:
-                current_student["age"] = updated_age
-            if updated_grade:
-                current_student["grade"] = updated_grade
-            if updated_subjects:
-                del current_student["subjects"]
-                current_student["subjects"] = updated_subjects
+        if suggested_names:
+            return f"{STUDENT_NOT_FOUND}\nDid you mean: {', '.join(suggested_names)}?"
 
-            return students, "Student was updated."
+        return STUDENT_NOT_FOUND
 
-    else:
-        return students, STUDENT_NOT_FOUND
+    return format_student(current_student)
 
 
-def delete_student(students, name):
+def suggest_student_names(students, name, limit=5):
     """
-    Delete a student record based on the student's name. If student is not found, returns error message.
-    :param students: List with all students
-    :param name: The name of the student to delete.
-    :return: (list)(str) Result of the deletion.
+    Suggest student names for a partial or misspelled name: names starting with it first, then similar names.
+    :param students: StudentRegistry with all students
+    :param name: Partial or misspelled student name
+    :param limit: Maximum number of suggested names
+    :return: list (student names)
     """
-    for current_student in range(len(students)):
+    suggested_names = students.name_index.complete_name(name, limit)
 
-        if name == students[current_student]["name"]:
-            del students[current_student]
-            return students, f"Student {name} is deleted."
+    for similar_name, distance in students.name_index.find_similar_names(name, limit=limit):
+        if len(suggested_names) == limit:
+            break
+        if similar_name not in suggested_names:
+            suggested_names.append(similar_name)
 
-    else:
-        return students, STUDENT_NOT_FOUND
+    return suggested_names
 
 
-def search_student(students, name):
+def ask_for_next_page():
     """
-    Search for a student by name and return their record.
-    :param students: List with all students
-    :param name: The name of the student to search for.
-    :return: (str) Formatted student information.
+    Asks the user whether to list the next page.
+    :return: bool (True if the next page is to be listed)
     """
+    print("\nPress Enter for the next page or q to stop:", end=" ")
 
-    student_information = ""
-    for current_student in range(len(students)):
+    return input().strip().lower() != "q"
 
-        if name == students[current_student]["name"]:
 
-            student_information = f'\nStudent name: {students[current_student]["name"]}'
+def list_all_students(students, min_grade=None, max_grade=None, page_size=None):
+    """
+    List all student records, optionally only students with a grade in the given range and page by page.
+    :param students: StudentRegistry with all students
+    :param min_grade: Lowest grade or None
+    :param max_grade: Highest grade or None
+    :param page_size: Number of students per page, or None to list all students at once
+    :return:
+    """
+    listed_count = write_students(students, min_grade=min_grade, max_grade=max_grade, page_size=page_size,
+                                  next_page=ask_for_next_page)
 
-            if students[current_student]["age"]:
-                student_information += f'\nStudent age: {students[current_student]["age"]}'
-            else:
-                student_information += f'\nStudent age: (undefined)'
+    if listed_count > 0:
+        print(f"\nListed {listed_count} students.")
 
-            if students[current_student]["grade"]:
-                student_information += f'\nStudent grade: {students[current_student]["grade"]:.2f}'
-            else:
-                student_information += f'\nStudent age: (undefined)'
+    elif len(students) > 0 and (min_grade is not None or max_grade is not None):
+        print(f"\nThere are no students with a grade in the given range.")
 
-            student_information += "\nSubjects: "
+    else:
+        print(f"\nThere are no students to be listed.")
 
-            for student_subject in students[current_student]["subjects"]:
-                student_information += f'\n\tSubject: {student_subject}'
 
-            return student_information
+def list_students_by_subjects(students, subjects):
+    """
+    List the names of the students enrolled in all given subjects.
+    :param students: StudentRegistry with all students
+    :param subjects: list (subject names)
+    :return: (str) Formatted list of student names.
+    """
+    if not subjects:
+        return "Enter at least one subject. Try again. "
 
-    else:
-        return STUDENT_NOT_FOUND
+    student_names = students.get_students_in_all_subjects(subjects)
 
+    if not student_names:
+        return f"\nThere are no students enrolled in {', '.join(subjects)}."
 
-def list_all_students(students):
+    return "\n".join(student_names) + f"\n\nListed {len(student_names)} students."
+
+
+def list_subject_enrollment_counts(students):
     """
-    List all student records.
-    :param students: List with all students
-    :return:
+    List all subjects with the number of enrolled students, starting with the most popular subject.
+    :param students: StudentRegistry with all students
+    :return: (str) Formatted subject counts.
     """
-    students_count = len(students)
+    subject_counts = students.get_subject_counts()
 
-    if students_count > 0:
+    if not subject_counts:
+        return "\nThere are no enrolled students."
 
-        for current_student in range(students_count):
+    return "\n".join(f"{subject}: {count} students" for subject, count in subject_counts)
 
-            student_information = f'\nStudent name: {students[current_student]["name"]}'
 
-            if students[current_student]["age"]:
-                student_information += f'\nStudent age: {students[current_student]["age"]}'
-            else:
-                student_information += f'\nStudent age: (undefined)'
+def show_grade_statistics(students, top_limit=5):
+    """
+    Show the grade report: average, standard deviation, lowest, median and highest grade,
+    the grade distribution and the students with the highest grades.
+    :param students: StudentRegistry with all students
+    :param top_limit: Number of listed top students
+    :return: (str) Formatted grade report.
+    """
+    grade_statistics = students.grade_statistics
 
-            if students[current_student]["grade"]:
-                student_information += f'\nStudent grade: {students[current_student]["grade"]:.2f}'
-            else:
-                student_information += f'\nStudent age: (undefined)'
+    if not grade_statistics.count:
+        return "\nThere are no students with a grade."
 
-            student_information += "\nSubjects: "
+    report_lines = [
+        f"Students with a grade: {grade_statistics.count}",
+        f"Average grade: {grade_statistics.get_average():.2f}",
+        f"Standard deviation: {grade_statistics.get_standard_deviation():.2f}",
+        f"Lowest grade: {grade_statistics.get_minimum():.2f}",
+        f"Median grade: {grade_statistics.get_percentile(50):.2f}",
+        f"Highest grade: {grade_statistics.get_maximum():.2f}",
+        "\nGrade distribution:"
+    ]
 
-            for student_subject in students[current_student]["subjects"]:
-                student_information += f'\n\tSubject: {student_subject}'
+    for lowest_grade, highest_grade, count in grade_statistics.get_histogram():
+        report_lines.append(f"{lowest_grade:.2f} - {highest_grade:.2f}: {count}")
 
-            print(student_information)
+    report_lines.append(f"\nTop {top_limit} students:")
 
-        print(f"\nListed {students_count} students.")
+    for name, grade in grade_statistics.get_top_students(top_limit):
+        report_lines.append(f"{name}: {grade:.2f}")
 
-    else:
-        print(f"\nThere are no students to be listed.")
+    return "\n".join(report_lines)
 
 
-def main():
+def main(database_path=None, compact=False, journal_path=None):
     """
     Main function to provide user interaction.
+    :param database_path: Optional SQLite database file. Without it, students are kept in memory.
+    :param compact: Keep the students in memory in the compact form (CompactStudentRegistry).
+    :param journal_path: Optional path without extension for the snapshot and journal files of the changes.
     """
-    # List of dictionaries to store all students
-    students = list()
+    # Registry of student dictionaries indexed by name
+    if database_path:
+        students = SQLiteStudentRegistry(database_path)
+    elif compact:
+        students = CompactStudentRegistry()
+    else:
+        students = StudentRegistry()
+
+    # Record all changes for undo and redo, and in the journal if journal_path is given
+    students = StudentJournal(students, journal_path)
 
     while True:
         # Display menu options
@@ -295,7 +328,14 @@ def main():
         print("3. Delete Student")
         print("4. Search Student")
         print("5. List All Students")
-        print("6. Exit")
+        print("6. Save Students to File")
+        print("7. Load Students from File")
+        print("8. List Students by Subjects")
+        print("9. Subject Enrollment Counts")
+        print("10. Grade Statistics")
+        print("11. Undo Last Change")
+        print("12. Redo Last Change")
+        print("13. Exit")
 
         # Prompt user for their choice
         choice = input("Enter your choice: ")
@@ -381,12 +421,71 @@ def main():
 
         elif choice == '5':
 
+            print("Enter grade range (e.g. 3.50-6.00 or leave empty for all students): ", end=" ")
+            min_grade, max_grade, message = validate_grade_range(input())
+
+            if min_grade == INVALID_GRADE_VALUE:
+                print(message)
+                continue
+
+            print("Enter page size (leave empty to list all students at once): ", end=" ")
+            page_size, message = validate_page_size(input())
+
+            if page_size == INVALID_PAGE_SIZE_VALUE:
+                print(message)
+                continue
+
             # Call the list_all_students function
-            list_all_students(students)
+            list_all_students(students, min_grade, max_grade, page_size)
 
         elif choice == '6':
 
+            print("Enter file path to save students (.jsonl or .csv): ", end=" ")
+            file_path = input()
+
+            # Call the save_students function
+            saved_count, message = save_students(students, file_path)
+            print(message)
+
+        elif choice == '7':
+
+            print("Enter file path to load students from (.jsonl or .csv): ", end=" ")
+            file_path = input()
+
+            # Call the import_students function. Rejected rows are written next to the file
+            students, message = import_students(students, file_path)
+            print(message)
+
+        elif choice == '8':
+
+            print("Enter subjects (comma-separated, students enrolled in all of them are listed): ", end=" ")
+            subjects = format_student_subjects(input())
+
+            # Call the list_students_by_subjects function
+            print(list_students_by_subjects(students, subjects))
+
+        elif choice == '9':
+
+            # Call the list_subject_enrollment_counts function
+            print(list_subject_enrollment_counts(students))
+
+        elif choice == '10':
+
+            # Call the show_grade_statistics function
+            print(show_grade_statistics(students))
+
+        elif choice == '11':
+
+            print(students.undo())
+
+        elif choice == '12':
+
+            print(students.redo())
+
+        elif choice == '13':
+
             # Exit the program
+            students.close()
             break
 
         else:
@@ -394,4 +493,16 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    argument_parser = argparse.ArgumentParser(description="Basic console Student Management System")
+    argument_parser.add_argument("--db", help="store the students in this SQLite database file")
+    argument_parser.add_argument("--compact", action="store_true",
+                                 help="keep the students in memory in a compact form, for large cohorts")
+    argument_parser.add_argument("--journal", metavar="PATH",
+                                 help="keep the students in PATH.snapshot.jsonl and journal every change "
+                                      "in PATH.journal.jsonl")
+    arguments = argument_parser.parse_args()
+
+    if arguments.db and arguments.journal:
+        argument_parser.error("--journal cannot be combined with --db, the database keeps the students itself")
+
+    main(arguments.db, arguments.compact, arguments.journal)
@@ -0,0 +1,213 @@
+# Key of the trie node entry with the names ending at the node. Trie keys are single characters, so it cannot clash
+NAMES_KEY = ""
+
+
+def get_trigrams(name):
+    """
+    Returns the trigrams of a case-folded name, padded so that short names and name starts have trigrams too.
+    :param name: Student name
+    :return: set (trigrams)
+    """
+    padded_name = f"  {name.casefold()} "
+
+    return {padded_name[position:position + 3] for position in range(len(padded_name) - 2)}
+
+
+def get_character_masks(pattern):
+    """
+    Returns the bit mask of the positions of every character in a pattern, used by get_pattern_distance.
+    :param pattern: str
+    :return: dict (character -> bit mask)
+    """
+    character_masks = dict()
+
+    for position, character in enumerate(pattern):
+        character_masks[character] = character_masks.get(character, 0) | (1 << position)
+
+    return character_masks
+
+
+def get_pattern_distance(pattern, character_masks, text):
+    """
+    Returns the Levenshtein distance between a pattern and a text with the bit-parallel algorithm of Myers
+    and Hyyro: one column of the distance matrix is kept in two bit vectors, so every text character costs
+    a few integer operations instead of a row of len(pattern) cells.
+    :param pattern: str
+    :param character_masks: dict (get_character_masks of the pattern)
+    :param text: str
+    :return: int (edit distance)
+    """
+    if not pattern:
+        return len(text)
+
+    all_bits = (1 << len(pattern)) - 1
+    last_bit = 1 << (len(pattern) - 1)
+    # Positive and negative vertical differences between neighbouring cells of the current column
+    positive_vertical = all_bits
+    negative_vertical = 0
+    distance = len(pattern)
+
+    for character in text:
+        equal = character_masks.get(character, 0)
+        vertical_changes = equal | negative_vertical
+        horizontal_changes = (((equal & positive_vertical) + positive_vertical) ^ positive_vertical) | equal
+        positive_horizontal = negative_vertical | (~(horizontal_changes | positive_vertical) & all_bits)
+        negative_horizontal = positive_vertical & horizontal_changes
+
+        if positive_horizontal & last_bit:
+            distance += 1
+        elif negative_horizontal & last_bit:
+            distance -= 1
+
+        positive_horizontal = ((positive_horizontal << 1) | 1) & all_bits
+        negative_horizontal = (negative_horizontal << 1) & all_bits
+        positive_vertical = negative_horizontal | (~(vertical_changes | positive_horizontal) & all_bits)
+        negative_vertical = positive_horizontal & vertical_changes
+
+    return distance
+
+
+class StudentNameIndex:
+    """
+    Case-insensitive prefix trie and trigram index over student names.
+
+    Autocomplete walks the trie to the prefix node and collects names below it, so its cost depends on the
+    prefix and the number of results, not on the number of students. Fuzzy search only compares the query
+    with the names found under its rarest trigrams and ranks them by edit distance.
+    """
+
+    def __init__(self, names=()):
+        """
+        :param names: Initial student names
+        """
+        # Nested dicts: character -> child node. NAMES_KEY -> set of the names ending at the node
+        self.trie = dict()
+        # Trigram -> set of names containing it
+        self.names_by_trigram = dict()
+
+        for name in names:
+            self.add_name(name)
+
+    def add_name(self, name):
+        """
+        Adds a name to the index.
+        :param name: Student name
+        :return: None
+        """
+        node = self.trie
+
+        for character in name.casefold():
+            node = node.setdefault(character, dict())
+
+        node.setdefault(NAMES_KEY, set()).add(name)
+
+        for trigram in get_trigrams(name):
+            self.names_by_trigram.setdefault(trigram, set()).add(name)
+
+    def remove_name(self, name):
+        """
+        Removes a name from the index. Trie branches and trigrams without names are removed.
+        :param name: Student name
+        :return: None
+        """
+        folded_name = name.casefold()
+        path = [self.trie]
+
+        for character in folded_name:
+            node = path[-1].get(character)
+
+            if node is None:
+                return
+
+            path.append(node)
+
+        names = path[-1].get(NAMES_KEY)
+
+        if names is None or name not in names:
+            return
+
+        names.discard(name)
+
+        if not names:
+            del path[-1][NAMES_KEY]
+
+        # Remove empty nodes from the end of the name back to the root
+        for depth in range(len(folded_name), 0, -1):
+            if path[depth]:
+                break
+
+            del path[depth - 1][folded_name[depth - 1]]
+
+        for trigram in get_trigrams(name):
+            trigram_names = self.names_by_trigram.get(trigram)
+
+            if trigram_names is not None:
+                trigram_names.discard(name)
+
+                if not trigram_names:
+                    del self.names_by_trigram[trigram]
+
+    def complete_name(self, prefix, limit=10):
+        """
+        Returns names starting with a prefix (case-insensitive), shortest names first.
+        :param prefix: Beginning of a student name
+        :param limit: Maximum number of names
+        :return: list (student names)
+        """
+        node = self.trie
+
+        for character in prefix.casefold():
+            node = node.get(character)
+
+            if node is None:
+                return []
+
+        # Breadth-first walk, so shorter completions are found first and the walk stops at the limit
+        completions = []
+        nodes = [node]
+
+        while nodes and len(completions) < limit:
+            next_nodes = []
+
+            for node in nodes:
+                for character, child in node.items():
+                    if character == NAMES_KEY:
+                        completions.extend(sorted(child))
+                    else:
+                        next_nodes.append(child)
+
+            nodes = next_nodes
+
+        return completions[:limit]
+
+    def find_similar_names(self, query, max_distance=2, limit=10):
+        """
+        Returns names within an edit distance of the query (case-insensitive), closest names first.
+        :param query: Possibly misspelled student name
+        :param max_distance: Largest accepted number of changed, inserted or removed characters
+        :param limit: Maximum number of names
+        :return: list of (name, edit distance)
+        """
+        # Every edit changes at most 3 trigrams, so a name within max_distance shares all but 3 * max_distance
+        # query trigrams and is found under any 3 * max_distance + 1 of them. The rarest ones give the fewest names.
+        # Like before, names sharing no trigram with the query at all are not found
+        query_trigrams = get_trigrams(query)
+        trigram_names = sorted((self.names_by_trigram.get(trigram, ()) for trigram in query_trigrams), key=len)
+        candidate_names = set().union(*trigram_names[:3 * max_distance + 1])
+        folded_query = query.casefold()
+        query_masks = get_character_masks(folded_query)
+        matches = []
+
+        for name in candidate_names:
+            folded_name = name.casefold()
+
+            if abs(len(folded_name) - len(folded_query)) > max_distance:
+                continue
+
+            distance = get_pattern_distance(folded_query, query_masks, folded_name)
+
+            if distance <= max_distance:
+                # Names with the same distance are ranked by the number of shared trigrams, then by name
+                matches.append((distance, -len(get_trigrams(name) & query_trigrams), name))
+
+        return [(name, distance) for distance, negative_shared_count, name in sorted(matches)[:limit]]
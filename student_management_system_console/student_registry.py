@@ -0,0 +1,215 @@
+from student_grade_statistics import GradeStatistics
+from student_name_index import StudentNameIndex
+
+
+class StudentRegistry:
+    """
+    Student records indexed by name.
+
+    Each record is a dictionary with keys: name, age, grade, and subjects. Records are kept in a dictionary
+    keyed by name (case-folded if case_insensitive is True), so adding, searching, deleting and renaming
+    a student costs O(1) instead of a scan over all students. Iteration returns the records in insertion order.
+    An inverted index from subject to the keys of the enrolled students answers enrollment queries
+    without walking the subjects of every student, grade_statistics keeps the grade aggregates
+    and name_index answers prefix and fuzzy name searches.
+    """
+
+    def __init__(self, students=(), case_insensitive=False):
+        """
+        :param students: Initial student records with unique names.
+        :param case_insensitive: Treat names which differ only in letter case as the same student.
+        """
+        self.case_insensitive = case_insensitive
+        self.records = dict()
+        # Subject -> keys of the enrolled students (a dict is used as an insertion-ordered set)
+        self.students_by_subject = dict()
+        self.grade_statistics = GradeStatistics()
+        self.name_index = StudentNameIndex()
+
+        for student in students:
+            self.add(student)
+
+    def make_key(self, name):
+        """
+        Returns the dictionary key for a student name.
+        :param name: Student name
+        :return: str (key)
+        """
+        return name.casefold() if self.case_insensitive else name
+
+    def pack_record(self, student):
+        """
+        Converts a student record to the stored form. Records are stored as they are; subclasses may store them
+        in a more compact form.
+        :param student: Student record (dict with keys: name, age, grade, and subjects)
+        :return: Stored record
+        """
+        return student
+
+    def unpack_record(self, stored_record):
+        """
+        Converts a stored record back to a student record.
+        :param stored_record: Record as returned by pack_record
+        :return: dict (student record)
+        """
+        return stored_record
+
+    def __iter__(self):
+        return map(self.unpack_record, self.records.values())
+
+    def __len__(self):
+        return len(self.records)
+
+    def __contains__(self, name):
+        return self.make_key(name) in self.records
+
+    def get(self, name):
+        """
+        Returns the record of a student.
+        :param name: Student name
+        :return: dict (student record) or None if the student is not found
+        """
+        stored_record = self.records.get(self.make_key(name))
+
+        return None if stored_record is None else self.unpack_record(stored_record)
+
+    def add(self, student):
+        """
+        Adds a student record, unless a student with the same name already exists.
+        :param student: Student record (dict with keys: name, age, grade, and subjects)
+        :return: bool (True if the student is added)
+        """
+        key = self.make_key(student["name"])
+
+        if key in self.records:
+            return False
+
+        self.records[key] = self.pack_record(student)
+        # Index the values as they are stored, since pack_record may normalize them
+        student = self.unpack_record(self.records[key])
+        self.index_subjects(key, student["subjects"])
+        self.grade_statistics.add_grade(student["name"], student["grade"])
+        self.name_index.add_name(student["name"])
+        return True
+
+    def remove(self, name):
+        """
+        Removes the record of a student.
+        :param name: Student name
+        :return: dict (removed record) or None if the student is not found
+        """
+        key = self.make_key(name)
+        stored_record = self.records.pop(key, None)
+
+        if stored_record is None:
+            return None
+
+        student = self.unpack_record(stored_record)
+        self.unindex_subjects(key, student["subjects"])
+        self.grade_statistics.remove_grade(student["name"], student["grade"])
+        self.name_index.remove_name(student["name"])
+
+        return student
+
+    def update(self, name, changes):
+        """
+        Updates the fields of a student record. A changed name must not belong to another student.
+        :param name: Current student name
+        :param changes: dict with the changed fields (name, age, grade, subjects)
+        :return: bool (True if the student is updated)
+        """
+        key = self.make_key(name)
+        stored_record = self.records.get(key)
+
+        if stored_record is None:
+            return False
+
+        student = self.unpack_record(stored_record)
+
+        new_key = self.make_key(changes["name"]) if "name" in changes else key
+
+        if new_key != key and new_key in self.records:
+            return False
+
+        self.unindex_subjects(key, student["subjects"])
+        self.grade_statistics.remove_grade(student["name"], student["grade"])
+        self.name_index.remove_name(student["name"])
+        student.update(changes)
+
+        if new_key != key:
+            del self.records[key]
+
+        self.records[new_key] = self.pack_record(student)
+        student = self.unpack_record(self.records[new_key])
+
+        self.index_subjects(new_key, student["subjects"])
+        self.grade_statistics.add_grade(student["name"], student["grade"])
+        self.name_index.add_name(student["name"])
+
+        return True
+
+    def index_subjects(self, key, subjects):
+        """
+        Adds a student to the subject index.
+        :param key: Student key
+        :param subjects: list (subjects of the student)
+        :return: None
+        """
+        for subject in subjects:
+            self.students_by_subject.setdefault(subject, dict())[key] = None
+
+    def unindex_subjects(self, key, subjects):
+        """
+        Removes a student from the subject index. Subjects without students are removed.
+        :param key: Student key
+        :param subjects: list (subjects of the student)
+        :return: None
+        """
+        for subject in subjects:
+            enrolled_keys = self.students_by_subject.get(subject)
+
+            if enrolled_keys is not None:
+                enrolled_keys.pop(key, None)
+
+                if not enrolled_keys:
+                    del self.students_by_subject[subject]
+
+    def get_students_by_subject(self, subject):
+        """
+        Returns the names of all students enrolled in a subject.
+        :param subject: Subject name
+        :return: list (student names)
+        """
+        return [self.unpack_record(self.records[key])["name"] for key in self.students_by_subject.get(subject, ())]
+
+    def count_students_in_subject(self, subject):
+        """
+        Returns the number of students enrolled in a subject.
+        :param subject: Subject name
+        :return: int (number of students)
+        """
+        return len(self.students_by_subject.get(subject, ()))
+
+    def get_subject_counts(self):
+        """
+        Returns the number of enrolled students per subject, starting with the most popular subject.
+        :return: list of (subject, number of students)
+        """
+        subject_counts = [(subject, len(keys)) for subject, keys in self.students_by_subject.items()]
+
+        return sorted(subject_counts, key=lambda subject_count: subject_count[1], reverse=True)
+
+    def get_students_in_all_subjects(self, subjects):
+        """
+        Returns the names of the students enrolled in all given subjects.
+        The smallest subject is intersected with the others, so the cost depends on its size only.
+        :param subjects: list (subject names)
+        :return: list (student names)
+        """
+        enrolled_key_sets = sorted((self.students_by_subject.get(subject, dict()) for subject in subjects), key=len)
+
+        if not enrolled_key_sets:
+            return []
+
+        return [self.unpack_record(self.records[key])["name"] for key in enrolled_key_sets[0]
+                if all(key in enrolled_keys for enrolled_keys in enrolled_key_sets[1:])]
@@ -0,0 +1,215 @@
+import argparse
+import asyncio
+import json
+
+from student_validations import *
+from student_registry import StudentRegistry
+from student_compact_registry import CompactStudentRegistry
+from student_sqlite_registry import SQLiteStudentRegistry
+from student_storage import validate_student_row
+from student_formatter import filter_students, validate_grade_range
+from student_management_system_console import add_student, update_student_fields, delete_student
+from student_management_system_console import suggest_student_names
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_LIST_LIMIT = 100
+INVALID_REQUEST_MESSAGE = "Request must be a JSON object with a known operation. Try again. "
+INVALID_LIST_RANGE_MESSAGE = "Offset must be zero or positive and limit must be positive. Try again. "
+
+
+class StudentServer:
+    """
+    Local TCP service for the student registry, so that several users can work with the same students.
+
+    Every request and response is one JSON object per line, e.g. {"operation": "add", "name": "Ann", "age": 20}.
+    All requests run on one event loop, and every operation reads and changes the registry without awaiting
+    in between, so checking that a name is free and adding the student cannot be interleaved with another
+    request. Responses are serialized before the next await too, so readers never see a half-applied change.
+    """
+
+    def __init__(self, students):
+        """
+        :param students: StudentRegistry (or another registry with the same interface) shared by all clients
+        """
+        self.students = students
+        self.operations = {
+            "add": self.add,
+            "update": self.update,
+            "delete": self.delete,
+            "search": self.search,
+            "list": self.list
+        }
+
+    def add(self, request):
+        """
+        Validates and adds a student: {"operation": "add", "name": ..., "age": ..., "grade": ..., "subjects": ...}
+        :param request: dict (request)
+        :return: dict (response)
+        """
+        student, message = validate_student_row(request)
+
+        if student is None:
+            return {"ok": False, "message": message}
+
+        self.students, message = add_student(self.students, student["name"], student["age"], student["grade"],
+                                             student["subjects"])
+
+        if message == STUDENT_ALREADY_EXISTS_MESSAGE:
+            return {"ok": False, "message": message}
+
+        return {"ok": True, "message": f"{student['name']} {message}"}
+
+    def update(self, request):
+        """
+        Updates a student: {"operation": "update", "name": ..., "new_name": ..., "age": ..., ...}
+        :param request: dict (request)
+        :return: dict (response)
+        """
+        changes = {field: request[field] for field in ("age", "grade", "subjects") if field in request}
+
+        if "new_name" in request:
+            changes["name"] = request["new_name"]
+
+        self.students, message = update_student_fields(self.students, str(request.get("name", "")), **changes)
+
+        return {"ok": message == STUDENT_UPDATED_MESSAGE, "message": message}
+
+    def delete(self, request):
+        """
+        Deletes a student: {"operation": "delete", "name": ...}
+        :param request: dict (request)
+        :return: dict (response)
+        """
+        self.students, message = delete_student(self.students, str(request.get("name", "")))
+
+        return {"ok": message != STUDENT_NOT_FOUND, "message": message}
+
+    def search(self, request):
+        """
+        Returns a student, or suggested names if it is not found: {"operation": "search", "name": ...}
+        :param request: dict (request)
+        :return: dict (response)
+        """
+        name = str(request.get("name", ""))
+        student = self.students.get(name)
+
+        if student is None:
+            return {"ok": False, "message": STUDENT_NOT_FOUND,
+                    "suggestions": suggest_student_names(self.students, name)}
+
+        return {"ok": True, "student": student}
+
+    def list(self, request):
+        """
+        Returns a page of students: {"operation": "list", "grades": "3.50-6.00", "offset": 0, "limit": 100}
+        :param request: dict (request)
+        :return: dict (response)
+        """
+        min_grade, max_grade, message = validate_grade_range(str(request.get("grades", "")))
+
+        if min_grade == INVALID_GRADE_VALUE:
+            return {"ok": False, "message": message}
+
+        offset = request.get("offset", 0)
+        limit = request.get("limit", DEFAULT_LIST_LIMIT)
+
+        if not isinstance(offset, int) or not isinstance(limit, int) or offset < 0 or limit <= 0:
+            return {"ok": False, "message": INVALID_LIST_RANGE_MESSAGE}
+
+        listed_students = []
+
+        for position, student in enumerate(filter_students(self.students, min_grade, max_grade)):
+            if position >= offset + limit:
+                break
+            if position >= offset:
+                listed_students.append(student)
+
+        return {"ok": True, "students": listed_students, "count": len(self.students)}
+
+    def handle_request(self, request_line):
+        """
+        Runs one request. The registry is used without awaiting, so the request is not interleaved with others.
+        :param request_line: bytes (one JSON line)
+        :return: dict (response)
+        """
+        try:
+            request = json.loads(request_line)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return {"ok": False, "message": INVALID_REQUEST_MESSAGE}
+
+        operation = self.operations.get(request.get("operation")) if isinstance(request, dict) else None
+
+        if operation is None:
+            return {"ok": False, "message": INVALID_REQUEST_MESSAGE}
+
+        try:
+            return operation(request)
+        except (TypeError, AttributeError, ValueError):
+            # A field with an unexpected type fails only this request, the connection stays open
+            return {"ok": False, "message": INVALID_REQUEST_MESSAGE}
+
+    async def handle_client(self, reader, writer):
+        """
+        Serves the requests of one client until it disconnects.
+        :param reader: asyncio.StreamReader
+        :param writer: asyncio.StreamWriter
+        :return: None
+        """
+        try:
+            while request_line := await reader.readline():
+                response = self.handle_request(request_line)
+                writer.write(json.dumps(response).encode("utf-8") + b"\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        """
+        Starts listening. Use port 0 to get a free port.
+        :param host: Host to listen on
+        :param port: Port to listen on
+        :return: asyncio.Server
+        """
+        return await asyncio.start_server(self.handle_client, host, port)
+
+
+async def serve(students, host, port):
+    """
+    Serves the registry until the process is stopped.
+    :param students: StudentRegistry shared by all clients
+    :param host: Host to listen on
+    :param port: Port to listen on
+    :return: None
+    """
+    server = await StudentServer(students).start(host, port)
+    print(f"Serving students on {', '.join(str(socket.getsockname()) for socket in server.sockets)}")
+
+    async with server:
+        await server.serve_forever()
+
+
+if __name__ == "__main__":
+    argument_parser = argparse.ArgumentParser(description="Student Management System server")
+    argument_parser.add_argument("--host", default=DEFAULT_HOST, help="host to listen on")
+    argument_parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="port to listen on")
+    argument_parser.add_argument("--db", help="store the students in this SQLite database file")
+    argument_parser.add_argument("--compact", action="store_true", help="keep the students in a compact form")
+    arguments = argument_parser.parse_args()
+
+    if arguments.db:
+        registry = SQLiteStudentRegistry(arguments.db)
+    elif arguments.compact:
+        registry = CompactStudentRegistry()
+    else:
+        registry = StudentRegistry()
+
+    try:
+        asyncio.run(serve(registry, arguments.host, arguments.port))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if arguments.db:
+            registry.close()
@@ -0,0 +1,295 @@
+import sqlite3
+
+from student_grade_statistics import GradeStatistics
+from student_name_index import StudentNameIndex
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS students (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    name_key TEXT NOT NULL UNIQUE,
+    age INTEGER,
+    grade REAL
+);
+CREATE TABLE IF NOT EXISTS subjects (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS enrollments (
+    student_id INTEGER NOT NULL REFERENCES students (id) ON DELETE CASCADE,
+    subject_id INTEGER NOT NULL REFERENCES subjects (id),
+    position INTEGER NOT NULL,
+    PRIMARY KEY (student_id, subject_id)
+);
+CREATE INDEX IF NOT EXISTS enrollments_subject_index ON enrollments (subject_id);
+"""
+
+
+class SQLiteStudentRegistry:
+    """
+    Student records stored in SQLite, with the same interface as StudentRegistry.
+
+    Students, subjects and enrollments are separate tables. Names and subjects are looked up through indexes,
+    so finding a student or all students taking a subject does not scan the records, and every change
+    runs in its own transaction. Records are returned as new dictionaries; change them with update().
+    The grade aggregates and the name search index are built once when the database is opened and then kept
+    up to date in grade_statistics and name_index.
+    """
+
+    def __init__(self, database_path, case_insensitive=False):
+        """
+        :param database_path: Path to the SQLite database file (created if it does not exist) or ":memory:"
+        :param case_insensitive: Treat names which differ only in letter case as the same student.
+        """
+        self.case_insensitive = case_insensitive
+        self.connection = sqlite3.connect(database_path)
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.executescript(SCHEMA)
+        self.grade_statistics = GradeStatistics()
+        self.name_index = StudentNameIndex()
+
+        for name, grade in self.connection.execute("SELECT name, grade FROM students"):
+            self.grade_statistics.add_grade(name, "" if grade is None else grade)
+            self.name_index.add_name(name)
+
+    def make_key(self, name):
+        """
+        Returns the unique key for a student name.
+        :param name: Student name
+        :return: str (key)
+        """
+        return name.casefold() if self.case_insensitive else name
+
+    def close(self):
+        """
+        Closes the database connection.
+        :return: None
+        """
+        self.connection.close()
+
+    def get_subject_id(self, subject):
+        """
+        Returns the ID of a subject, inserting the subject if it is new. Must be called inside a transaction.
+        :param subject: Subject name
+        :return: int (subject ID)
+        """
+        self.connection.execute("INSERT OR IGNORE INTO subjects (name) VALUES (?)", (subject,))
+        return self.connection.execute("SELECT id FROM subjects WHERE name = ?", (subject,)).fetchone()[0]
+
+    def set_subjects(self, student_id, subjects):
+        """
+        Replaces the enrollments of a student. Must be called inside a transaction.
+        :param student_id: Student ID
+        :param subjects: list (subject names)
+        :return: None
+        """
+        self.connection.execute("DELETE FROM enrollments WHERE student_id = ?", (student_id,))
+        self.connection.executemany(
+            "INSERT OR IGNORE INTO enrollments (student_id, subject_id, position) VALUES (?, ?, ?)",
+            [(student_id, self.get_subject_id(subject), position) for position, subject in enumerate(subjects)])
+
+    def get_student_subjects(self, student_id):
+        """
+        Returns the subjects of a student in their original order.
+        :param student_id: Student ID
+        :return: list (subject names)
+        """
+        rows = self.connection.execute(
+            "SELECT subjects.name FROM enrollments JOIN subjects ON subjects.id = enrollments.subject_id "
+            "WHERE enrollments.student_id = ? ORDER BY enrollments.position", (student_id,))
+
+        return [row[0] for row in rows]
+
+    def make_record(self, student_id, name, age, grade, subjects):
+        """
+        Builds a student record. Empty age and grade are stored as NULL and returned as empty strings.
+        :param student_id: Student ID (not part of the record)
+        :param name: Student name
+        :param age: Student age or None
+        :param grade: Student grade or None
+        :param subjects: list (subject names)
+        :return: dict (student record)
+        """
+        return {
+            "name": name,
+            "age": "" if age is None else age,
+            "grade": "" if grade is None else grade,
+            "subjects": subjects
+        }
+
+    def __iter__(self):
+        # Students and their subjects are read with one ordered join and grouped while streaming
+        rows = self.connection.execute(
+            "SELECT students.id, students.name, students.age, students.grade, subjects.name "
+            "FROM students LEFT JOIN enrollments ON enrollments.student_id = students.id "
+            "LEFT JOIN subjects ON subjects.id = enrollments.subject_id "
+            "ORDER BY students.id, enrollments.position")
+        current_row = None
+        current_subjects = []
+
+        for student_id, name, age, grade, subject in rows:
+            if current_row is not None and current_row[0] != student_id:
+                yield self.make_record(*current_row, current_subjects)
+                current_subjects = []
+
+            current_row = (student_id, name, age, grade)
+
+            if subject is not None:
+                current_subjects.append(subject)
+
+        if current_row is not None:
+            yield self.make_record(*current_row, current_subjects)
+
+    def __len__(self):
+        return self.connection.execute("SELECT COUNT(*) FROM students").fetchone()[0]
+
+    def __contains__(self, name):
+        return self.connection.execute("SELECT 1 FROM students WHERE name_key = ?",
+                                       (self.make_key(name),)).fetchone() is not None
+
+    def get(self, name):
+        """
+        Returns the record of a student.
+        :param name: Student name
+        :return: dict (student record) or None if the student is not found
+        """
+        row = self.connection.execute("SELECT id, name, age, grade FROM students WHERE name_key = ?",
+                                      (self.make_key(name),)).fetchone()
+
+        if row is None:
+            return None
+
+        return self.make_record(*row, self.get_student_subjects(row[0]))
+
+    def add(self, student):
+        """
+        Adds a student record, unless a student with the same name already exists.
+        :param student: Student record (dict with keys: name, age, grade, and subjects)
+        :return: bool (True if the student is added)
+        """
+        try:
+            with self.connection:
+                cursor = self.connection.execute(
+                    "INSERT INTO students (name, name_key, age, grade) VALUES (?, ?, ?, ?)",
+                    (student["name"], self.make_key(student["name"]),
+                     student["age"] if student["age"] != "" else None,
+                     student["grade"] if student["grade"] != "" else None))
+                self.set_subjects(cursor.lastrowid, student["subjects"])
+        except sqlite3.IntegrityError:
+            return False
+
+        self.grade_statistics.add_grade(student["name"], student["grade"])
+        self.name_index.add_name(student["name"])
+        return True
+
+    def remove(self, name):
+        """
+        Removes the record of a student. Enrollments are removed by the foreign key cascade.
+        :param name: Student name
+        :return: dict (removed record) or None if the student is not found
+        """
+        student = self.get(name)
+
+        if student is not None:
+            with self.connection:
+                self.connection.execute("DELETE FROM students WHERE name_key = ?", (self.make_key(name),))
+
+            self.grade_statistics.remove_grade(student["name"], student["grade"])
+            self.name_index.remove_name(student["name"])
+
+        return student
+
+    def update(self, name, changes):
+        """
+        Updates the fields of a student record in one transaction. A changed name must not belong to another student.
+        :param name: Current student name
+        :param changes: dict with the changed fields (name, age, grade, subjects)
+        :return: bool (True if the student is updated)
+        """
+        row = self.connection.execute("SELECT id, name, grade FROM students WHERE name_key = ?",
+                                      (self.make_key(name),)).fetchone()
+
+        if row is None:
+            return False
+
+        student_id, old_name, old_grade = row
+
+        try:
+            with self.connection:
+                if "name" in changes:
+                    self.connection.execute("UPDATE students SET name = ?, name_key = ? WHERE id = ?",
+                                            (changes["name"], self.make_key(changes["name"]), student_id))
+                if "age" in changes:
+                    self.connection.execute("UPDATE students SET age = ? WHERE id = ?",
+                                            (changes["age"] if changes["age"] != "" else None, student_id))
+                if "grade" in changes:
+                    self.connection.execute("UPDATE students SET grade = ? WHERE id = ?",
+                                            (changes["grade"] if changes["grade"] != "" else None, student_id))
+                if "subjects" in changes:
+                    self.set_subjects(student_id, changes["subjects"])
+        except sqlite3.IntegrityError:
+            # The new name belongs to another student. The transaction is rolled back
+            return False
+
+        if "name" in changes or "grade" in changes:
+            self.grade_statistics.remove_grade(old_name, "" if old_grade is None else old_grade)
+            self.grade_statistics.add_grade(changes.get("name", old_name),
+                                            changes.get("grade", "" if old_grade is None else old_grade))
+
+        if "name" in changes:
+            self.name_index.remove_name(old_name)
+            self.name_index.add_name(changes["name"])
+
+        return True
+
+    def get_students_by_subject(self, subject):
+        """
+        Returns the names of all students enrolled in a subject, using the subject index.
+        :param subject: Subject name
+        :return: list (student names)
+        """
+        rows = self.connection.execute(
+            "SELECT students.name FROM subjects JOIN enrollments ON enrollments.subject_id = subjects.id "
+            "JOIN students ON students.id = enrollments.student_id WHERE subjects.name = ? ORDER BY students.id",
+            (subject,))
+
+        return [row[0] for row in rows]
+
+    def count_students_in_subject(self, subject):
+        """
+        Returns the number of students enrolled in a subject.
+        :param subject: Subject name
+        :return: int (number of students)
+        """
+        return self.connection.execute(
+            "SELECT COUNT(*) FROM subjects JOIN enrollments ON enrollments.subject_id = subjects.id "
+            "WHERE subjects.name = ?", (subject,)).fetchone()[0]
+
+    def get_subject_counts(self):
+        """
+        Returns the number of enrolled students per subject, starting with the most popular subject.
+        :return: list of (subject, number of students)
+        """
+        return self.connection.execute(
+            "SELECT subjects.name, COUNT(*) AS students_count FROM subjects "
+            "JOIN enrollments ON enrollments.subject_id = subjects.id "
+            "GROUP BY subjects.id ORDER BY students_count DESC").fetchall()
+
+    def get_students_in_all_subjects(self, subjects):
+        """
+        Returns the names of the students enrolled in all given subjects.
+        :param subjects: list (subject names)
+        :return: list (student names)
+        """
+        if not subjects:
+            return []
+
+        unique_subjects = list(dict.fromkeys(subjects))
+        placeholders = ", ".join("?" for _ in unique_subjects)
+        rows = self.connection.execute(
+            "SELECT students.name FROM subjects JOIN enrollments ON enrollments.subject_id = subjects.id "
+            f"JOIN students ON students.id = enrollments.student_id WHERE subjects.name IN ({placeholders}) "
+            "GROUP BY students.id HAVING COUNT(*) = ? ORDER BY students.id", (*unique_subjects, len(unique_subjects)))
+
+        return [row[0] for row in rows]
@@ -0,0 +1,207 @@
+import csv
+import json
+import os
+import tempfile
+
+from student_validations import *
+
+CSV_FIELDS = ("name", "age", "grade", "subjects")
+FILE_BUFFER_SIZE = 1024 * 1024
+INVALID_FILE_FORMAT_MESSAGE = "File must have a .jsonl, .json or .csv extension. Try again. "
+FILE_NOT_FOUND_MESSAGE = "File is not found. Try again. "
+PATH_NOT_FOUND_MESSAGE = "Path does not exist. Try again. "
+INVALID_ROW_MESSAGE = "Row is not a valid student record. "
+# Key of the optional first JSON line of a snapshot, which holds the snapshot metadata instead of a student
+SNAPSHOT_METADATA_KEY = "_snapshot"
+
+
+def get_file_format(file_path):
+    """
+    Returns the file format from the file extension.
+    :param file_path: Path to the students file
+    :return: str (jsonl, csv or empty string for unknown extensions)
+    """
+    extension = os.path.splitext(file_path)[1].lower()
+
+    if extension in (".jsonl", ".json"):
+        return "jsonl"
+    elif extension == ".csv":
+        return "csv"
+    else:
+        return ""
+
+
+def save_students(students, file_path, metadata=None):
+    """
+    Saves all student records as JSON lines or CSV, depending on the file extension.
+    Records are written to a temporary file through a buffered writer, which then replaces the target file,
+    so an interrupted save never leaves a partially written file behind.
+    :param students: StudentRegistry with all students
+    :param file_path: Path to the .jsonl, .json or .csv file
+    :param metadata: Optional dict written as the first JSON line (snapshots only, ignored for CSV)
+    :return: (int) Number of saved students, (str) message
+    """
+    file_format = get_file_format(file_path)
+
+    if not file_format:
+        return 0, INVALID_FILE_FORMAT_MESSAGE
+
+    directory = os.path.dirname(os.path.abspath(file_path))
+
+    if not os.path.isdir(directory):
+        return 0, PATH_NOT_FOUND_MESSAGE
+
+    saved_count = 0
+    temporary_file = tempfile.NamedTemporaryFile(mode='w', encoding='utf-8', newline='', dir=directory,
+                                                 prefix=".students-", suffix=".tmp", delete=False,
+                                                 buffering=FILE_BUFFER_SIZE)
+
+    try:
+        with temporary_file:
+            if file_format == "csv":
+                writer = csv.writer(temporary_file)
+                writer.writerow(CSV_FIELDS)
+
+                for student in students:
+                    writer.writerow((student["name"], student["age"], student["grade"],
+                                     ", ".join(student["subjects"])))
+                    saved_count += 1
+            else:
+                if metadata is not None:
+                    temporary_file.write(json.dumps({SNAPSHOT_METADATA_KEY: metadata}))
+                    temporary_file.write("\n")
+
+                for student in students:
+                    temporary_file.write(json.dumps({field: student[field] for field in CSV_FIELDS}))
+                    temporary_file.write("\n")
+                    saved_count += 1
+
+            temporary_file.flush()
+            os.fsync(temporary_file.fileno())
+
+        os.replace(temporary_file.name, file_path)
+
+    except BaseException:
+        os.remove(temporary_file.name)
+        raise
+
+    return saved_count, f"{saved_count} students saved to {file_path}."
+
+
+def iter_student_rows(file_path, file_format):
+    """
+    Reads student rows one at a time, so that the whole file is never held in memory.
+    :param file_path: Path to the .jsonl, .json or .csv file
+    :param file_format: jsonl or csv
+    :return: generator of (dict) raw rows, None for lines which are not valid JSON
+    """
+    with open(file_path, mode='r', encoding='utf-8', newline='', buffering=FILE_BUFFER_SIZE) as students_file:
+        if file_format == "csv":
+            yield from csv.DictReader(students_file)
+        else:
+            for line in students_file:
+                if not line.strip():
+                    continue
+
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    yield None
+
+
+def get_row_value(row, field):
+    """
+    Returns a row value as a string, as if it was entered in the console.
+    :param row: dict (raw row)
+    :param field: Field name
+    :return: str (value or empty string for missing values)
+    """
+    value = row.get(field)
+
+    return "" if value is None else str(value)
+
+
+def validate_student_row(row):
+    """
+    Validates a raw student row with the same validation functions as the console input.
+    :param row: dict with name, age, grade and subjects (subjects as a comma-separated string or a list)
+    :return: dict (validated student record or None), str (error message)
+    """
+    if not isinstance(row, dict):
+        return None, INVALID_ROW_MESSAGE
+
+    name = validate_student_name(get_row_value(row, "name"), "add")
+
+    if name == INVALID_NAME_VALUE:
+        return None, INVALID_NAME_VALUE
+
+    age, message = validate_student_age(get_row_value(row, "age"))
+
+    if age == INVALID_AGE_VALUE:
+        return None, message
+
+    grade, message = validate_student_grade(get_row_value(row, "grade"))
+
+    if grade == INVALID_GRADE_VALUE:
+        return None, message
+
+    subjects = row.get("subjects") or ""
+
+    if isinstance(subjects, list) and all(isinstance(subject, str) for subject in subjects):
+        subjects = ",".join(subjects)
+
+    if not isinstance(subjects, str):
+        return None, INVALID_ROW_MESSAGE
+
+    return {"name": name, "age": age, "grade": grade, "subjects": format_student_subjects(subjects)}, ""
+
+
+def load_students(students, file_path):
+    """
+    Imports student records from JSON lines or CSV into the registry. Rows are streamed and validated one by one.
+    Invalid rows and students which already exist are skipped.
+    :param students: StudentRegistry the students are added to
+    :param file_path: Path to the .jsonl, .json or .csv file
+    :return: (StudentRegistry) students, (str) message with the number of imported and skipped rows
+    """
+    file_format = get_file_format(file_path)
+
+    if not file_format:
+        return students, INVALID_FILE_FORMAT_MESSAGE
+
+    if not os.path.isfile(file_path):
+        return students, FILE_NOT_FOUND_MESSAGE
+
+    loaded_count = 0
+    invalid_count = 0
+    duplicate_count = 0
+
+    for row in iter_student_rows(file_path, file_format):
+        if isinstance(row, dict) and SNAPSHOT_METADATA_KEY in row:
+            continue
+
+        student, message = validate_student_row(row)
+
+        if student is None:
+            invalid_count += 1
+        elif students.add(student):
+            loaded_count += 1
+        else:
+            duplicate_count += 1
+
+    return students, f"{loaded_count} students loaded, {invalid_count} invalid and {duplicate_count} existing skipped."
+
+
+def read_snapshot_metadata(file_path):
+    """
+    Reads the metadata line of a JSON lines snapshot.
+    :param file_path: Path to the .jsonl file
+    :return: dict (metadata) or None if the file has no metadata line
+    """
+    with open(file_path, mode='r', encoding='utf-8') as students_file:
+        try:
+            first_row = json.loads(students_file.readline())
+        except json.JSONDecodeError:
+            return None
+
+    return first_row.get(SNAPSHOT_METADATA_KEY) if isinstance(first_row, dict) else None
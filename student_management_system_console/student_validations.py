@@ -0,0 +1,97 @@
+# Error codes and messages
+INVALID_NAME_VALUE = "Enter a valid student name. Name cannot be empty. Try again. "
+INVALID_AGE_VALUE = -1
+INVALID_AGE_VALUE_MESSAGE = "The age you entered is invalid. Try again. "
+INVALID_AGE_RANGE_MESSAGE = "Student age must be a positive value. Try again. "
+INVALID_GRADE_VALUE = -1
+INVALID_GRADE_VALUE_MESSAGE = "Invalid student grade. Grade must be a value between [2.00, 6.00]. Try again. "
+STUDENT_ALREADY_EXISTS_MESSAGE = "Student already exists. Try again. "
+STUDENT_NOT_FOUND = "Student is not found. Try again. "
+STUDENT_UPDATED_MESSAGE = "Student was updated."
+INVALID_UPDATE_FIELD_MESSAGE = "Only name, age, grade and subjects can be updated. Try again. "
+INVALID_SUBJECTS_MESSAGE = "Subjects must be a comma-separated text or a list of texts. Try again. "
+
+
+def validate_student_name(name, operation):
+    """
+    Validates student name. If the function is called for update of an existing student, empty value is accepted.
+    If the function is called to add, delete or search for a student with empty name, the user is prompted to try again.
+    :param name:  Student name
+    :param operation: Operation from which validation is called. Possible values are: add, update, delete, search.
+    :return: str (name or error message)
+    """
+    if (operation == "add" or operation == "delete" or operation == "search") and name.strip() == "":
+        return INVALID_NAME_VALUE
+
+    elif operation == "update" and name.strip() == "":
+        return ""
+
+    else:
+        return name
+
+
+def validate_student_age(age):
+    """
+    Prompts for student age.
+    If age is not a positive integer number the user is prompted to try again.
+    :param age: Student age.
+    :return: int (age), str (message)
+    """
+    if age == "":
+        return "", ""
+
+    else:
+        try:
+            age = int(age)
+
+        except ValueError:
+            return INVALID_AGE_VALUE, INVALID_AGE_VALUE_MESSAGE
+
+        else:
+            if age <= 0:
+                return INVALID_AGE_VALUE, INVALID_AGE_RANGE_MESSAGE
+            else:
+                return age, ""
+
+
+def validate_student_grade(grade_input):
+    """
+    Validates student grade. A valid student grade is a float number between 2.00 and 6.00.
+    :param grade_input: str
+    :return: float (grade), str (message)
+    """
+    if grade_input == "":
+        return "", ""
+
+    else:
+        try:
+            grade = float(grade_input)
+
+        except ValueError:
+            return INVALID_GRADE_VALUE, INVALID_GRADE_VALUE_MESSAGE
+
+        else:
+            if grade < 2.00 or grade > 6.00:
+                return INVALID_GRADE_VALUE, INVALID_GRADE_VALUE_MESSAGE
+
+            else:
+                return grade, ""
+
+
+def format_student_subjects(subjects):
+    """
+    Splits subjects into a list. Strips empty spaces, if any. A repeated subject is kept once, at its first
+    position, so every registry stores the same subjects (an enrollment can exist only once in SQLite).
+    :param subjects: student subjects (comma-separated)
+    :return: list (subjects)
+    """
+    if subjects == "":
+        listed_subjects = list()
+
+    else:
+        listed_subjects = subjects.split(',')
+
+        for subject_index in range(len(listed_subjects)):
+            listed_subjects[subject_index] = str(listed_subjects[subject_index]).strip()
+
+    return list(dict.fromkeys(listed_subjects))
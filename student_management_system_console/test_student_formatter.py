@@ -0,0 +1,50 @@
+import io
+import unittest
+from unittest import mock
+
+import student_formatter
+from student_formatter import write_students
+from student_registry import StudentRegistry
+
+
+class WriteStudentsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.students = StudentRegistry({"name": f"Student {number}", "age": 20, "grade": 3.0 + number % 3,
+                                         "subjects": ["Math"]} for number in range(7))
+
+    def test_page_is_formatted_after_the_prompt(self):
+        formatted_names = []
+        formatted_counts_at_prompt = []
+        write_student = student_formatter.write_student
+
+        def record_student(student, output):
+            formatted_names.append(student["name"])
+            write_student(student, output)
+
+        def next_page():
+            formatted_counts_at_prompt.append(len(formatted_names))
+            return len(formatted_counts_at_prompt) < 2
+
+        with mock.patch.object(student_formatter, "write_student", record_student):
+            written_count = write_students(self.students, io.StringIO(), page_size=3, next_page=next_page)
+
+        self.assertEqual(written_count, 6)
+        self.assertEqual(formatted_counts_at_prompt, [3, 6])
+        self.assertEqual(len(formatted_names), 6)
+
+    def test_no_prompt_after_the_last_page(self):
+        next_page = mock.Mock(return_value=True)
+
+        self.assertEqual(write_students(self.students, io.StringIO(), page_size=7, next_page=next_page), 7)
+        next_page.assert_not_called()
+
+    def test_grade_filter(self):
+        output = io.StringIO()
+
+        self.assertEqual(write_students(self.students, output, min_grade=4.0, max_grade=4.0), 2)
+        self.assertEqual(output.getvalue().count("Student name:"), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
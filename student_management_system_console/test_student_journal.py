@@ -0,0 +1,113 @@
+import os
+import tempfile
+import unittest
+
+import student_journal
+from student_journal import StudentJournal, get_journal_paths, NOTHING_TO_UNDO_MESSAGE
+from student_registry import StudentRegistry
+
+
+def make_student(name, grade=5.0):
+    """
+    Creates a student record for the tests.
+    :param name: Student name
+    :param grade: Student grade
+    :return: dict (student record)
+    """
+    return {"name": name, "age": 20, "grade": grade, "subjects": ["Math"]}
+
+
+class StudentJournalTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.base_path = os.path.join(self.directory.name, "students")
+        self.snapshot_path, self.journal_path = get_journal_paths(self.base_path)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def open_journal(self):
+        """
+        Opens the journal like the console does on start.
+        :return: StudentJournal
+        """
+        return StudentJournal(StudentRegistry(), self.base_path)
+
+    def test_changes_after_torn_last_line_survive_restart(self):
+        students = self.open_journal()
+        students.add(make_student("Ann"))
+        students.close()
+
+        # A crash while writing leaves a partial line without a line end
+        with open(self.journal_path, mode='a', encoding='utf-8') as journal_file:
+            journal_file.write('{"operation": "add", "stud')
+
+        students = self.open_journal()
+        students.add(make_student("Bob"))
+        students.add(make_student("Cid"))
+        students.close()
+
+        students = self.open_journal()
+        self.assertEqual(sorted(student["name"] for student in students), ["Ann", "Bob", "Cid"])
+        students.close()
+
+    def test_damaged_middle_line_is_skipped(self):
+        students = self.open_journal()
+        students.add(make_student("Ann"))
+        students.close()
+
+        with open(self.journal_path, mode='a', encoding='utf-8') as journal_file:
+            journal_file.write("not json\n")
+
+        students = self.open_journal()
+        students.add(make_student("Bob"))
+        students.close()
+
+        students = self.open_journal()
+        self.assertEqual(sorted(student["name"] for student in students), ["Ann", "Bob"])
+        students.close()
+
+    def test_undo_and_redo_are_journaled(self):
+        students = self.open_journal()
+        students.add(make_student("Ann"))
+        students.update("Ann", {"grade": 3.0})
+        students.undo()
+        self.assertEqual(students.get("Ann")["grade"], 5.0)
+        students.redo()
+        students.undo()
+        students.undo()
+        self.assertNotIn("Ann", students)
+        self.assertEqual(students.undo(), NOTHING_TO_UNDO_MESSAGE)
+        students.redo()
+        students.close()
+
+        students = self.open_journal()
+        self.assertEqual(students.get("Ann")["grade"], 5.0)
+        students.close()
+
+    def test_compaction_keeps_all_students(self):
+        compact_min_bytes = student_journal.COMPACT_MIN_BYTES
+        student_journal.COMPACT_MIN_BYTES = 0
+
+        try:
+            students = self.open_journal()
+
+            for number in range(20):
+                students.add(make_student(f"Student {number}"))
+
+            students.remove("Student 3")
+            students.close()
+        finally:
+            student_journal.COMPACT_MIN_BYTES = compact_min_bytes
+
+        self.assertTrue(os.path.isfile(self.snapshot_path))
+
+        students = self.open_journal()
+        self.assertEqual(len(students), 19)
+        self.assertNotIn("Student 3", students)
+        students.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,85 @@
+import random
+import unittest
+
+from student_name_index import StudentNameIndex, get_trigrams, get_character_masks, get_pattern_distance
+
+
+def get_reference_distance(first, second):
+    """
+    Returns the Levenshtein distance computed row by row, as the reference for the bit-parallel distance.
+    :param first: str
+    :param second: str
+    :return: int (edit distance)
+    """
+    previous_row = list(range(len(second) + 1))
+
+    for first_position, first_character in enumerate(first, 1):
+        current_row = [first_position]
+
+        for second_position, second_character in enumerate(second, 1):
+            current_row.append(min(previous_row[second_position] + 1,
+                                   current_row[second_position - 1] + 1,
+                                   previous_row[second_position - 1] + (first_character != second_character)))
+
+        previous_row = current_row
+
+    return previous_row[-1]
+
+
+def find_similar_names_by_scan(names, query, max_distance=2, limit=10):
+    """
+    Returns the suggestions of the user-043 algorithm without its limit of 200 candidates: every name sharing
+    a trigram with the query, ranked by edit distance, then by the number of shared trigrams, then by name.
+    :param names: list of student names
+    :param query: Possibly misspelled student name
+    :param max_distance: Largest accepted edit distance
+    :param limit: Maximum number of names
+    :return: list of (name, edit distance)
+    """
+    query_trigrams = get_trigrams(query)
+    matches = []
+
+    for name in names:
+        shared_count = len(get_trigrams(name) & query_trigrams)
+        distance = get_reference_distance(query.casefold(), name.casefold())
+
+        if shared_count and distance <= max_distance:
+            matches.append((distance, -shared_count, name))
+
+    return [(name, distance) for distance, negative_shared_count, name in sorted(matches)[:limit]]
+
+
+class StudentNameIndexTest(unittest.TestCase):
+
+    def test_pattern_distance_matches_reference(self):
+        generator = random.Random(1)
+
+        for _ in range(2000):
+            pattern = "".join(generator.choices("abc ", k=generator.randint(1, 12)))
+            text = "".join(generator.choices("abc ", k=generator.randint(0, 12)))
+
+            self.assertEqual(get_pattern_distance(pattern, get_character_masks(pattern), text),
+                             get_reference_distance(pattern, text), (pattern, text))
+
+    def test_suggestions_match_full_scan(self):
+        # Fewer than 200 names, so the user-043 algorithm considered every candidate and gave these results too
+        generator = random.Random(2)
+        names = list({"".join(generator.choices("abn ", k=generator.randint(2, 9))) for _ in range(150)})
+        name_index = StudentNameIndex(names)
+
+        for query in names[:50] + ["a", "ab", "Abna", "nab ba"]:
+            for max_distance in (1, 2, 3):
+                self.assertEqual(name_index.find_similar_names(query, max_distance),
+                                 find_similar_names_by_scan(names, query, max_distance), (query, max_distance))
+
+    def test_close_name_is_found_behind_many_candidates(self):
+        # The only change from user-043: it compared the query with the 200 names sharing the most trigrams only,
+        # so "Anna Smyth" (distance 1, 8 shared trigrams) was not suggested behind 300 names sharing 10 trigrams
+        names = [f"Anna Smith {number:03}" for number in range(300)] + ["Anna Smyth"]
+        name_index = StudentNameIndex(names)
+
+        self.assertEqual(name_index.find_similar_names("Anna Smith"), [("Anna Smyth", 1)])
+
+
+if __name__ == "__main__":
+    unittest.main()
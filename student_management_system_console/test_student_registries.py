@@ -0,0 +1,35 @@
+import unittest
+
+from student_compact_registry import CompactStudentRegistry
+from student_management_system_console import update_student_fields
+from student_registry import StudentRegistry
+from student_sqlite_registry import SQLiteStudentRegistry
+from student_storage import validate_student_row
+from student_validations import format_student_subjects
+
+
+class StudentRegistriesTest(unittest.TestCase):
+
+    def setUp(self):
+        self.registries = [StudentRegistry(), CompactStudentRegistry(), SQLiteStudentRegistry(":memory:")]
+
+    def tearDown(self):
+        self.registries[-1].close()
+
+    def test_repeated_subjects_are_kept_once(self):
+        self.assertEqual(format_student_subjects("Math, Art,Math , History, Art"), ["Math", "Art", "History"])
+
+    def test_registries_store_the_same_subjects(self):
+        student, message = validate_student_row({"name": "Ann", "age": "20", "grade": "5",
+                                                 "subjects": ["Math", "Art", "Math"]})
+
+        for registry in self.registries:
+            registry.add(dict(student))
+            registry, message = update_student_fields(registry, "Ann", subjects="Art, History, Art")
+
+            self.assertEqual(registry.get("Ann")["subjects"], ["Art", "History"], type(registry).__name__)
+            self.assertEqual(registry.count_students_in_subject("Art"), 1, type(registry).__name__)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,310 @@
+import argparse
+import contextlib
+import json
+import os
+import sys
+import time
+
+import task_manager
+from input_validations import *
+from instrumentation import *
+from task_id_allocator import TaskIdAllocator
+from task_store import TaskStore
+
+INVALID_OPERATION = -1
+INVALID_OPERATION_MESSAGE = "Unknown operation."
+INVALID_OPERATION_LINE_MESSAGE = "Operation line is not a valid JSON object."
+MISSING_OPERATION_FIELD_MESSAGE = "Operation field is missing:"
+INVALID_OPERATION_ARGUMENT_MESSAGE = "Operation argument has an invalid type or value:"
+INVALID_TASKS_FILE = -1
+TASKS_FILE_NOT_LOADED_MESSAGE = "Tasks file could not be loaded:"
+
+
+def summarize_tasks(found_tasks):
+    """
+    Converts a list of tasks to a compact result with the count and the IDs of the tasks.
+
+    Parameters:
+    found_tasks (list of dict): Tasks returned by a search, filter or sort.
+
+    Returns:
+    dict: Count and IDs of the tasks.
+    """
+    return {"count": len(found_tasks), "ids": [task["id"] for task in found_tasks]}
+
+
+def parse_status(status):
+    """
+    Converts an operation status value to the completion status used by filter_tasks_by_status.
+
+    Parameters:
+    status (bool or str): True/False or completed/pending.
+
+    Returns:
+    bool: True for completed tasks, False for pending tasks.
+    """
+    if isinstance(status, bool):
+        return status
+
+    return str(status).lower() in ("completed", "true")
+
+
+# Operation name -> function(tasks, operation, id_allocator) returning (tasks, code, message, result)
+OPERATIONS = {
+    "add_task": lambda tasks, operation, id_allocator:
+        add_task_operation(tasks, operation["task"], id_allocator),
+    "remove_task": lambda tasks, operation, id_allocator:
+        task_manager.remove_task(tasks, operation["id"], id_allocator) + (None,),
+    "update_task": lambda tasks, operation, id_allocator:
+        task_manager.update_task(tasks, operation["id"], operation["task"]) + (None,),
+    "get_task": lambda tasks, operation, id_allocator:
+        (tasks,) + get_task_result(task_manager.get_task(tasks, operation["id"])),
+    "set_task_priority": lambda tasks, operation, id_allocator:
+        task_manager.set_task_priority(tasks, operation["id"], operation["priority"]) + (None,),
+    "set_task_deadline": lambda tasks, operation, id_allocator:
+        task_manager.set_task_deadline(tasks, operation["id"], operation["deadline"]) + (None,),
+    "mark_task_as_completed": lambda tasks, operation, id_allocator:
+        task_manager.mark_task_as_completed(tasks, operation["id"]) + (None,),
+    "set_task_description": lambda tasks, operation, id_allocator:
+        task_manager.set_task_description(tasks, operation["id"], operation["description"]) + (None,),
+    "search_tasks_by_keyword": lambda tasks, operation, id_allocator:
+        (tasks, 0, "", summarize_tasks(task_manager.search_tasks_by_keyword(tasks, operation["keyword"]))),
+    "filter_tasks_by_priority": lambda tasks, operation, id_allocator:
+        (tasks,) + filter_result(task_manager.filter_tasks_by_priority(tasks, operation["priority"])),
+    "filter_tasks_by_status": lambda tasks, operation, id_allocator:
+        (tasks, 0, "",
+         summarize_tasks(task_manager.filter_tasks_by_status(tasks, parse_status(operation["status"])))),
+    "filter_tasks_by_deadline": lambda tasks, operation, id_allocator:
+        (tasks,) + filter_result(task_manager.filter_tasks_by_deadline(tasks, operation["deadline"])),
+    "count_tasks": lambda tasks, operation, id_allocator:
+        (tasks, 0, "", task_manager.count_tasks(tasks)),
+    "count_completed_tasks": lambda tasks, operation, id_allocator:
+        (tasks, 0, "", task_manager.count_completed_tasks(tasks)),
+    "count_pending_tasks": lambda tasks, operation, id_allocator:
+        (tasks, 0, "", task_manager.count_pending_tasks(tasks)),
+    "generate_task_summary": lambda tasks, operation, id_allocator:
+        (tasks, 0, "", task_manager.generate_task_summary(tasks)),
+    "sort_tasks_by_deadline": lambda tasks, operation, id_allocator:
+        (TaskStore(task_manager.sort_tasks_by_deadline(tasks)), 0, "", None),
+    "sort_tasks_by_priority": lambda tasks, operation, id_allocator:
+        (TaskStore(task_manager.sort_tasks_by_priority(tasks)), 0, "", None),
+}
+
+
+def add_task_operation(tasks, task_to_add, id_allocator):
+    """
+    Adds a task from a batch operation. Tasks without an ID get the next ID from the allocator.
+
+    Parameters:
+    tasks (list of dict): The current list of tasks.
+    task_to_add (dict): The task fields from the operation.
+    id_allocator (TaskIdAllocator): Allocator for tasks without an ID, or None.
+
+    Returns:
+    list of dict: Updated list of tasks.
+    int: Result code (0 for success).
+    str: Descriptive error code message.
+    dict: ID of the added task, or None if the task was not added.
+    """
+    new_task = dict({"id": "", "description": "", "completed": False}, **task_to_add)
+    tasks, code, message = task_manager.add_task(tasks, new_task, id_allocator)
+
+    return tasks, code, message, {"id": new_task["id"]} if code == 0 else None
+
+
+def get_task_result(get_task_output):
+    """
+    Converts the output of get_task to (code, message, result).
+
+    Parameters:
+    get_task_output (tuple): Found task, result code and message.
+
+    Returns:
+    int: Result code (0 for success).
+    str: Descriptive error code message.
+    dict: The found task, or None if the task is not found.
+    """
+    task, code, message = get_task_output
+
+    return code, message, task if code == 0 else None
+
+
+def filter_result(filter_output):
+    """
+    Converts the output of a validating filter function to (code, message, result).
+
+    Parameters:
+    filter_output (tuple): Filtered tasks, result code and message.
+
+    Returns:
+    int: Result code (0 for success).
+    str: Descriptive error code message.
+    dict: Count and IDs of the filtered tasks, or None if the filter failed.
+    """
+    filtered_tasks, code, message = filter_output
+
+    if code != 0:
+        return code, message, None
+
+    return code, message, summarize_tasks(filtered_tasks)
+
+
+def apply_operation(tasks, operation, id_allocator=None):
+    """
+    Applies one batch operation to the task list.
+
+    Parameters:
+    tasks (list of dict): The current list of tasks.
+    operation (dict): Operation with an "op" field and the arguments of the task function.
+    id_allocator (TaskIdAllocator): Optional allocator for added tasks without an ID.
+
+    Returns:
+    list of dict: Updated list of tasks.
+    int: Result code (0 for success).
+    str: Descriptive error code message.
+    any: Result of the operation (task, count, summary or IDs of found tasks), or None.
+    """
+    operation_function = OPERATIONS.get(operation.get("op"))
+
+    if operation_function is None:
+        return tasks, INVALID_OPERATION, INVALID_OPERATION_MESSAGE, None
+
+    try:
+        return operation_function(tasks, operation, id_allocator)
+    except KeyError as missing_field:
+        return tasks, INVALID_OPERATION, f"{MISSING_OPERATION_FIELD_MESSAGE} {missing_field}", None
+    except (TypeError, AttributeError, ValueError) as error:
+        # Valid JSON with wrong argument types (e.g. a number instead of a date) fails only this operation
+        return tasks, INVALID_OPERATION, f"{INVALID_OPERATION_ARGUMENT_MESSAGE} {error}", None
+
+
+def run_operations(tasks, operation_lines, stop_on_error=False, id_allocator=None):
+    """
+    Applies operations from JSON lines to the task list and yields one structured result per operation.
+
+    Parameters:
+    tasks (list of dict): The current list of tasks. Sort operations replace the list, the final list
+        is available as the "tasks" key of the last yielded (summary) result.
+    operation_lines (iterable of str): JSON objects, one operation per line. Empty lines are skipped.
+    stop_on_error (bool): Stop at the first failed operation.
+    id_allocator (TaskIdAllocator): Optional allocator for added tasks without an ID.
+
+    Returns:
+    generator of dict: Result of every operation, followed by a summary.
+    """
+    applied_count = 0
+    failed_count = 0
+
+    for line_number, line in enumerate(operation_lines, start=1):
+        if not line.strip():
+            continue
+
+        try:
+            operation = json.loads(line)
+        except json.JSONDecodeError:
+            operation = None
+
+        if not isinstance(operation, dict):
+            code, message, result = INVALID_OPERATION, INVALID_OPERATION_LINE_MESSAGE, None
+            operation = {}
+        else:
+            tasks, code, message, result = apply_operation(tasks, operation, id_allocator)
+
+        applied_count += 1
+
+        if code != 0:
+            failed_count += 1
+
+        yield {"line": line_number, "op": operation.get("op"), "code": code, "message": message, "result": result}
+
+        if code != 0 and stop_on_error:
+            break
+
+    yield {"summary": {"operations": applied_count, "failed": failed_count}, "tasks": tasks}
+
+
+def run_from_command_line(arguments):
+    """
+    Entry point of the batch mode: task_manager.py run OPERATIONS_FILE [options].
+
+    Parameters:
+    arguments (list of str): Command line arguments without the script name.
+
+    Returns:
+    int: Exit code (0 if all operations succeeded).
+    """
+    parser = argparse.ArgumentParser(prog="task_manager.py",
+                                     description="Applies task operations from a JSON lines file in one process.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    run_parser = subparsers.add_parser("run", help="apply operations from a JSON lines file")
+    run_parser.add_argument("operations_file", help='JSON lines file, e.g. {"op": "get_task", "id": 1}')
+    run_parser.add_argument("--load", help="tasks file to load before the operations")
+    run_parser.add_argument("--save", help="directory where the tasks are saved after the operations")
+    run_parser.add_argument("--compression", default="none", help="compression of the saved file")
+    run_parser.add_argument("--compression-level", default="", help="compression level 1-9")
+    run_parser.add_argument("--output", help="write the results to this file instead of stdout")
+    run_parser.add_argument("--stop-on-error", action="store_true", help="stop at the first failed operation")
+    arguments = parser.parse_args(arguments)
+
+    compression, compression_level, code, message = validate_compression(arguments.compression,
+                                                                         arguments.compression_level)
+
+    if code != 0:
+        parser.error(message)
+
+    if arguments.save and not os.path.exists(arguments.save):
+        parser.error(f"Path {arguments.save} does not exist.")
+
+    if os.environ.get(INSTRUMENTATION_ENV_VARIABLE):
+        install_instrumentation(vars(task_manager), task_manager.TASK_FUNCTIONS)
+
+    tasks = TaskStore()
+    id_allocator = TaskIdAllocator()
+    output_file = open(arguments.output, mode='w', encoding='utf-8') if arguments.output else sys.stdout
+
+    if arguments.load:
+        try:
+            # Tasks which cannot be loaded are reported on stderr, so stdout holds only JSON results
+            with contextlib.redirect_stdout(sys.stderr):
+                tasks = TaskStore(task_manager.load_tasks_from_file(arguments.load, id_allocator))
+        except (OSError, ValueError, EOFError) as error:
+            # The operations are not applied to an empty list instead of the tasks which were not loaded
+            output_file.write(json.dumps({"load": arguments.load, "code": INVALID_TASKS_FILE,
+                                          "message": f"{TASKS_FILE_NOT_LOADED_MESSAGE} {error}"}))
+            output_file.write('\n')
+
+            if output_file is not sys.stdout:
+                output_file.close()
+
+            return 1
+
+    start = time.perf_counter()
+    failed_count = 0
+
+    with open(arguments.operations_file, mode='r', encoding='utf-8') as operations_file:
+        for result in run_operations(tasks, operations_file, arguments.stop_on_error, id_allocator):
+            if "summary" in result:
+                tasks = result.pop("tasks")
+                failed_count = result["summary"]["failed"]
+                result["summary"]["seconds"] = round(time.perf_counter() - start, 6)
+
+            output_file.write(json.dumps(result))
+            output_file.write('\n')
+
+    if arguments.save:
+        saved_file = task_manager.save_tasks_to_file(tasks, arguments.save, compression, compression_level,
+                                                    id_allocator)
+        output_file.write(json.dumps({"saved": saved_file}))
+        output_file.write('\n')
+
+    if output_file is not sys.stdout:
+        output_file.close()
+
+    if os.environ.get(INSTRUMENTATION_ENV_VARIABLE):
+        print(generate_metrics_report(), file=sys.stderr)
+
+    return 0 if failed_count == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(run_from_command_line(sys.argv[1:]))
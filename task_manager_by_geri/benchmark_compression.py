@@ -0,0 +1,67 @@
+import argparse
+import os
+import tempfile
+import time
+
+from task_manager import save_tasks_to_file, load_tasks_from_file
+from benchmark_task_manager import generate_tasks
+
+
+def measure_codec(tasks, directory, compression, compression_level):
+    """
+    Saves and loads the tasks with the given codec and measures the file size and throughput.
+
+    Parameters:
+    tasks (list of dict): Tasks to be saved.
+    directory (str): Directory where the snapshot is written.
+    compression (str): Compression codec (none, gzip, bz2 or lzma).
+    compression_level (int): Compression level, or None for the codec default.
+
+    Returns:
+    dict: File size, save and load time in seconds.
+    """
+    start = time.perf_counter()
+    filename = save_tasks_to_file(tasks, directory, compression, compression_level)
+    save_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    loaded_tasks = load_tasks_from_file(filename)
+    load_seconds = time.perf_counter() - start
+
+    if len(loaded_tasks) != len(tasks):
+        raise RuntimeError(f"{compression} snapshot loaded {len(loaded_tasks)} of {len(tasks)} tasks.")
+
+    file_size = os.path.getsize(filename)
+    os.remove(filename)
+
+    return {"size": file_size, "save": save_seconds, "load": load_seconds}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compares compressed task snapshots against the plain .txt output.")
+    parser.add_argument("--tasks", type=int, default=100_000, help="number of synthetic tasks")
+    parser.add_argument("--seed", type=int, default=42, help="seed for the task generator")
+    parser.add_argument("--levels", default="1,6,9", help="comma-separated compression levels")
+    arguments = parser.parse_args()
+
+    tasks = generate_tasks(arguments.tasks, arguments.seed)
+    levels = [int(level) for level in arguments.levels.split(",")]
+
+    with tempfile.TemporaryDirectory() as directory:
+        plain = measure_codec(tasks, directory, "none", None)
+        plain_megabytes = plain["size"] / 1_000_000
+
+        print(f"{'codec':<6} {'level':>5} {'size (B)':>12} {'ratio':>7} {'save MB/s':>10} {'load MB/s':>10}")
+        print(f"{'none':<6} {'-':>5} {plain['size']:>12} {1:>7.2f} "
+              f"{plain_megabytes / plain['save']:>10.1f} {plain_megabytes / plain['load']:>10.1f}")
+
+        for compression in ("gzip", "bz2", "lzma"):
+            for level in levels:
+                result = measure_codec(tasks, directory, compression, level)
+                # Throughput is reported over the uncompressed size, so it is comparable with the plain output
+                print(f"{compression:<6} {level:>5} {result['size']:>12} {plain['size'] / result['size']:>7.2f} "
+                      f"{plain_megabytes / result['save']:>10.1f} {plain_megabytes / result['load']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,283 @@
+import argparse
+import datetime
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from task_manager import *
+
+PRIORITIES = ("low", "medium", "high")
+DESCRIPTION_WORDS = ("review", "report", "meeting", "invoice", "deploy", "backup", "release", "budget", "client",
+                     "update", "prepare", "send", "fix", "plan", "call")
+SCALES = {"1k": 1_000, "10k": 10_000, "100k": 100_000, "1m": 1_000_000}
+
+
+def generate_tasks(count, seed):
+    """
+    Generates a list of synthetic tasks.
+
+    Parameters:
+    count (int): Number of tasks to generate.
+    seed (int): Seed for the random generator, so that the same tasks are generated on every run.
+
+    Returns:
+    list of dict: The generated tasks.
+    """
+    generator = random.Random(seed)
+    tasks = []
+
+    for task_id in range(1, count + 1):
+        tasks.append({
+            "id": task_id,
+            "description": " ".join(generator.choice(DESCRIPTION_WORDS) for _ in range(generator.randint(2, 6))),
+            "priority": generator.choice(PRIORITIES),
+            "deadline": f"{generator.randint(2024, 2026)}-{generator.randint(1, 12):02d}-{generator.randint(1, 28):02d}",
+            "completed": generator.random() < 0.3
+        })
+
+    return tasks
+
+
+def percentile(sorted_values, percent):
+    """
+    Returns the nearest-rank percentile of already sorted values.
+
+    Parameters:
+    sorted_values (list of float): Sorted sample values.
+    percent (float): Percentile between 0 and 100.
+
+    Returns:
+    float: The percentile value.
+    """
+    rank = max(1, round(percent / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def build_operations(tasks, generator, directory, snapshot_file):
+    """
+    Builds the benchmarked operations. Each operation is a function that prepares its arguments
+    and returns a callable which is timed.
+
+    Parameters:
+    tasks (list of dict): Synthetic tasks.
+    generator (random.Random): Seeded random generator for the operation arguments.
+    directory (str): Directory for the snapshot files.
+    snapshot_file (str): Snapshot of the tasks used by the load benchmark.
+
+    Returns:
+    dict: Operation name -> (function preparing the timed call, cleanup function or None).
+    """
+    task_count = len(tasks)
+    next_task_id = [task_count + 1]
+
+    def prepare_add_task():
+        new_task = {"id": next_task_id[0], "description": "benchmark task", "priority": "low",
+                    "deadline": "2025-01-01", "completed": False}
+        next_task_id[0] += 1
+        return lambda: add_task(tasks, new_task)
+
+    def cleanup_add_task():
+        # Restore the original size so that the samples do not grow the list
+        tasks.pop()
+
+    task_store = TaskStore(tasks)
+    removed_task = [None]
+
+    def prepare_remove_task(tasks_to_remove_from):
+        removed_task[0] = generator.choice(tasks)
+        return lambda: remove_task(tasks_to_remove_from, removed_task[0]["id"])
+
+    def cleanup_remove_task(tasks_to_remove_from):
+        # Put the removed task back, so that every sample removes from a store of the same size
+        tasks_to_remove_from.append(removed_task[0])
+
+    def prepare_save_tasks():
+        return lambda: os.remove(save_tasks_to_file(tasks, directory))
+
+    return {
+        "get_task": (lambda: (lambda task_id=generator.randint(1, task_count): get_task(tasks, task_id)), None),
+        "add_task": (prepare_add_task, cleanup_add_task),
+        "remove_task": (lambda: prepare_remove_task(tasks), lambda: cleanup_remove_task(tasks)),
+        "remove_task_from_store":
+            (lambda: prepare_remove_task(task_store), lambda: cleanup_remove_task(task_store)),
+        "search_tasks_by_keyword":
+            (lambda: (lambda keyword=generator.choice(DESCRIPTION_WORDS): search_tasks_by_keyword(tasks, keyword)),
+             None),
+        "filter_tasks_by_priority":
+            (lambda: (lambda priority=generator.choice(PRIORITIES): filter_tasks_by_priority(tasks, priority)), None),
+        "filter_tasks_by_status":
+            (lambda: (lambda status=generator.random() < 0.5: filter_tasks_by_status(tasks, status)), None),
+        "filter_tasks_by_deadline":
+            (lambda: (lambda deadline=generator.choice(tasks)["deadline"]: filter_tasks_by_deadline(tasks, deadline)),
+             None),
+        "sort_tasks_by_deadline": (lambda: (lambda: sort_tasks_by_deadline(tasks)), None),
+        "sort_tasks_by_priority": (lambda: (lambda: sort_tasks_by_priority(tasks)), None),
+        "save_tasks_to_file": (prepare_save_tasks, None),
+        "load_tasks_from_file": (lambda: (lambda: load_tasks_from_file(snapshot_file)), None),
+    }
+
+
+def measure_operation(prepare, cleanup, samples):
+    """
+    Times an operation and measures its memory high-water mark.
+
+    Parameters:
+    prepare (function): Returns the callable to be timed.
+    cleanup (function): Called after each sample, or None.
+    samples (int): Number of timed samples.
+
+    Returns:
+    dict: Latency percentiles in microseconds and the peak of traced memory in bytes.
+    """
+    latencies = []
+
+    for _ in range(samples):
+        timed_call = prepare()
+        start = time.perf_counter()
+        timed_call()
+        latencies.append((time.perf_counter() - start) * 1_000_000)
+
+        if cleanup:
+            cleanup()
+
+    # Memory is traced in a separate call, so that tracing does not distort the latencies
+    timed_call = prepare()
+    tracemalloc.start()
+    timed_call()
+    peak_memory = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    if cleanup:
+        cleanup()
+
+    latencies.sort()
+
+    return {
+        "samples": samples,
+        "min_us": latencies[0],
+        "p50_us": percentile(latencies, 50),
+        "p90_us": percentile(latencies, 90),
+        "p99_us": percentile(latencies, 99),
+        "max_us": latencies[-1],
+        "mean_us": statistics.fmean(latencies),
+        "peak_memory_bytes": peak_memory
+    }
+
+
+def run_benchmarks(scales, samples, seed, selected_operations=None):
+    """
+    Runs all benchmarks for the given scales.
+
+    Parameters:
+    scales (list of str): Scale names (1k, 10k, 100k or 1m).
+    samples (int): Number of timed samples per operation. Snapshot operations use at most 3 samples.
+    seed (int): Seed for the task generator and the operation arguments.
+    selected_operations (list of str): Operation names to run, or None for all.
+
+    Returns:
+    list of dict: One result per scale and operation.
+    """
+    results = []
+
+    with tempfile.TemporaryDirectory() as directory:
+        for scale in scales:
+            tasks = generate_tasks(SCALES[scale], seed)
+            generator = random.Random(seed)
+            snapshot_file = save_tasks_to_file(tasks, directory)
+            operations = build_operations(tasks, generator, directory, snapshot_file)
+
+            for operation, (prepare, cleanup) in operations.items():
+                if selected_operations and operation not in selected_operations:
+                    continue
+
+                operation_samples = min(samples, 3) if operation.endswith("_file") else samples
+                result = measure_operation(prepare, cleanup, operation_samples)
+                result.update({"scale": scale, "tasks": len(tasks), "operation": operation})
+                results.append(result)
+
+                print(f"{scale:>5} {operation:<26} p50 {result['p50_us']:>12.1f} us  "
+                      f"p99 {result['p99_us']:>12.1f} us  peak {result['peak_memory_bytes'] / 1024:>10.1f} KiB",
+                      file=sys.stderr)
+
+            os.remove(snapshot_file)
+
+    return results
+
+
+def compare_results(results, baseline_path):
+    """
+    Prints the p50 latency change of each operation against a previous JSON report to stderr, so the JSON report
+    on stdout stays valid. A change against a previous p50 of 0 is shown as n/a.
+
+    Parameters:
+    results (list of dict): Current benchmark results.
+    baseline_path (str): Path to a previous report written with --output.
+
+    Returns:
+    None
+    """
+    with open(baseline_path, mode='r', encoding='utf-8') as baseline_file:
+        baseline = json.load(baseline_file)
+
+    baseline_results = {(result["scale"], result["operation"]): result for result in baseline["results"]}
+
+    for result in results:
+        previous = baseline_results.get((result["scale"], result["operation"]))
+
+        if previous is None:
+            continue
+
+        if previous["p50_us"] == 0:
+            change = f"{'n/a':>9}"
+        else:
+            change = f"{(result['p50_us'] - previous['p50_us']) / previous['p50_us'] * 100:+8.1f}%"
+
+        print(f"{result['scale']:>5} {result['operation']:<26} p50 {change}", file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks the task manager hot paths on synthetic tasks.")
+    parser.add_argument("--scales", default="1k,100k", help=f"comma-separated scales ({', '.join(SCALES)})")
+    parser.add_argument("--samples", type=int, default=20, help="timed samples per operation")
+    parser.add_argument("--seed", type=int, default=42, help="seed for the task and argument generators")
+    parser.add_argument("--operations", default="", help="comma-separated operations to run (default: all)")
+    parser.add_argument("--output", help="write the JSON report to this file instead of stdout")
+    parser.add_argument("--compare", help="previous JSON report to compare p50 latencies against")
+    arguments = parser.parse_args()
+
+    scales = [scale.strip().lower() for scale in arguments.scales.split(",")]
+    unknown_scales = [scale for scale in scales if scale not in SCALES]
+
+    if unknown_scales:
+        parser.error(f"unknown scales: {', '.join(unknown_scales)}")
+
+    selected_operations = [operation.strip() for operation in arguments.operations.split(",") if operation.strip()]
+    results = run_benchmarks(scales, arguments.samples, arguments.seed, selected_operations)
+
+    report = {
+        "created": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": arguments.seed,
+        "results": results
+    }
+
+    if arguments.output:
+        with open(arguments.output, mode='w', encoding='utf-8') as output_file:
+            json.dump(report, output_file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    if arguments.compare:
+        compare_results(results, arguments.compare)
+
+
+if __name__ == "__main__":
+    main()
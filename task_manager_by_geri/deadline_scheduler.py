@@ -0,0 +1,247 @@
+import datetime
+import heapq
+import threading
+
+from task_manager import register_task_listener, unregister_task_listener
+
+
+class DeadlineScheduler:
+    """
+    Fires reminders for pending tasks when their deadline is reached.
+
+    Pending tasks are kept in a min-heap keyed by the due time of their deadline. A timer thread sleeps until
+    the earliest due time, so every wakeup costs O(log n). Changed deadlines and completed tasks are not removed
+    from the heap; their old entries are skipped when they reach the top (lazy deletion).
+    """
+
+    def __init__(self, on_due, due_time=datetime.time(0, 0), clock=datetime.datetime.now):
+        """
+        Parameters:
+        on_due (function): Called as on_due(task, overdue) when a task is due. overdue is True if the whole
+            deadline day has already passed when the reminder fires.
+        due_time (datetime.time): Time of the deadline day when a task becomes due.
+        clock (function): Returns the current datetime.
+        """
+        self.on_due = on_due
+        self.due_time = due_time
+        self.clock = clock
+        # Heap with (due datetime, task ID) entries, some of them stale
+        self.deadline_heap = []
+        # Task ID -> (due datetime, task) of the currently scheduled tasks
+        self.scheduled_tasks = {}
+        self.condition = threading.Condition()
+        self.timer_thread = None
+        self.stopped = False
+
+    def get_due_datetime(self, task):
+        """
+        Returns the datetime when a task becomes due.
+
+        Parameters:
+        task (dict): Task with a validated deadline (YYYY-MM-DD).
+
+        Returns:
+        datetime.datetime: The due datetime.
+        """
+        year, month, day = map(int, task['deadline'].split("-"))
+        return datetime.datetime.combine(datetime.date(year, month, day), self.due_time)
+
+    def schedule_task(self, task):
+        """
+        Schedules a reminder for a task or moves it to its new deadline. Completed tasks are unscheduled.
+
+        Parameters:
+        task (dict): The task to be scheduled.
+
+        Returns:
+        None
+        """
+        if task['completed']:
+            self.unschedule_task(task['id'])
+            return
+
+        due_datetime = self.get_due_datetime(task)
+
+        with self.condition:
+            self.scheduled_tasks[task['id']] = (due_datetime, task)
+            heapq.heappush(self.deadline_heap, (due_datetime, task['id']))
+            self.compact_heap()
+
+            # Wake up the timer thread if this task is due before the one it is waiting for
+            if self.deadline_heap[0][1] == task['id']:
+                self.condition.notify()
+
+    def schedule_tasks(self, tasks_lst):
+        """
+        Schedules reminders for all pending tasks of a list, e.g. after the tasks are loaded from a file.
+
+        Parameters:
+        tasks_lst (list of dict): The current list of tasks.
+
+        Returns:
+        None
+        """
+        for task in tasks_lst:
+            self.schedule_task(task)
+
+    def unschedule_task(self, task_id):
+        """
+        Removes the reminder of a task. The heap entry is skipped when it reaches the top.
+
+        Parameters:
+        task_id (int): ID of the task.
+
+        Returns:
+        None
+        """
+        with self.condition:
+            self.scheduled_tasks.pop(task_id, None)
+
+    def compact_heap(self):
+        """
+        Rebuilds the heap without stale entries once they are more than half of it. Must be called with the lock held.
+
+        Returns:
+        None
+        """
+        if len(self.deadline_heap) > 2 * len(self.scheduled_tasks) + 16:
+            self.deadline_heap = [(due_datetime, task_id)
+                                  for task_id, (due_datetime, task) in self.scheduled_tasks.items()]
+            heapq.heapify(self.deadline_heap)
+
+    def pop_due_tasks(self, now):
+        """
+        Removes all tasks which are due at the given time. Must be called with the lock held.
+
+        Parameters:
+        now (datetime.datetime): The current datetime.
+
+        Returns:
+        list of tuple: (task, overdue) for every due task.
+        """
+        due_tasks = []
+
+        while self.deadline_heap and self.deadline_heap[0][0] <= now:
+            due_datetime, task_id = heapq.heappop(self.deadline_heap)
+            scheduled_task = self.scheduled_tasks.get(task_id)
+
+            # Skip stale entries of unscheduled tasks and of tasks with a changed deadline
+            if scheduled_task is None or scheduled_task[0] != due_datetime:
+                continue
+
+            del self.scheduled_tasks[task_id]
+            overdue = now.date() > due_datetime.date()
+            due_tasks.append((scheduled_task[1], overdue))
+
+        return due_tasks
+
+    def fire_due_tasks(self):
+        """
+        Calls on_due for all tasks which are due now.
+
+        Returns:
+        int: Number of fired reminders.
+        """
+        with self.condition:
+            due_tasks = self.pop_due_tasks(self.clock())
+
+        # Callbacks are called without the lock, so that they can change tasks and reschedule them
+        for task, overdue in due_tasks:
+            self.on_due(task, overdue)
+
+        return len(due_tasks)
+
+    def get_seconds_until_next_due(self):
+        """
+        Returns the time until the earliest scheduled task is due. Must be called with the lock held.
+
+        Returns:
+        float: Seconds until the next due task, or None if no task is scheduled.
+        """
+        while self.deadline_heap:
+            due_datetime, task_id = self.deadline_heap[0]
+            scheduled_task = self.scheduled_tasks.get(task_id)
+
+            if scheduled_task is not None and scheduled_task[0] == due_datetime:
+                return max(0.0, (due_datetime - self.clock()).total_seconds())
+
+            heapq.heappop(self.deadline_heap)
+
+        return None
+
+    def handle_task_event(self, event, task, changed_fields):
+        """
+        Task listener which keeps the reminders up to date when tasks are added, removed or changed.
+
+        Parameters:
+        event (str): 'added', 'removed' or 'updated'.
+        task (dict): The changed task.
+        changed_fields (tuple of str): Names of the changed task fields.
+
+        Returns:
+        None
+        """
+        if event == "removed":
+            self.unschedule_task(task['id'])
+        elif "deadline" in changed_fields or "completed" in changed_fields:
+            self.schedule_task(task)
+
+    def run(self):
+        """
+        Timer thread loop. Sleeps until the next task is due or until the schedule changes.
+
+        Returns:
+        None
+        """
+        while True:
+            self.fire_due_tasks()
+
+            with self.condition:
+                if self.stopped:
+                    return
+
+                seconds = self.get_seconds_until_next_due()
+
+                # Far-future deadlines (e.g. 9999-12-31) exceed the longest possible wait, the loop waits again
+                self.condition.wait(None if seconds is None else min(seconds, threading.TIMEOUT_MAX))
+
+                if self.stopped:
+                    return
+
+    def start(self):
+        """
+        Starts the timer thread and subscribes to task changes (set_task_deadline, mark_task_as_completed, etc.).
+
+        Returns:
+        None
+        """
+        register_task_listener(self.handle_task_event)
+        self.stopped = False
+        self.timer_thread = threading.Thread(target=self.run, name="deadline-scheduler", daemon=True)
+        self.timer_thread.start()
+
+    def stop(self):
+        """
+        Stops the timer thread and unsubscribes from task changes.
+
+        Returns:
+        None
+        """
+        unregister_task_listener(self.handle_task_event)
+
+        with self.condition:
+            self.stopped = True
+            self.condition.notify()
+
+        if self.timer_thread is not None:
+            self.timer_thread.join()
+            self.timer_thread = None
+
+    def count_scheduled_tasks(self):
+        """
+        Returns the number of pending tasks with a scheduled reminder.
+
+        Returns:
+        int: Number of scheduled tasks.
+        """
+        return len(self.scheduled_tasks)
@@ -1,5 +1,7 @@
 import datetime
 
+from task_store import TaskStore
+
 INVALID_TASK_ID_VALUE = -1
 INVALID_TASK_ID_VALUE_MESSAGE = "Invalid task id value. Id must be a positive integer."
 INVALID_TASK_PRIORITY = -1
@@ -9,6 +11,14 @@ INVALID_DATE_FORMAT_MESSAGE = "Invalid date. Date must be in the format YYYY-MM-
 INVALID_STATUS = -1
 INVALID_STATUS_MESSAGE = "Status must be true or face (case non-sensitive)."
 TASK_ID_ALREADY_EXISTS_MESSAGE = "Task with the same id already exists."
+INVALID_COMPRESSION = -1
+INVALID_COMPRESSION_MESSAGE = "Compression must be none, gzip, bz2 or lzma."
+INVALID_COMPRESSION_LEVEL = -1
+INVALID_COMPRESSION_LEVEL_MESSAGE = "Compression level must be an integer between 1 and 9."
+INVALID_ARCHIVE_DAYS = -1
+INVALID_ARCHIVE_DAYS_MESSAGE = "Number of days must be a non-negative integer."
+
+COMPRESSION_CODECS = ("none", "gzip", "bz2", "lzma")
 
 
 def validate_task_id(current_task_id):
@@ -133,16 +143,78 @@ def check_task_id_uniqueness(tasks_lst, task_id):
     Checks if a new task id already exists in the list. Returns error if new task ID is a duplicate.
 
     Parameters:
-    tasks_lst (list of dict): The current list of tasks.
+    tasks_lst (list of dict or TaskStore): The current list of tasks. A TaskStore is checked without scanning.
     task_id (int): The task ID to be checked for uniqueness.
 
     Returns:
     int: Result code (0 for uniqueness).
     str: Descriptive error code message.
     """
+    if isinstance(tasks_lst, TaskStore):
+        if tasks_lst.get_by_id(task_id) is not None:
+            return INVALID_TASK_ID_VALUE, TASK_ID_ALREADY_EXISTS_MESSAGE
+
+        return 0, ""
+
     for tsk in tasks_lst:
 
         if tsk["id"] == task_id:
             return INVALID_TASK_ID_VALUE, TASK_ID_ALREADY_EXISTS_MESSAGE
 
     return 0, ""
+
+
+def validate_compression(compression, compression_level):
+    """
+    Validates the compression codec and level used for saving tasks to a file.
+
+    Parameters:
+    compression (str): Compression codec (none, gzip, bz2 or lzma). Empty value means no compression.
+    compression_level (str): Compression level between 1 and 9. Empty value means the codec default.
+
+    Returns:
+    str: Validated compression codec.
+    int: Validated compression level, or None for the codec default.
+    int: Result code (0 for success).
+    str: Descriptive error code message.
+    """
+    compression = (compression or "none").strip().lower()
+
+    if compression not in COMPRESSION_CODECS:
+        return compression, None, INVALID_COMPRESSION, INVALID_COMPRESSION_MESSAGE
+
+    if compression_level is None or str(compression_level).strip() == "":
+        return compression, None, 0, ""
+
+    try:
+        level = int(compression_level)
+    except ValueError:
+        return compression, None, INVALID_COMPRESSION_LEVEL, INVALID_COMPRESSION_LEVEL_MESSAGE
+
+    if level < 1 or level > 9:
+        return compression, None, INVALID_COMPRESSION_LEVEL, INVALID_COMPRESSION_LEVEL_MESSAGE
+
+    return compression, level, 0, ""
+
+
+def validate_archive_days(days_value):
+    """
+    Validates if input number of days for archiving is a non-negative integer value.
+
+    Parameters:
+    days_value (str): Number of days since the tasks were completed.
+
+    Returns:
+    int: Number of days as integer.
+    int: Result code (0 for success).
+    str: Descriptive error code message.
+    """
+    try:
+        days = int(days_value)
+    except ValueError:
+        return 0, INVALID_ARCHIVE_DAYS, INVALID_ARCHIVE_DAYS_MESSAGE
+
+    if days < 0:
+        return 0, INVALID_ARCHIVE_DAYS, INVALID_ARCHIVE_DAYS_MESSAGE
+
+    return days, 0, ""
@@ -0,0 +1,239 @@
+import contextlib
+import functools
+import time
+
+INSTRUMENTATION_ENV_VARIABLE = "TASK_MANAGER_INSTRUMENTATION"
+METRICS_FILE_ENV_VARIABLE = "TASK_MANAGER_METRICS_FILE"
+
+# Upper bounds (in seconds) of the latency histogram buckets
+LATENCY_BUCKETS = (0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+# Function name -> collected metrics
+function_metrics = {}
+
+
+def new_function_metrics():
+    """
+    Creates empty metrics for an instrumented function.
+
+    Returns:
+    dict: Call count, cumulative latency, latency histogram and result size totals.
+    """
+    return {
+        "calls": 0,
+        "total_seconds": 0.0,
+        "max_seconds": 0.0,
+        "latency_buckets": [0] * (len(LATENCY_BUCKETS) + 1),
+        "result_size_total": 0,
+        "result_size_max": 0
+    }
+
+
+def get_result_size(result):
+    """
+    Returns the size of a function result. Task functions return either a collection
+    or a tuple whose first element is the resulting collection.
+
+    Parameters:
+    result (any): The function result.
+
+    Returns:
+    int: Number of returned tasks (1 for a single task), or 0 if the result has no size.
+    """
+    if isinstance(result, tuple) and result:
+        result = result[0]
+
+    if isinstance(result, list):
+        return len(result)
+
+    if isinstance(result, dict):
+        return 1 if result else 0
+
+    return 0
+
+
+def record_call(function_name, elapsed_seconds, result):
+    """
+    Records one call of an instrumented function.
+
+    Parameters:
+    function_name (str): Name of the called function.
+    elapsed_seconds (float): Latency of the call.
+    result (any): The function result.
+
+    Returns:
+    None
+    """
+    metrics = function_metrics.get(function_name)
+
+    if metrics is None:
+        metrics = function_metrics[function_name] = new_function_metrics()
+
+    metrics["calls"] += 1
+    metrics["total_seconds"] += elapsed_seconds
+    metrics["max_seconds"] = max(metrics["max_seconds"], elapsed_seconds)
+
+    for bucket_index, upper_bound in enumerate(LATENCY_BUCKETS):
+        if elapsed_seconds <= upper_bound:
+            break
+    else:
+        bucket_index = len(LATENCY_BUCKETS)
+
+    metrics["latency_buckets"][bucket_index] += 1
+
+    result_size = get_result_size(result)
+    metrics["result_size_total"] += result_size
+    metrics["result_size_max"] = max(metrics["result_size_max"], result_size)
+
+
+def instrument(function):
+    """
+    Decorator which records call count, latency and result size of a function.
+
+    Parameters:
+    function (function): The function to be instrumented.
+
+    Returns:
+    function: The instrumented function. The original function is available as __wrapped__.
+    """
+    @functools.wraps(function)
+    def instrumented_function(*args, **kwargs):
+        start = time.perf_counter()
+        result = function(*args, **kwargs)
+        record_call(function.__name__, time.perf_counter() - start, result)
+        return result
+
+    instrumented_function.is_instrumented = True
+    return instrumented_function
+
+
+def install_instrumentation(namespace, function_names):
+    """
+    Replaces the functions in a module namespace with instrumented versions. Since the functions call each other
+    through the module globals, nested calls (e.g. get_task inside remove_task) are recorded as well.
+    Nothing is replaced until this function is called, so disabled instrumentation has no overhead.
+
+    Parameters:
+    namespace (dict): Module globals, e.g. globals() of task_manager.
+    function_names (iterable of str): Names of the functions to be instrumented.
+
+    Returns:
+    None
+    """
+    for function_name in function_names:
+        function = namespace[function_name]
+
+        if not getattr(function, "is_instrumented", False):
+            namespace[function_name] = instrument(function)
+
+
+def uninstall_instrumentation(namespace, function_names):
+    """
+    Restores the original functions in a module namespace.
+
+    Parameters:
+    namespace (dict): Module globals, e.g. globals() of task_manager.
+    function_names (iterable of str): Names of the instrumented functions.
+
+    Returns:
+    None
+    """
+    for function_name in function_names:
+        function = namespace[function_name]
+
+        if getattr(function, "is_instrumented", False):
+            namespace[function_name] = function.__wrapped__
+
+
+@contextlib.contextmanager
+def instrumented(namespace, function_names):
+    """
+    Context manager which instruments the functions only inside the with block.
+
+    Parameters:
+    namespace (dict): Module globals, e.g. globals() of task_manager.
+    function_names (iterable of str): Names of the functions to be instrumented.
+    """
+    install_instrumentation(namespace, function_names)
+
+    try:
+        yield function_metrics
+    finally:
+        uninstall_instrumentation(namespace, function_names)
+
+
+def reset_metrics():
+    """
+    Removes all collected metrics.
+
+    Returns:
+    None
+    """
+    function_metrics.clear()
+
+
+def generate_metrics_report():
+    """
+    Generates a text report of the collected metrics, sorted by cumulative latency.
+
+    Returns:
+    str: The report.
+    """
+    if not function_metrics:
+        return "No instrumented calls were recorded."
+
+    report_lines = [f"{'function':<26} {'calls':>8} {'total ms':>11} {'avg ms':>9} {'max ms':>9} {'avg size':>9}"]
+    sorted_metrics = sorted(function_metrics.items(), key=lambda item: item[1]["total_seconds"], reverse=True)
+
+    for function_name, metrics in sorted_metrics:
+        calls = metrics["calls"]
+        report_lines.append(f"{function_name:<26} {calls:>8} {metrics['total_seconds'] * 1000:>11.3f} "
+                            f"{metrics['total_seconds'] * 1000 / calls:>9.3f} {metrics['max_seconds'] * 1000:>9.3f} "
+                            f"{metrics['result_size_total'] / calls:>9.1f}")
+
+    return "\n".join(report_lines)
+
+
+def export_prometheus_metrics(prefix="task_manager"):
+    """
+    Exports the collected metrics in Prometheus text exposition format.
+
+    Parameters:
+    prefix (str): Prefix of the metric names.
+
+    Returns:
+    str: The metrics in Prometheus text format.
+    """
+    lines = [
+        f"# HELP {prefix}_function_calls_total Number of calls of a task function.",
+        f"# TYPE {prefix}_function_calls_total counter"
+    ]
+
+    for function_name, metrics in function_metrics.items():
+        lines.append(f'{prefix}_function_calls_total{{function="{function_name}"}} {metrics["calls"]}')
+
+    lines.append(f"# HELP {prefix}_function_latency_seconds Latency of a task function.")
+    lines.append(f"# TYPE {prefix}_function_latency_seconds histogram")
+
+    for function_name, metrics in function_metrics.items():
+        cumulative_count = 0
+
+        for upper_bound, bucket_count in zip(LATENCY_BUCKETS, metrics["latency_buckets"]):
+            cumulative_count += bucket_count
+            lines.append(f'{prefix}_function_latency_seconds_bucket{{function="{function_name}",le="{upper_bound}"}} '
+                         f'{cumulative_count}')
+
+        lines.append(f'{prefix}_function_latency_seconds_bucket{{function="{function_name}",le="+Inf"}} '
+                     f'{metrics["calls"]}')
+        lines.append(f'{prefix}_function_latency_seconds_sum{{function="{function_name}"}} '
+                     f'{metrics["total_seconds"]}')
+        lines.append(f'{prefix}_function_latency_seconds_count{{function="{function_name}"}} {metrics["calls"]}')
+
+    lines.append(f"# HELP {prefix}_function_result_size_total Total number of items returned by a task function.")
+    lines.append(f"# TYPE {prefix}_function_result_size_total counter")
+
+    for function_name, metrics in function_metrics.items():
+        lines.append(f'{prefix}_function_result_size_total{{function="{function_name}"}} '
+                     f'{metrics["result_size_total"]}')
+
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,187 @@
+from collections import OrderedDict
+
+# Query function name -> task fields the query result depends on
+QUERY_FIELDS = {
+    "search_tasks_by_keyword": ("description",),
+    "filter_tasks_by_priority": ("priority",),
+    "filter_tasks_by_status": ("completed",),
+    "filter_tasks_by_deadline": ("deadline",),
+}
+
+# Query function name -> function normalizing the query arguments for the cache key, so that queries with the same
+# result share a cache entry. Only differences the query function ignores itself may be normalized away
+# (validate_task_priority lowercases the priority, but keeps surrounding spaces and rejects them).
+QUERY_NORMALIZERS = {
+    "filter_tasks_by_priority": lambda priority: (priority.lower() if isinstance(priority, str) else priority,),
+}
+
+
+class TaskQueryCache:
+    """
+    Bounded LRU cache of task query results (searches and filters).
+
+    Every task field has a generation counter which is increased by the task listener when the field of any task
+    changes (adding or removing a task changes all fields). A cached result is only used while the generations
+    of the fields its query depends on are unchanged, so e.g. changing a priority does not invalidate keyword
+    searches. Outdated results are evicted as soon as a field they depend on changes, so they do not keep old
+    task lists alive. Register handle_task_event with register_task_listener to keep the cache up to date.
+    """
+
+    def __init__(self, max_size=128):
+        """
+        Parameters:
+        max_size (int): Maximum number of cached query results.
+        """
+        self.max_size = max_size
+        # (query name, list identity, normalized arguments) -> (tasks list, list length, generations, result)
+        self.entries = OrderedDict()
+        self.field_generations = {}
+        # Task field -> keys of the cached results which depend on the field
+        self.keys_by_field = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def handle_task_event(self, event, task, changed_fields):
+        """
+        Task listener which invalidates the results depending on the changed fields.
+
+        Parameters:
+        event (str): 'added', 'removed' or 'updated'.
+        task (dict): The changed task.
+        changed_fields (tuple of str): Names of the changed task fields.
+
+        Returns:
+        None
+        """
+        for field in changed_fields:
+            self.field_generations[field] = self.field_generations.get(field, 0) + 1
+
+            for key in self.keys_by_field.pop(field, ()):
+                if key in self.entries:
+                    self.remove_entry(key)
+                    self.invalidations += 1
+
+    def remove_entry(self, key):
+        """
+        Removes a cached result and its keys by field.
+
+        Parameters:
+        key (tuple): Key of the cached result.
+
+        Returns:
+        None
+        """
+        del self.entries[key]
+
+        for field in QUERY_FIELDS[key[0]]:
+            field_keys = self.keys_by_field.get(field)
+
+            if field_keys is not None:
+                field_keys.discard(key)
+
+    def get_generations(self, query_name):
+        """
+        Returns the current generations of the fields a query depends on.
+
+        Parameters:
+        query_name (str): Name of the query function.
+
+        Returns:
+        tuple of int: Field generations.
+        """
+        return tuple(self.field_generations.get(field, 0) for field in QUERY_FIELDS[query_name])
+
+    def query(self, query_function, tasks_lst, *arguments):
+        """
+        Returns the result of a query function from the cache, or calls the function and caches its result.
+        Failed queries (result code other than 0) are not cached.
+
+        Parameters:
+        query_function (function): One of the functions in QUERY_FIELDS, e.g. filter_tasks_by_priority.
+        tasks_lst (list of dict): The current list of tasks.
+        arguments: The query arguments.
+
+        Returns:
+        The result of the query function. Result lists are copies, so they can be changed by the caller.
+        """
+        query_name = query_function.__name__
+        normalizer = QUERY_NORMALIZERS.get(query_name)
+        normalized_arguments = normalizer(*arguments) if normalizer else arguments
+        key = (query_name, id(tasks_lst), normalized_arguments)
+        generations = self.get_generations(query_name)
+        entry = self.entries.get(key)
+
+        if entry is not None:
+            cached_tasks_lst, cached_length, cached_generations, result = entry
+
+            # The list and length checks also catch a reused list identity and changes made without task functions
+            if cached_tasks_lst is tasks_lst and cached_length == len(tasks_lst) and cached_generations == generations:
+                self.hits += 1
+                self.entries.move_to_end(key)
+                return copy_query_result(result)
+
+            self.invalidations += 1
+            self.remove_entry(key)
+
+        self.misses += 1
+        # The normalized arguments are only used in the key, the query function validates the original ones
+        result = query_function(tasks_lst, *arguments)
+
+        if not isinstance(result, tuple) or result[1] == 0:
+            self.entries[key] = (tasks_lst, len(tasks_lst), generations, copy_query_result(result))
+
+            for field in QUERY_FIELDS[query_name]:
+                self.keys_by_field.setdefault(field, set()).add(key)
+
+            if len(self.entries) > self.max_size:
+                self.remove_entry(next(iter(self.entries)))
+                self.evictions += 1
+
+        return result
+
+    def clear(self):
+        """
+        Removes all cached results. Statistics are kept.
+
+        Returns:
+        None
+        """
+        self.entries.clear()
+        self.keys_by_field.clear()
+
+    def get_statistics(self):
+        """
+        Returns the cache statistics, e.g. for tuning max_size.
+
+        Returns:
+        dict: Hits, misses, hit ratio, evictions, invalidations, size and maximum size.
+        """
+        lookups = self.hits + self.misses
+
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "size": len(self.entries),
+            "max_size": self.max_size
+        }
+
+
+def copy_query_result(result):
+    """
+    Copies the task list of a query result, so that cached results cannot be changed by the caller.
+
+    Parameters:
+    result (list or tuple): A task list, or a tuple of task list, result code and message.
+
+    Returns:
+    list or tuple: The result with a copied task list.
+    """
+    if isinstance(result, tuple):
+        return (list(result[0]),) + result[1:]
+
+    return list(result)
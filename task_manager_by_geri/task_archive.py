@@ -0,0 +1,145 @@
+import gzip
+import json
+import os
+
+
+class TaskArchive:
+    """
+    Append-only, compressed cold store for archived tasks.
+
+    Every archived batch is appended to the archive file as a separate gzip member, so existing data is never
+    rewritten. A lightweight index file (archive path + '.idx') stores one line per task with the task ID and
+    the file offset of the member containing it, so a single task is found by decompressing only its batch.
+    """
+
+    def __init__(self, archive_path):
+        """
+        Parameters:
+        archive_path (str): Path to the archive file. The file and its index are created on the first append.
+        """
+        self.archive_path = archive_path
+        self.index_path = archive_path + ".idx"
+        # Task ID -> offset of the gzip member, loaded on first use
+        self.offset_by_id = None
+
+    def load_index(self):
+        """
+        Loads the index file, if it is not loaded yet.
+
+        Returns:
+        dict: Task ID -> offset of the gzip member with the task.
+        """
+        if self.offset_by_id is None:
+            self.offset_by_id = {}
+
+            if os.path.isfile(self.index_path):
+                with open(self.index_path, mode='r', encoding='utf-8') as index_file:
+                    for line in index_file:
+                        index_entry = json.loads(line)
+                        self.offset_by_id[index_entry["id"]] = index_entry["offset"]
+
+        return self.offset_by_id
+
+    def append_tasks(self, tasks_to_archive):
+        """
+        Appends tasks to the archive as one compressed batch and adds them to the index.
+
+        Parameters:
+        tasks_to_archive (list of dict): Tasks to be archived.
+
+        Returns:
+        int: Number of archived tasks.
+        """
+        if not tasks_to_archive:
+            return 0
+
+        offset_by_id = self.load_index()
+        member_offset = os.path.getsize(self.archive_path) if os.path.isfile(self.archive_path) else 0
+
+        with gzip.open(self.archive_path, mode='at', encoding='utf-8') as archive_file:
+            for task in tasks_to_archive:
+                archive_file.write(json.dumps(task))
+                archive_file.write('\n')
+
+        # The index is written after the batch, so it never points to data which is not in the archive
+        with open(self.index_path, mode='a', encoding='utf-8') as index_file:
+            for task in tasks_to_archive:
+                index_file.write(json.dumps({"id": task['id'], "offset": member_offset}))
+                index_file.write('\n')
+                offset_by_id[task['id']] = member_offset
+
+        return len(tasks_to_archive)
+
+    def contains_task(self, task_id):
+        """
+        Checks if a task with the given ID is archived.
+
+        Parameters:
+        task_id (int): Validated task ID.
+
+        Returns:
+        bool: True if the task is archived.
+        """
+        return task_id in self.load_index()
+
+    def get_task(self, task_id):
+        """
+        Retrieves an archived task by its ID. Only the batch containing the task is decompressed.
+
+        Parameters:
+        task_id (int): Validated task ID.
+
+        Returns:
+        dict: The archived task, or None if it is not archived.
+        """
+        member_offset = self.load_index().get(task_id)
+
+        if member_offset is None:
+            return None
+
+        with open(self.archive_path, mode='rb') as raw_archive_file:
+            raw_archive_file.seek(member_offset)
+
+            with gzip.open(raw_archive_file, mode='rt', encoding='utf-8') as archive_file:
+                for line in archive_file:
+                    archived_task = json.loads(line)
+
+                    if archived_task['id'] == task_id:
+                        return archived_task
+
+        return None
+
+    def iter_tasks(self):
+        """
+        Generates all archived tasks, decompressing the archive as a stream.
+
+        Returns:
+        generator of dict: Archived tasks.
+        """
+        if not os.path.isfile(self.archive_path):
+            return
+
+        with gzip.open(self.archive_path, mode='rt', encoding='utf-8') as archive_file:
+            for line in archive_file:
+                yield json.loads(line)
+
+    def search_tasks_by_keyword(self, keyword):
+        """
+        Searches archived tasks by a keyword in the description.
+
+        Parameters:
+        keyword (str): The keyword to search for.
+
+        Returns:
+        list of dict: Archived tasks that contain the keyword in their description.
+        """
+        return [task for task in self.iter_tasks() if keyword in task['description']]
+
+    def count_tasks(self):
+        """
+        Returns the number of archived tasks.
+
+        Returns:
+        int: The number of archived tasks.
+        """
+        return len(self.load_index())
@@ -0,0 +1,116 @@
+import heapq
+import threading
+
+
+class TaskIdAllocator:
+    """
+    Hands out unique task IDs from a monotonic sequence.
+
+    Every ID up to the high-water mark is considered used, so a new ID is unique without scanning the task list
+    as long as all IDs entered by hand are observed by the allocator (add_task and load_tasks_from_file do this).
+    Batch or parallel creators can reserve a whole block of IDs with one call. IDs handed out by the allocator
+    are tracked until they are claimed, so a task with such an ID is added without scanning the task list either.
+    Optionally, IDs of removed tasks are kept in a free-list and handed out again before the sequence continues.
+    """
+
+    def __init__(self, high_water_mark=0, reuse_ids=False):
+        """
+        Parameters:
+        high_water_mark (int): The highest ID which is already used.
+        reuse_ids (bool): Hand out released IDs again (smallest first) before new ones.
+        """
+        self.high_water_mark = high_water_mark
+        self.reuse_ids = reuse_ids
+        self.free_ids = []
+        # IDs handed out by allocate_id or reserve_block which are not claimed, observed or released yet
+        self.issued_ids = set()
+        self.lock = threading.Lock()
+
+    def allocate_id(self):
+        """
+        Returns a new unique task ID.
+
+        Returns:
+        int: The allocated task ID.
+        """
+        with self.lock:
+            if self.free_ids:
+                task_id = heapq.heappop(self.free_ids)
+            else:
+                self.high_water_mark += 1
+                task_id = self.high_water_mark
+
+            self.issued_ids.add(task_id)
+            return task_id
+
+    def reserve_block(self, size):
+        """
+        Reserves a block of consecutive task IDs, e.g. for a batch or a parallel creator.
+
+        Parameters:
+        size (int): Number of IDs to be reserved.
+
+        Returns:
+        range: The reserved task IDs.
+        """
+        with self.lock:
+            first_id = self.high_water_mark + 1
+            self.high_water_mark += size
+            self.issued_ids.update(range(first_id, first_id + size))
+
+        return range(first_id, first_id + size)
+
+    def claim_id(self, task_id):
+        """
+        Claims an ID which was handed out by the allocator, so the task using it needs no uniqueness check.
+        An ID can be claimed only once.
+
+        Parameters:
+        task_id (int): ID of the task to be added.
+
+        Returns:
+        bool: True if the ID was handed out by the allocator and not used yet, False otherwise.
+        """
+        with self.lock:
+            if task_id in self.issued_ids:
+                self.issued_ids.remove(task_id)
+                return True
+
+            return False
+
+    def observe_id(self, task_id):
+        """
+        Moves the high-water mark past an ID which was assigned outside of the allocator.
+
+        Parameters:
+        task_id (int): A used task ID.
+
+        Returns:
+        None
+        """
+        with self.lock:
+            # An issued ID entered by hand is used now, so claiming it later must scan the task list
+            self.issued_ids.discard(task_id)
+
+            if task_id > self.high_water_mark:
+                self.high_water_mark = task_id
+            elif task_id in self.free_ids:
+                # A released ID was entered by hand, so it must not be handed out again
+                self.free_ids.remove(task_id)
+                heapq.heapify(self.free_ids)
+
+    def release_id(self, task_id):
+        """
+        Returns the ID of a removed task to the free-list, if ID reuse is enabled.
+
+        Parameters:
+        task_id (int): ID of the removed task.
+
+        Returns:
+        None
+        """
+        with self.lock:
+            self.issued_ids.discard(task_id)
+
+            if self.reuse_ids and task_id <= self.high_water_mark:
+                heapq.heappush(self.free_ids, task_id)
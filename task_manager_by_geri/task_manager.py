@@ -1,50 +1,158 @@
 import json
 import datetime
 import os
+import sys
+import gzip
+import bz2
+import lzma
 
 from input_validations import *
+from instrumentation import *
+from task_renderer import *
+from task_id_allocator import TaskIdAllocator
+from query_cache import TaskQueryCache
+from task_store import TaskStore
+from task_archive import TaskArchive
 
 TASK_NOT_FOUND_MESSAGE = "Task is not found."
+# Path of an existing archive which is opened at startup, so tasks archived in earlier sessions are found
+ARCHIVE_FILE_ENV_VARIABLE = "TASK_MANAGER_ARCHIVE_FILE"
 TASKS_NOT_FOUND = "No tasks were found."
 
+# Public task functions which are instrumented when TASK_MANAGER_INSTRUMENTATION is set
+TASK_FUNCTIONS = (
+    "add_task", "remove_task", "update_task", "get_task",
+    "set_task_priority", "set_task_deadline", "mark_task_as_completed", "set_task_description",
+    "search_tasks_by_keyword", "filter_tasks_by_priority", "filter_tasks_by_status", "filter_tasks_by_deadline",
+    "count_tasks", "count_completed_tasks", "count_pending_tasks", "generate_task_summary",
+    "save_tasks_to_file", "load_tasks_from_file", "sort_tasks_by_deadline", "sort_tasks_by_priority",
+    "archive_completed_tasks"
+)
 
-def add_task(tasks_lst, task_to_add):
+# Task fields, passed to the task listeners when a whole task is added or removed
+TASK_FIELDS = ("id", "description", "priority", "deadline", "completed")
+
+# Key of the optional first snapshot line with metadata (e.g. the task ID high-water mark)
+SNAPSHOT_METADATA_KEY = "_snapshot"
+
+# Functions called as listener(event, task, changed_fields) after a task is added, removed or updated
+task_listeners = []
+
+# Compression codec -> (module, file extension, magic bytes at the start of the file)
+COMPRESSION_FORMATS = {
+    "gzip": (gzip, ".gz", b"\x1f\x8b"),
+    "bz2": (bz2, ".bz2", b"BZh"),
+    "lzma": (lzma, ".xz", b"\xfd7zXZ\x00"),
+}
+
+
+def register_task_listener(listener):
+    """
+    Registers a function which is called after a task is added, removed or updated.
+
+    Parameters:
+    listener (function): Called as listener(event, task, changed_fields), where event is 'added', 'removed'
+        or 'updated' and changed_fields is a tuple with the names of the changed task fields.
+
+    Returns:
+    None
+    """
+    if listener not in task_listeners:
+        task_listeners.append(listener)
+
+
+def unregister_task_listener(listener):
+    """
+    Removes a registered task listener.
+
+    Parameters:
+    listener (function): The listener to be removed.
+
+    Returns:
+    None
+    """
+    if listener in task_listeners:
+        task_listeners.remove(listener)
+
+
+def notify_task_listeners(event, task, changed_fields):
+    """
+    Calls all registered task listeners.
+
+    Parameters:
+    event (str): 'added', 'removed' or 'updated'.
+    task (dict): The changed task.
+    changed_fields (tuple of str): Names of the changed task fields.
+
+    Returns:
+    None
+    """
+    for listener in task_listeners:
+        listener(event, task, changed_fields)
+
+
+def add_task(tasks_lst, task_to_add, id_allocator=None):
     """
     Adds a new task to the task list.
 
     Parameters:
     tasks_lst (list of dict): List with tasks.
     task_to_add (dict): New task to be added to the list.
+    id_allocator (TaskIdAllocator): Optional allocator. If the task ID is empty, the next ID is assigned
+        by the allocator. The list is not scanned for a duplicate ID if the ID was handed out by the allocator.
 
     Returns:
     list of dict: Updated list of tasks.
     int: Result code (0 for success).
     str: Descriptive error code message.
     """
-    task_to_add, code, message = validate_task_input(task_to_add)
+    task_id = task_to_add.get("id")
+    # Only a missing or empty ID is allocated. An explicit ID such as 0 is validated like any other ID
+    id_is_allocated = id_allocator is not None and (task_id is None or str(task_id).strip() == "")
+
+    if id_is_allocated:
+        task_to_add["id"] = id_allocator.allocate_id()
+        id_allocator.claim_id(task_to_add["id"])
+
+    try:
+        task_to_add, code, message = validate_task_input(task_to_add)
+    except (TypeError, AttributeError, ValueError):
+        # Fields with a wrong type (e.g. from a batch operation) must not use up the allocated ID
+        if id_is_allocated:
+            id_allocator.release_id(task_to_add["id"])
+        raise
 
     if code != 0:
+        if id_is_allocated:
+            id_allocator.release_id(task_to_add["id"])
         return tasks_lst, code, message
 
-    # If task input values are validated, check if task_to_add ID is unique
-    code, message = check_task_id_uniqueness(tasks_lst, task_to_add["id"])
+    # If task input values are validated, check if task_to_add ID is unique. IDs handed out by the allocator
+    # (allocated here or reserved by a batch creator) are always unique
+    if not id_is_allocated and not (id_allocator is not None and id_allocator.claim_id(task_to_add["id"])):
+        code, message = check_task_id_uniqueness(tasks_lst, task_to_add["id"])
 
-    if code != 0:
-        return tasks_lst, code, message
+        if code != 0:
+            return tasks_lst, code, message
+
+        if id_allocator is not None:
+            id_allocator.observe_id(task_to_add["id"])
 
     # If task_to_add id does not exist in the list, add the task to the list
     tasks_lst.append(task_to_add)
+    notify_task_listeners("added", task_to_add, TASK_FIELDS)
 
     return tasks_lst, 0, ""
 
 
-def remove_task(tasks_lst, task_id):
+def remove_task(tasks_lst, task_id, id_allocator=None):
     """
     Removes a task by its ID.
 
     Parameters:
-    tasks_lst (list of dict): The current list of tasks.
+    tasks_lst (list of dict or TaskStore): The current list of tasks. A TaskStore removes the task in O(1).
     task_id (int): The ID of the task to be removed.
+    id_allocator (TaskIdAllocator): Optional allocator which gets the ID back for reuse.
 
     Returns:
     list of dict: Updated list of tasks.
@@ -57,6 +165,10 @@ def remove_task(tasks_lst, task_id):
         return tasks_lst, code, message
 
     tasks_lst.remove(task)
+    notify_task_listeners("removed", task, TASK_FIELDS)
+
+    if id_allocator is not None:
+        id_allocator.release_id(task['id'])
 
     return tasks_lst, 0, ""
 
@@ -95,17 +207,19 @@ def update_task(tasks_lst, task_id, updated_task):
     task['description'] = updated_task.get('description')
     task['priority'] = updated_priority
     task['deadline'] = updated_deadline
+    notify_task_listeners("updated", task, ("description", "priority", "deadline"))
 
     return tasks_lst, 0, ""
 
 
-def get_task(tasks_lst, task_id):
+def get_task(tasks_lst, task_id, archive=None):
     """
     Retrieves a task by its ID.
 
     Parameters:
-    tasks_lst (list of dict): The current list of tasks.
+    tasks_lst (list of dict or TaskStore): The current list of tasks. A TaskStore is looked up without scanning.
     task_id (int): The ID of the task to be retrieved.
+    archive (TaskArchive): Optional archive which is searched if the task is not in the list.
 
     Returns:
     dict: The task with the specified ID, or empty dict if not found or ID is not validated.
@@ -117,12 +231,24 @@ def get_task(tasks_lst, task_id):
     if code != 0:
         return {}, code, message
 
-    for task in tasks_lst:
-        if task['id'] == validated_task_id:
+    if isinstance(tasks_lst, TaskStore):
+        task = tasks_lst.get_by_id(validated_task_id)
+
+        if task is not None:
             return task, 0, ""
-    # Task with validated input ID does not exist in the list
     else:
-        return {}, INVALID_TASK_ID_VALUE, TASK_NOT_FOUND_MESSAGE
+        for task in tasks_lst:
+            if task['id'] == validated_task_id:
+                return task, 0, ""
+
+    # Task with validated input ID does not exist in the list. Fall back to the archive, if any
+    if archive is not None:
+        archived_task = archive.get_task(validated_task_id)
+
+        if archived_task is not None:
+            return archived_task, 0, ""
+
+    return {}, INVALID_TASK_ID_VALUE, TASK_NOT_FOUND_MESSAGE
 
 
 def set_task_priority(tasks_lst, task_id, new_priority):
@@ -154,6 +280,7 @@ def set_task_priority(tasks_lst, task_id, new_priority):
 
     # Update the task priority after input validation
     task['priority'] = updated_priority
+    notify_task_listeners("updated", task, ("priority",))
 
     return tasks_lst, 0, ""
 
@@ -187,6 +314,7 @@ def set_task_deadline(tasks_lst, task_id, new_deadline):
 
     # Task ID and deadline is validated and task is found. Update the task deadline
     task['deadline'] = validated_deadline
+    notify_task_listeners("updated", task, ("deadline",))
 
     return tasks_lst, 0, ""
 
@@ -214,6 +342,8 @@ def mark_task_as_completed(tasks_lst, task_id):
 
     # Task ID is validated and task is found. Mark task as completed
     task['completed'] = True
+    task['completed_on'] = datetime.date.today().isoformat()
+    notify_task_listeners("updated", task, ("completed", "completed_on"))
 
     return tasks_lst, 0, ""
 
@@ -242,17 +372,19 @@ def set_task_description(tasks_lst, task_id, new_description):
 
     # Task ID is validated and task is found. Update the task description
     task['description'] = new_description
+    notify_task_listeners("updated", task, ("description",))
 
     return tasks_lst, 0, ""
 
 
-def search_tasks_by_keyword(tasks_lst, keyword):
+def search_tasks_by_keyword(tasks_lst, keyword, archive=None):
     """
     Searches tasks by a keyword in the description.
 
     Parameters:
     tasks_lst (list of dict): The current list of tasks.
     keyword (str): The keyword to search for.
+    archive (TaskArchive): Optional archive whose tasks are searched as well.
 
     Returns:
     list of dict: Tasks that contain the keyword in their description.
@@ -265,6 +397,9 @@ def search_tasks_by_keyword(tasks_lst, keyword):
         if keyword in task['description']:
             found_tasks_lst.append(task)
 
+    if archive is not None:
+        found_tasks_lst.extend(archive.search_tasks_by_keyword(keyword))
+
     return found_tasks_lst
 
 
@@ -400,57 +535,138 @@ def generate_task_summary(tasks_lst):
     return str(generated_summary)
 
 
-def save_tasks_to_file(tasks_lst, filepath):
+def open_tasks_file(filename_with_path, mode, compression="none", compression_level=None):
+    """
+    Opens a tasks file in text mode, optionally through a streaming compression codec.
+
+    Parameters:
+    filename_with_path (str): The file name including the path to the file.
+    mode (str): 'r' for reading or 'w' for writing.
+    compression (str): Compression codec (none, gzip, bz2 or lzma).
+    compression_level (int): Compression level between 1 and 9, or None for the codec default.
+
+    Returns:
+    file object: The opened text stream.
+    """
+    if compression == "none":
+        return open(filename_with_path, mode=mode, encoding='utf-8')
+
+    codec_module = COMPRESSION_FORMATS[compression][0]
+
+    if mode == 'r' or compression_level is None:
+        return codec_module.open(filename_with_path, mode=mode + 't', encoding='utf-8')
+
+    if compression == "lzma":
+        return lzma.open(filename_with_path, mode=mode + 't', encoding='utf-8', preset=compression_level)
+
+    return codec_module.open(filename_with_path, mode=mode + 't', encoding='utf-8', compresslevel=compression_level)
+
+
+def detect_tasks_file_compression(file_path):
+    """
+    Detects the compression codec of a tasks file by its leading magic bytes.
+
+    Parameters:
+    file_path (str): The file name including the path to the file.
+
+    Returns:
+    str: Compression codec (none, gzip, bz2 or lzma).
+    """
+    with open(file_path, mode='rb') as current_file:
+        file_header = current_file.read(6)
+
+    for compression, (codec_module, extension, magic_bytes) in COMPRESSION_FORMATS.items():
+        if file_header.startswith(magic_bytes):
+            return compression
+
+    return "none"
+
+
+def save_tasks_to_file(tasks_lst, filepath, compression="none", compression_level=None, id_allocator=None):
     """
     Saves the task list to a file.
 
     Parameters:
     tasks_lst (list of dict): The current list of tasks.
     filepath (str): The path to the file where tasks will be saved. Filename will consist of file creation timestamp.
+    compression (str): Compression codec (none, gzip, bz2 or lzma). The codec extension is added to the filename.
+    compression_level (int): Compression level between 1 and 9, or None for the codec default.
+    id_allocator (TaskIdAllocator): Optional allocator whose high-water mark is saved in the first line.
 
     Returns:
-    None
+    str: The file name including the path to the saved file.
     """
-    if filepath[-1] == '\\':
-        filename_with_path = filepath + str(datetime.datetime.now().timestamp()) + '.txt'
-    else:
-        filename_with_path = filepath + '\\' + str(datetime.datetime.now().timestamp()) + '.txt'
+    # os.path.join adds the separator of the platform, unless the path already ends with one
+    filename_with_path = os.path.join(filepath, str(datetime.datetime.now().timestamp()) + '.txt')
 
-    current_writing_file = open(filename_with_path, mode='w', encoding='utf-8')
+    if compression != "none":
+        filename_with_path += COMPRESSION_FORMATS[compression][1]
 
-    for task in tasks_lst:
-        json.dump(task, current_writing_file)
-        current_writing_file.write('\n')
+    # Tasks are written one line at a time, so the compressor works as a stream
+    with open_tasks_file(filename_with_path, 'w', compression, compression_level) as current_writing_file:
+        if id_allocator is not None:
+            json.dump({SNAPSHOT_METADATA_KEY: {"high_water_mark": id_allocator.high_water_mark}}, current_writing_file)
+            current_writing_file.write('\n')
+
+        for task in tasks_lst:
+            current_writing_file.write(json.dumps(task))
+            current_writing_file.write('\n')
 
-    current_writing_file.close()
+    return filename_with_path
 
 
-def load_tasks_from_file(file_path):
+def load_tasks_from_file(file_path, id_allocator=None):
     """
-    Loads the task list from a file.
+    Loads the task list from a file. Compressed files (gzip, bz2, lzma) are detected automatically.
+    Tasks with an ID which is already loaded are reported and skipped.
 
     Parameters:
     file_path (str): The file name including the path to the file where tasks are saved.
+    id_allocator (TaskIdAllocator): Optional allocator which restores the saved high-water mark
+        and observes the IDs of the loaded tasks.
 
     Returns:
     list of dict: The loaded list of tasks.
     """
     loaded_tasks = []
-    current_reading_file = open(file_path, mode='r', encoding='utf-8')
+    loaded_ids = set()
+    compression = detect_tasks_file_compression(file_path)
 
-    for line in current_reading_file.readlines():
+    with open_tasks_file(file_path, 'r', compression) as current_reading_file:
+        for line in current_reading_file:
 
-        loaded_task = json.loads(str(line), object_hook=dict)
-        loaded_task, code, message = validate_task_input(loaded_task)
+            loaded_task = json.loads(str(line), object_hook=dict)
 
-        if code == 0:
-            loaded_tasks.append(loaded_task)
-        else:
-            print(f"Could not load {loaded_task} -  {message}")
-            current_reading_file.close()
-            loaded_tasks = []
-            break
-    current_reading_file.close()
+            if SNAPSHOT_METADATA_KEY in loaded_task:
+                snapshot_metadata = loaded_task[SNAPSHOT_METADATA_KEY]
+                # Damaged metadata (not an object, or a high-water mark which is not an integer) is ignored
+                high_water_mark = 0
+
+                if isinstance(snapshot_metadata, dict):
+                    high_water_mark = snapshot_metadata.get("high_water_mark", 0)
+
+
+                if id_allocator is not None and type(high_water_mark) is int:
+                    id_allocator.observe_id(high_water_mark)
+                continue
+
+            loaded_task, code, message = validate_task_input(loaded_task)
+
+            # The first task with an ID is kept, like get_task finds it in a plain list
+            if code == 0 and loaded_task["id"] in loaded_ids:
+                print(f"Could not load {loaded_task} -  {TASK_ID_ALREADY_EXISTS_MESSAGE}")
+                continue
+
+            if code == 0:
+                loaded_tasks.append(loaded_task)
+                loaded_ids.add(loaded_task["id"])
+
+                if id_allocator is not None:
+                    id_allocator.observe_id(loaded_task["id"])
+            else:
+                print(f"Could not load {loaded_task} -  {message}")
+                loaded_tasks = []
+                break
 
     return loaded_tasks
 
@@ -487,6 +703,62 @@ def sort_tasks_by_priority(tasks_lst):
     return sorted_by_priority_tasks
 
 
+def parse_task_date(task_date):
+    """
+    Converts a validated task date to a date. Dates are valid without zero padding (e.g. 2020-9-1),
+    so they cannot be compared as strings.
+
+    Parameters:
+    task_date (str): Validated date (YYYY-MM-DD).
+
+    Returns:
+    datetime.date: The parsed date.
+    """
+    year, month, day = map(int, task_date.split("-"))
+    return datetime.date(year, month, day)
+
+
+def archive_completed_tasks(tasks_lst, archive, older_than_days, today=None):
+    """
+    Moves tasks completed more than the given number of days ago to the archive.
+    Tasks completed before the completion date was recorded are archived by their deadline.
+
+    Parameters:
+    tasks_lst (list of dict or TaskStore): The current list of tasks.
+    archive (TaskArchive): The archive the tasks are moved to.
+    older_than_days (str): Minimum number of days since the task was completed.
+    today (datetime.date): The current date. Defaults to today.
+
+    Returns:
+    list of dict: Updated list of tasks.
+    int: Number of archived tasks.
+    int: Result code (0 for success).
+    str: Descriptive error code message.
+    """
+    days, code, message = validate_archive_days(older_than_days)
+
+    if code != 0:
+        return tasks_lst, 0, code, message
+
+    cutoff_date = (today or datetime.date.today()) - datetime.timedelta(days=days)
+    tasks_to_archive = [task for task in tasks_lst if task['completed']
+                        and parse_task_date(task.get('completed_on', task['deadline'])) < cutoff_date]
+
+    archive.append_tasks(tasks_to_archive)
+
+    if isinstance(tasks_lst, TaskStore):
+        for task in tasks_to_archive:
+            tasks_lst.remove(task)
+    else:
+        archived_ids = {task['id'] for task in tasks_to_archive}
+        tasks_lst[:] = [task for task in tasks_lst if task['id'] not in archived_ids]
+
+    for task in tasks_to_archive:
+        notify_task_listeners("removed", task, TASK_FIELDS)
+
+    return tasks_lst, len(tasks_to_archive), 0, ""
+
+
 def print_menu():
     """
     Prints the user menu.
@@ -513,13 +785,60 @@ def print_menu():
     18. Load Tasks from File
     19. Sort Tasks by Deadline
     20. Sort Tasks by Priority
+    22. Archive Completed Tasks
     21. Exit
     """
     print(menu)
 
 
+def print_instrumentation_report():
+    """
+    Prints the instrumentation report and writes the Prometheus metrics to the file
+    from the TASK_MANAGER_METRICS_FILE environment variable, if it is set.
+    """
+    print(generate_metrics_report())
+
+    metrics_file_path = os.environ.get(METRICS_FILE_ENV_VARIABLE)
+
+    if metrics_file_path:
+        with open(metrics_file_path, mode='w', encoding='utf-8') as metrics_file:
+            metrics_file.write(export_prometheus_metrics())
+
+
+def show_tasks(tasks_to_show):
+    """
+    Prompts for the columns to be shown and displays the tasks page by page.
+
+    Parameters:
+    tasks_to_show (list of dict): Tasks to be displayed.
+
+    Returns:
+    None
+    """
+    columns, code, message = validate_columns(
+        input("Enter columns to show (id, description, priority, deadline, completed; leave empty for all): "))
+
+    if code != 0:
+        print(message)
+        return
+
+    shown_count, cancelled = render_tasks(tasks_to_show, columns)
+
+    if cancelled:
+        print(f"Listing stopped after {shown_count} of {len(tasks_to_show)} tasks.")
+
+
 def main():
-    tasks = []
+    tasks = TaskStore()
+    id_allocator = TaskIdAllocator()
+    query_cache = TaskQueryCache()
+    archive_path = os.environ.get(ARCHIVE_FILE_ENV_VARIABLE)
+    archive = TaskArchive(archive_path) if archive_path and os.path.isfile(archive_path) else None
+    register_task_listener(query_cache.handle_task_event)
+    instrumentation_enabled = bool(os.environ.get(INSTRUMENTATION_ENV_VARIABLE))
+
+    if instrumentation_enabled:
+        install_instrumentation(globals(), TASK_FUNCTIONS)
 
     while True:
         # [print(f"{task}") for task in tasks]
@@ -527,25 +846,25 @@ def main():
         choice = input("Enter your choice: ")
         if choice == '1':
             input_task = {
-                          'id': input("Enter task ID: "),
+                          'id': input("Enter task ID (leave empty to assign the next free ID): "),
                           'description': input("Enter task description: "),
                           'priority': input("Enter task priority (low, medium, high): "),
                           'deadline': input("Enter task deadline (YYYY-MM-DD): "),
                           'completed': False
             }
 
-            tasks, code, message = add_task(tasks, input_task)
+            tasks, code, message = add_task(tasks, input_task, id_allocator)
 
             if code != 0:
                 print(message)
                 continue
 
-            print("Task added successfully.")
+            print(f"Task with ID {input_task['id']} added successfully.")
 
         elif choice == '2':
             input_task_id = input("Enter task ID to remove: ")
 
-            tasks, code, message = remove_task(tasks, input_task_id)
+            tasks, code, message = remove_task(tasks, input_task_id, id_allocator)
 
             if code != 0:
                 print(message)
@@ -573,7 +892,7 @@ def main():
         elif choice == '4':
             input_task_id = input("Enter task ID to get: ")
 
-            task, code, message = get_task(tasks, input_task_id)
+            task, code, message = get_task(tasks, input_task_id, archive)
 
             if code != 0:
                 print(message)
@@ -631,26 +950,30 @@ def main():
         elif choice == '9':
             keyword = input("Enter keyword to search: ")
 
-            found_tasks = search_tasks_by_keyword(tasks, keyword)
+            # Archiving removes tasks, which invalidates the cached searches, so archived tasks are never missing
+            found_tasks = query_cache.query(search_tasks_by_keyword, tasks, keyword, archive)
+
             count_of_found_tasks = len(found_tasks)
 
             if count_of_found_tasks == 0:
                 print(TASKS_NOT_FOUND)
             else:
-                print("Tasks found:", found_tasks)
+                print("Tasks found:")
+                show_tasks(found_tasks)
                 print(f"\nTotal count: {count_of_found_tasks}")
 
         elif choice == '10':
             priority = input("Enter priority to filter by (low, medium, high): ")
 
-            filtered_tasks, code, message = filter_tasks_by_priority(tasks, priority)
+            filtered_tasks, code, message = query_cache.query(filter_tasks_by_priority, tasks, priority)
 
             if code != 0:
                 print(message)
                 continue
 
             if len(filtered_tasks) > 0:
-                print("Filtered tasks:", filtered_tasks)
+                print("Filtered tasks:")
+                show_tasks(filtered_tasks)
             else:
                 print(f"There are no tasks with {priority} priority.")
 
@@ -658,10 +981,11 @@ def main():
             # invalid input is False !!!
             status = input("Enter status to filter by (completed/pending): ").lower() == 'completed'
 
-            filtered_tasks = filter_tasks_by_status(tasks, status)
+            filtered_tasks = query_cache.query(filter_tasks_by_status, tasks, status)
 
             if len(filtered_tasks) > 0:
-                print("Filtered tasks:\n", filtered_tasks)
+                print("Filtered tasks:")
+                show_tasks(filtered_tasks)
             else:
                 if status:
                     print("There are no tasks with 'completed' status.")
@@ -672,14 +996,15 @@ def main():
 
             deadline = input("Enter deadline to filter by (YYYY-MM-DD): ")
 
-            filtered_tasks, code, message = filter_tasks_by_deadline(tasks, deadline)
+            filtered_tasks, code, message = query_cache.query(filter_tasks_by_deadline, tasks, deadline)
 
             if code != 0:
                 print(message)
                 continue
 
             if len(filtered_tasks) > 0:
-                print("Filtered tasks:\n", filtered_tasks)
+                print("Filtered tasks:")
+                show_tasks(filtered_tasks)
             else:
                 print(f"There are no tasks with deadline {deadline}.")
 
@@ -707,18 +1032,27 @@ def main():
 
             file_path = input("Enter file path to save tasks: ")
 
-            if os.path.exists(file_path):
-                save_tasks_to_file(tasks, file_path)
-                print(f"Tasks saved to file.")
-            else:
+            if not os.path.exists(file_path):
                 print("Path does not exist. Try again.")
+                continue
+
+            compression, compression_level, code, message = validate_compression(
+                input("Enter compression (none, gzip, bz2, lzma; leave empty for none): "),
+                input("Enter compression level 1-9 (leave empty for default): "))
+
+            if code != 0:
+                print(message)
+                continue
+
+            save_tasks_to_file(tasks, file_path, compression, compression_level, id_allocator)
+            print(f"Tasks saved to file.")
 
         elif choice == '18':
 
             file_path = input("Enter file path to load tasks from: ")
 
             if os.path.isfile(file_path):
-                tasks = load_tasks_from_file(file_path)
+                tasks = TaskStore(load_tasks_from_file(file_path, id_allocator))
                 if len(tasks) > 0:
                     print("Tasks loaded from file.")
             else:
@@ -726,18 +1060,47 @@ def main():
 
         elif choice == '19':
 
-            tasks = sort_tasks_by_deadline(tasks)
+            # Sorts are not cached: the sorted tasks become a new store, so the cache key would never match again
+            tasks = TaskStore(sort_tasks_by_deadline(tasks))
 
             print("Tasks sorted by deadline.")
 
         elif choice == '20':
 
-            tasks = sort_tasks_by_priority(tasks)
+            tasks = TaskStore(sort_tasks_by_priority(tasks))
 
-            [print(f"{task}") for task in tasks]
+            show_tasks(tasks)
             print("Tasks sorted by priority.")
 
+        elif choice == '22':
+
+            archive_path = input("Enter archive file path (leave empty to use the open archive): ")
+
+            if archive_path.strip() == "" and archive is not None:
+                archive_path = archive.archive_path
+
+            if archive_path.strip() == "" or not os.path.isdir(os.path.dirname(archive_path) or "."):
+                print("Path does not exist. Try again.")
+                continue
+
+            older_than_days = input("Archive tasks completed more than how many days ago: ")
+
+            archive = TaskArchive(archive_path)
+            tasks, archived_count, code, message = archive_completed_tasks(tasks, archive, older_than_days)
+
+            if code != 0:
+                print(message)
+                continue
+
+            print(f"{archived_count} tasks archived.")
+
         elif choice == '21':
+            if instrumentation_enabled:
+                print_instrumentation_report()
+                print("Query cache:", query_cache.get_statistics())
+
+            unregister_task_listener(query_cache.handle_task_event)
+
             print("Exiting...")
             break
 
@@ -746,4 +1109,9 @@ def main():
 
 
 if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        # Non-interactive batch mode, e.g. task_manager.py run ops.jsonl
+        from batch_mode import run_from_command_line
+        sys.exit(run_from_command_line(sys.argv[1:]))
+
     main()
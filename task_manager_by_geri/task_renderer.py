@@ -0,0 +1,120 @@
+import sys
+
+TASK_COLUMNS = ("id", "description", "priority", "deadline", "completed")
+COLUMN_WIDTHS = {"id": 8, "description": 40, "priority": 8, "deadline": 10, "completed": 9}
+DEFAULT_PAGE_SIZE = 20
+INVALID_COLUMNS = -1
+INVALID_COLUMNS_MESSAGE = "Columns must be a comma-separated list of: id, description, priority, deadline, completed."
+
+
+def validate_columns(columns_input):
+    """
+    Validates the columns selected for displaying tasks.
+
+    Parameters:
+    columns_input (str): Comma-separated column names. Empty value selects all columns.
+
+    Returns:
+    tuple of str: Validated column names.
+    int: Result code (0 for success).
+    str: Descriptive error code message.
+    """
+    if columns_input.strip() == "":
+        return TASK_COLUMNS, 0, ""
+
+    columns = tuple(column.strip().lower() for column in columns_input.split(","))
+
+    for column in columns:
+        if column not in TASK_COLUMNS:
+            return columns, INVALID_COLUMNS, INVALID_COLUMNS_MESSAGE
+
+    return columns, 0, ""
+
+
+def format_task_row(task, columns):
+    """
+    Formats a task as a table row.
+
+    Parameters:
+    task (dict): The task to be formatted.
+    columns (tuple of str): Columns to be shown.
+
+    Returns:
+    str: The formatted row, including the line ending.
+    """
+    cells = []
+
+    for column in columns:
+        cell = str(task.get(column, ""))
+        width = COLUMN_WIDTHS[column]
+
+        if len(cell) > width:
+            cell = cell[:width - 3] + "..."
+
+        cells.append(cell.ljust(width))
+
+    return " | ".join(cells).rstrip() + "\n"
+
+
+def iter_task_rows(tasks, columns=TASK_COLUMNS):
+    """
+    Generates formatted rows of tasks, one row at a time.
+
+    Parameters:
+    tasks (iterable of dict): Tasks to be formatted.
+    columns (tuple of str): Columns to be shown.
+
+    Returns:
+    generator of str: Formatted rows.
+    """
+    for task in tasks:
+        yield format_task_row(task, columns)
+
+
+def render_tasks(tasks, columns=TASK_COLUMNS, page_size=DEFAULT_PAGE_SIZE, output=None, prompt=input):
+    """
+    Writes tasks as a table, page by page. Rows are formatted only when their page is shown, so cancelling
+    the listing does not format the remaining tasks.
+
+    Parameters:
+    tasks (iterable of dict): Tasks to be shown.
+    columns (tuple of str): Columns to be shown.
+    page_size (int): Number of rows per page. 0 writes all rows without pausing.
+    output (file object): Stream the rows are written to. Defaults to sys.stdout.
+    prompt (function): Function asking the user whether to continue after each page.
+
+    Returns:
+    int: Number of shown tasks.
+    bool: True if the user cancelled the listing.
+    """
+    output = output or sys.stdout
+    total_count = len(tasks) if hasattr(tasks, "__len__") else None
+    # Without paging the rows are still written in chunks, so that output is not flushed row by row
+    chunk_size = page_size or DEFAULT_PAGE_SIZE * 50
+    shown_count = 0
+    page_rows = []
+
+    output.write(" | ".join(column.ljust(COLUMN_WIDTHS[column]) for column in columns).rstrip() + "\n")
+
+    for row in iter_task_rows(tasks, columns):
+        page_rows.append(row)
+        shown_count += 1
+
+        if len(page_rows) < chunk_size:
+            continue
+
+        output.write("".join(page_rows))
+        output.flush()
+        page_rows.clear()
+
+        if page_size and shown_count != total_count:
+            of_total = f" of {total_count}" if total_count is not None else ""
+            answer = prompt(f"-- {shown_count}{of_total} tasks shown. Press Enter for more or q to stop: ")
+
+            if answer.strip().lower() == "q":
+                return shown_count, True
+
+    output.write("".join(page_rows))
+    output.flush()
+
+    return shown_count, False
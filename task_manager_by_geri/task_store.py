@@ -0,0 +1,100 @@
+class TaskStore:
+    """
+    Array-backed task list with O(1) lookup and removal by task ID.
+
+    Removed tasks leave a tombstone (None) in their slot instead of shifting the following tasks, and iteration
+    skips the tombstones. Once tombstones are more than compaction_ratio of the slots, the slots are compacted
+    in one pass, so removals cost O(1) amortized. The store can be used wherever the task functions expect
+    a list of tasks: it supports iteration, len(), append() and remove().
+    """
+
+    def __init__(self, tasks=(), compaction_ratio=0.5, minimum_compaction_size=1024):
+        """
+        Parameters:
+        tasks (iterable of dict): Initial tasks with validated, unique IDs.
+        compaction_ratio (float): Tombstone ratio above which the slots are compacted.
+        minimum_compaction_size (int): Small stores are not compacted until they have this many slots.
+        """
+        self.compaction_ratio = compaction_ratio
+        self.minimum_compaction_size = minimum_compaction_size
+        self.slots = []
+        # Task ID -> index of the task slot
+        self.slot_by_id = {}
+        self.tombstone_count = 0
+
+        for task in tasks:
+            self.append(task)
+
+    def __iter__(self):
+        for task in self.slots:
+            if task is not None:
+                yield task
+
+    def __len__(self):
+        return len(self.slots) - self.tombstone_count
+
+    def __contains__(self, task):
+        return self.get_by_id(task['id']) is task
+
+    def append(self, task):
+        """
+        Adds a task at the end of the store.
+
+        Parameters:
+        task (dict): Task with a validated ID which is not in the store yet.
+
+        Returns:
+        None
+        """
+        if task['id'] in self.slot_by_id:
+            raise ValueError(f"TaskStore.append(task): task ID {task['id']} is already in the store")
+
+        self.slot_by_id[task['id']] = len(self.slots)
+        self.slots.append(task)
+
+    def remove(self, task):
+        """
+        Removes a task by replacing it with a tombstone.
+
+        Parameters:
+        task (dict): The task to be removed.
+
+        Returns:
+        None
+        """
+        slot = self.slot_by_id.pop(task['id'], None)
+
+        if slot is None:
+            raise ValueError("TaskStore.remove(task): task is not in the store")
+
+        self.slots[slot] = None
+        self.tombstone_count += 1
+
+        if len(self.slots) >= self.minimum_compaction_size \
+                and self.tombstone_count > self.compaction_ratio * len(self.slots):
+            self.compact()
+
+    def get_by_id(self, task_id):
+        """
+        Returns the task with the given ID.
+
+        Parameters:
+        task_id (int): Validated task ID.
+
+        Returns:
+        dict: The task, or None if no task has this ID.
+        """
+        slot = self.slot_by_id.get(task_id)
+
+        return None if slot is None else self.slots[slot]
+
+    def compact(self):
+        """
+        Removes all tombstones and reindexes the remaining tasks.
+
+        Returns:
+        None
+        """
+        self.slots = [task for task in self.slots if task is not None]
+        self.slot_by_id = {task['id']: slot for slot, task in enumerate(self.slots)}
+        self.tombstone_count = 0